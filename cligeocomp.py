@@ -5,6 +5,7 @@ import time
 import os.path
 import geocomp
 from geocomp import config
+from geocomp.common import rng
 from geocomp.gui import dummy
 
 def get_func (strTemp):
@@ -32,10 +33,22 @@ def get_func (strTemp):
 
 	return func
 
+# le os arquivos de entrada como PointArray (opcao -n)
+as_array = False
+# filtro aplicado a entrada antes de cada algoritmo cuja resposta so'
+# depende do fecho convexo (opcao -p)
+prefilter = None
+
+def open_file (filename):
+	return geocomp.open_file (filename, as_array)
+
 def run_alg (func, localInput):
-	init = time.clock ()
-	cont, extra = geocomp.run_algorithm (func, localInput)
-	end = time.clock ()
+	init = time.perf_counter ()
+	filtro = None
+	if prefilter is not None and geocomp.convexhull.so_fecho (func):
+		filtro = prefilter
+	cont, extra = geocomp.run_algorithm (func, localInput, filtro)
+	end = time.perf_counter ()
 
 	delta = end - init
 
@@ -45,7 +58,7 @@ def run_alg (func, localInput):
 def many_algs (strings):
 	filename = strings.pop (0)
 	print(filename, ':')
-	lInput = geocomp.open_file (filename)
+	lInput = open_file (filename)
 
 	for func_name in strings:
 		print(os.path.basename (func_name),':', end=' ')
@@ -60,15 +73,31 @@ def many_files (strings):
 
 	for filename in strings:
 		print(os.path.basename (filename),':', end=' ')
-		lInput = geocomp.open_file (filename)
+		lInput = open_file (filename)
 
 		run_alg (func, lInput)
 
 
 if __name__ == '__main__':
+	while len (sys.argv) > 1 and sys.argv[1] in ('-n', '-p', '-j', '-s'):
+		if sys.argv[1] == '-n':
+			as_array = True
+		elif sys.argv[1] == '-p':
+			prefilter = geocomp.convexhull.akl_toussaint
+		elif sys.argv[1] == '-s' and len (sys.argv) > 2:
+			rng.seed (int (sys.argv.pop (2)))
+		elif len (sys.argv) > 2:
+			config.WORKERS = max (int (sys.argv.pop (2)), 0)
+		sys.argv.pop (1)
+
 	if len (sys.argv) < 2:
-		print(sys.argv[0], '<algorithm> <file1> [file2]...')
-		print(sys.argv[0], '-a <file1> <algorithm1> [algorithm2]...')
+		print(sys.argv[0], '[-n] [-p] [-j N] [-s S] <algorithm> <file1> [file2]...')
+		print(sys.argv[0], '[-n] [-p] [-j N] [-s S] -a <file1> <algorithm1> [algorithm2]...')
+		print('  -n: le os pontos como PointArray (execucao sem desenho)')
+		print('  -p: elimina os pontos interiores ao octogono de Akl-Toussaint')
+		print('      (so nos algoritmos de fecho convexo e de par mais distante)')
+		print('  -j N: usa N processos nos algoritmos paralelos (0: um por processador)')
+		print('  -s S: usa a semente S nos algoritmos aleatorizados (execucoes reproduziveis)')
 		sys.exit (1)
 
 	geocomp.init_display (dummy, None)
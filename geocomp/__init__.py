@@ -16,6 +16,7 @@ from . import point_visibility
 from .common.guicontrol import init_display
 from .common.guicontrol import plot_input
 from .common.guicontrol import run_algorithm
+from .common.io import read as open_file
 from .common.prim import get_count
 from .common.prim import reset_count
 
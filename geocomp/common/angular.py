@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Ordenacao angular exata ao redor de um ponto (o pivo)
+
+Em vez de comparar dois pontos com area2 (ou com atan2) a cada
+comparacao da ordenacao, calcula-se uma chave por ponto, uma unica vez,
+e a ordenacao usa key= (comparacoes de tuplas, feitas em C).
+
+O angulo de p ao redor do pivo e' medido no sentido anti-horario a
+partir da semi-reta horizontal que sai do pivo para a direita, como em
+atan2, mas no intervalo [0, 2 pi). A chave de p e' o par (quadrante,
+inclinacao), onde a inclinacao e' uma razao entre dx = p.x - pivo.x e
+dy = p.y - pivo.y que cresce com o angulo dentro do quadrante:
+
+    quadrante 0:  dx > 0,  dy >= 0     inclinacao  dy / dx
+    quadrante 1:  dx <= 0, dy > 0      inclinacao -dx / dy
+    quadrante 2:  dx < 0,  dy <= 0     inclinacao  dy / dx
+    quadrante 3:  dx >= 0, dy < 0      inclinacao -dx / dy
+
+A ordenacao usa a inclinacao em ponto flutuante. Inclinacoes iguais
+ou muito proximas (diferenca relativa ate' TOLERANCE) sao comparadas de
+novo com a razao exata (Fraction) entre as diferencas das coordenadas,
+tomadas com o valor exato do float: 0.8 e' o numero binario mais
+proximo de 8/10, e nao 8/10. Assim, dois pontos tem o mesmo angulo se
+e so se sao de fato colineares com o pivo, e a ordem concorda com o
+sinal exato de area2 sobre as coordenadas guardadas (o decimal do
+arquivo de entrada nao e' mais conhecido depois da leitura).
+"""
+
+from fractions import Fraction
+
+# diferenca relativa maxima entre duas inclinacoes em ponto flutuante
+# para que elas sejam comparadas com a razao exata
+TOLERANCE = 1e-9
+
+
+def angle_key (pivot, p):
+    """Retorna a chave (quadrante, inclinacao) de p ao redor de pivot,
+    com a inclinacao em ponto flutuante
+
+    Pontos iguais ao pivo (que nao tem angulo) tem quadrante 4, e
+    portanto aparecem depois de todos os outros."""
+    dx = p.x - pivot.x
+    dy = p.y - pivot.y
+    if dx > 0 and dy >= 0:
+        return (0, dy / dx)
+    if dy > 0:
+        return (1, -dx / dy)
+    if dx < 0:
+        return (2, dy / dx)
+    if dy < 0:
+        return (3, -dx / dy)
+    return (4, 0.0)
+
+def exato (x):
+    "O valor exato de x (um float ou um inteiro), como Fraction"
+    return Fraction (x)
+
+def exact_angle_key (pivot, p):
+    "O mesmo que angle_key, mas com a inclinacao exata (Fraction)"
+    dx = exato (p.x) - exato (pivot.x)
+    dy = exato (p.y) - exato (pivot.y)
+    if dx > 0 and dy >= 0:
+        return (0, dy / dx)
+    if dy > 0:
+        return (1, -dx / dy)
+    if dx < 0:
+        return (2, dy / dx)
+    if dy < 0:
+        return (3, -dx / dy)
+    return (4, Fraction (0))
+
+def angle_ranks (pivot, points):
+    """Retorna uma lista r com um inteiro por ponto de points tal que
+    r[i] < r[j] se e so se o angulo de points[i] ao redor de pivot e'
+    menor que o de points[j] (e r[i] == r[j] se os angulos sao iguais)"""
+    keys = [angle_key (pivot, p) for p in points]
+    order = sorted (range (len (points)), key=keys.__getitem__)
+    ranks = [0] * len (points)
+    rank = -1
+    i = 0
+    while i < len (order):
+        j = i + 1
+        while j < len (order) and close (keys[order[j - 1]], keys[order[j]]):
+            j = j + 1
+        if j - i == 1:
+            rank = rank + 1
+            ranks[order[i]] = rank
+        else:
+            # chaves (quase) iguais: desempata com a razao exata
+            exact = {k: exact_angle_key (pivot, points[k]) for k in order[i:j]}
+            last = None
+            for k in sorted (order[i:j], key=exact.__getitem__):
+                if exact[k] != last:
+                    rank = rank + 1
+                    last = exact[k]
+                ranks[k] = rank
+        i = j
+    return ranks
+
+def close (k1, k2):
+    "Verdadeiro se as chaves k1 <= k2 podem ser iguais"
+    if k1 == k2:
+        return True
+    if k1[0] != k2[0]:
+        return False
+    return k2[1] - k1[1] <= TOLERANCE * abs (k2[1])
+
+def distance_key (pivot, p):
+    """Chave que ordena, pela distancia ao pivo, os pontos que estao
+    numa mesma semi-reta que sai do pivo (sem multiplicacoes)"""
+    return (abs (p.x - pivot.x), abs (p.y - pivot.y))
+
+def sort_around (pivot, points, farthest_first = False):
+    """Retorna uma nova lista com os pontos de points ordenados pelo
+    angulo ao redor de pivot
+
+    Pontos com o mesmo angulo aparecem do mais proximo ao mais
+    distante do pivo, ou ao contrario, se farthest_first for verdadeiro."""
+    ranks = angle_ranks (pivot, points)
+    sign = -1 if farthest_first else 1
+
+    def key (i):
+        dx, dy = distance_key (pivot, points[i])
+        return (ranks[i], sign * dx, sign * dy)
+
+    return [points[i] for i in sorted (range (len (points)), key=key)]
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""Binary, memory-mapped container for points, segments and polygons
+
+A binary file has the following layout (all numbers little-endian):
+
+    header:  magic b'GEOCOMPB' (8 bytes), version (uint16),
+             number of blocks (uint16), reserved (uint32)
+
+    offsets table: one entry per block, with
+             kind (uint16: 1 = points, 2 = segments, 3 = polygons),
+             reserved (uint16 + uint32), element count (uint64),
+             offset of the block from the beginning of the file (uint64)
+
+    blocks:  every block starts at an 8-byte aligned offset
+             points:   x column, y column (count float64 each)
+             segments: x0, y0, x1, y1 columns (count float64 each)
+             polygons: vertex offsets (count + 1 int64), followed by
+                       the x and y columns of all the vertices
+                       (offsets[-1] float64 each); polygon i has the
+                       vertices offsets[i] .. offsets[i+1] - 1
+
+The file is memory-mapped: points are returned as a PointArray whose
+columns point directly into the mapping, while segments and polygons
+are only turned into Segment/Polygon objects when they are accessed.
+Elements are grouped by kind, so the order in which points, segments
+and polygons were mixed in a text file is not preserved.
+
+Text files (see geocomp.common.io.read) can be converted with convert()
+or with the script utils/txt2bin.py.
+"""
+
+import struct
+from array import array
+
+from geocomp.common.point      import Point
+from geocomp.common.polygon    import Polygon
+from geocomp.common.segment    import Segment
+from geocomp.common.pointarray import PointArray, np
+
+
+MAGIC = b'GEOCOMPB'
+VERSION = 1
+
+POINTS = 1
+SEGMENTS = 2
+POLYGONS = 3
+
+_HEADER = struct.Struct('<8sHHI')
+_ENTRY = struct.Struct('<HHIQQ')
+
+
+def is_binary(filename):
+    """Returns True if 'filename' is a binary file in this format.
+
+    Raises the same exceptions as open() (TypeError, FileNotFoundError)
+    """
+    with open(filename, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+class SegmentBlock:
+    "Lazy sequence of the segments stored in a binary file"
+
+    def __init__(self, columns):
+        self.x0, self.y0, self.x1, self.y1 = columns
+
+    def __len__(self):
+        return len(self.x0)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("segment index out of range")
+        return Segment(Point(self.x0[i].item(), self.y0[i].item()),
+                       Point(self.x1[i].item(), self.y1[i].item()))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class PolygonBlock:
+    "Lazy sequence of the polygons stored in a binary file"
+
+    def __init__(self, offsets, x, y):
+        self.offsets = offsets
+        self.vertices = PointArray(x, y)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("polygon index out of range")
+        start = int(self.offsets[i])
+        end = int(self.offsets[i + 1])
+        return Polygon(self.vertices[start:end].to_points())
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class BinaryFile:
+    """A memory-mapped binary file
+
+    Attributes:
+        points:   (PointArray) all the points, backed by the mapping
+        segments: (SegmentBlock) the segments, created on access
+        polygons: (PolygonBlock) the polygons, created on access
+    """
+
+    def __init__(self, filename):
+        if np is None:
+            raise ImportError("Binary files require NumPy")
+        self.filename = filename
+        data = np.memmap(filename, dtype=np.uint8, mode='r')
+        if len(data) < _HEADER.size:
+            raise ValueError("Invalid binary file: {}: truncated header".format(filename))
+
+        magic, version, nblocks, _ = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Invalid binary file: {}: bad magic number".format(filename))
+        if version != VERSION:
+            raise ValueError(
+                "Invalid binary file: {}: unsupported version {}".format(filename, version))
+
+        empty = np.zeros(0, dtype=np.float64)
+        self.points = PointArray(empty, empty)
+        self.segments = SegmentBlock((empty,) * 4)
+        self.polygons = PolygonBlock(np.zeros(1, dtype=np.int64), empty, empty)
+
+        def column(dtype, offset, count):
+            end = offset + 8 * count
+            if end > len(data):
+                raise ValueError("Invalid binary file: {}: truncated block".format(filename))
+            return np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+
+        for k in range(nblocks):
+            entry = _HEADER.size + k * _ENTRY.size
+            if entry + _ENTRY.size > len(data):
+                raise ValueError("Invalid binary file: {}: truncated table".format(filename))
+            kind, _, _, count, offset = _ENTRY.unpack_from(data, entry)
+            if kind == POINTS:
+                self.points = PointArray(column('<f8', offset, count),
+                                         column('<f8', offset + 8 * count, count))
+            elif kind == SEGMENTS:
+                self.segments = SegmentBlock(
+                    [column('<f8', offset + 8 * count * c, count) for c in range(4)])
+            elif kind == POLYGONS:
+                offsets = column('<i8', offset, count + 1)
+                nverts = int(offsets[-1])
+                start = offset + 8 * (count + 1)
+                self.polygons = PolygonBlock(offsets,
+                                             column('<f8', start, nverts),
+                                             column('<f8', start + 8 * nverts, nverts))
+            else:
+                raise ValueError(
+                    "Invalid binary file: {}: unknown block kind {}".format(filename, kind))
+
+    def to_list(self):
+        """Returns all the elements as a list of Point, Segment and
+        Polygon objects (points first, then segments, then polygons)"""
+        return self.points.to_points() + list(self.segments) + list(self.polygons)
+
+
+def write(filename, points=None, segments=None, polygons=None):
+    """Writes a binary file.
+
+    :param points:   (PointArray) the points, or None
+    :param segments: (list) Segment objects, or a tuple of four
+                     coordinate columns (x0, y0, x1, y1), or None
+    :param polygons: (list) Polygon objects, or a tuple
+                     (offsets, x, y) as described in the module
+                     docstring, or None
+    """
+    blocks = []
+    if points is not None and len(points) > 0:
+        blocks.append((POINTS, len(points), [points.x, points.y]))
+    if segments is not None and not isinstance(segments, tuple):
+        segments = tuple(zip(*[(s.init.x, s.init.y, s.to.x, s.to.y) for s in segments]))
+    if segments and len(segments[0]) > 0:
+        blocks.append((SEGMENTS, len(segments[0]), list(segments)))
+    if polygons is not None and not isinstance(polygons, tuple):
+        offsets, xs, ys = [0], [], []
+        for polygon in polygons:
+            for p in polygon.vertices():
+                xs.append(p.x)
+                ys.append(p.y)
+            offsets.append(len(xs))
+        polygons = (offsets, xs, ys)
+    if polygons and len(polygons[0]) > 1:
+        offsets, xs, ys = polygons
+        blocks.append((POLYGONS, len(offsets) - 1,
+                       [np.asarray(offsets, dtype='<i8'), xs, ys]))
+
+    with open(filename, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(blocks), 0))
+        offset = _HEADER.size + len(blocks) * _ENTRY.size
+        for kind, count, columns in blocks:
+            file.write(_ENTRY.pack(kind, 0, 0, count, offset))
+            offset += 8 * sum(len(c) for c in columns)
+        for kind, count, columns in blocks:
+            for c in columns:
+                if not (isinstance(c, np.ndarray) and c.dtype == np.dtype('<i8')):
+                    c = np.asarray(c, dtype='<f8')
+                file.write(c.tobytes())
+
+
+def convert(text_filename, binary_filename):
+    """Converts a text file, in the format read by geocomp.common.io.read,
+    to a binary file.
+
+    The text file is parsed without creating Point objects, so files
+    larger than what fits in memory as a list of points can be
+    converted.
+
+    Raises:
+        ValueError: if some input from the text file does not follow
+                    the patterns required by geocomp.common.io.read
+    """
+    px, py = array('d'), array('d')
+    seg = tuple(array('d') for _ in range(4))
+    offsets, vx, vy = array('q', [0]), array('d'), array('d')
+    expecting_polygon = False
+    with open(text_filename) as file:
+        i = 0
+        for line in file:
+            i += 1
+            line = line.split()
+            if len(line) == 0 or line[0] == "#":
+                continue
+            if line[0] == "[":
+                expecting_polygon = True
+            elif line[0] == "]":
+                expecting_polygon = False
+                offsets.append(len(vx))
+            elif len(line) == 4:
+                for c in range(4):
+                    seg[c].append(float(line[c]))
+            elif len(line) == 2:
+                if expecting_polygon:
+                    vx.append(float(line[0]))
+                    vy.append(float(line[1]))
+                else:
+                    px.append(float(line[0]))
+                    py.append(float(line[1]))
+            else:
+                raise ValueError(
+                    "Invalid input from file: {}: line: {}: {}".format(text_filename, i, line))
+
+    write(binary_filename,
+          points=PointArray(np.frombuffer(px), np.frombuffer(py)),
+          segments=tuple(np.frombuffer(c) for c in seg),
+          polygons=(np.frombuffer(offsets, dtype=np.int64),
+                    np.frombuffer(vx), np.frombuffer(vy)))
+
@@ -12,6 +12,17 @@ dont_sleep = 0
 skip = 0
 gui = None
 
+# Identificadores dos desenhos associados a cada ponto (disco, destaque e
+# linhas ate outros pontos), indexados pelos id() dos objetos envolvidos.
+# Cada entrada guarda tambem os proprios objetos: enquanto ela existe,
+# eles nao sao liberados, e seus id() nao podem ser reaproveitados por
+# outro objeto. As tabelas so' sao preenchidas quando algo e' de fato
+# desenhado (uma execucao sem desenho nao aloca nada por ponto) e sao
+# esvaziadas quando a tela e' apagada (clear_ids).
+plot_ids = {}
+hilight_ids = {}
+lineto_ids = {}
+
 def freeze_update (amount = 1):
 	"""Impede a atualizacao da tela.
 
@@ -126,6 +137,33 @@ def plot_delete (id):
 	gui.plot_delete (id)
 	update ()
 
+def store_id (table, plot_id, *objs):
+	"""Guarda plot_id em table, associado aos objetos objs
+
+	Nada e' guardado se os desenhos estao desativados. Retorna plot_id"""
+	if not skip:
+		table[tuple (map (id, objs))] = (plot_id, objs)
+	return plot_id
+
+def pop_id (table, *objs, plot_id = None):
+	"""Remove e retorna o identificador associado aos objetos objs
+
+	Se plot_id for passado, ele so' e' removido de table se for o
+	identificador guardado, e plot_id e' retornado. Caso contrario,
+	retorna o identificador guardado (ou None, se nao houver nenhum)"""
+	key = tuple (map (id, objs))
+	if plot_id is None:
+		return table.pop (key, (None, None))[0]
+	if table.get (key, (None, None))[0] == plot_id:
+		del table[key]
+	return plot_id
+
+def clear_ids ():
+	"Esquece todos os identificadores guardados (a tela foi apagada)"
+	plot_ids.clear ()
+	hilight_ids.clear ()
+	lineto_ids.clear ()
+
 def set_gui (toolkit):
 	"Funcao interna, para configurar qual o toolkit usado"
 	global gui
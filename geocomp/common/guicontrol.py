@@ -7,10 +7,12 @@ gui = None
 
 from . import prim
 from . import control
+from . import headless
 
 from geocomp.common.point   import Point
 from geocomp.common.polygon import Polygon
 from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray
 
 
 def init_display (toolkit, master):
@@ -41,11 +43,9 @@ def unhide_all ():
     skip = 0
     control.set_skip (0)
 
-def plot_input(input):
-    """Configura o canvas para mostrar os pontos passados."""
-    if len(input) == 0:
-        return
-
+def bounds(input):
+    """Retorna (minx, maxx, miny, maxy) de uma lista de pontos,
+    segmentos e poligonos"""
     points = []
     for i in input:
         if type(i) is Polygon:
@@ -74,6 +74,19 @@ def plot_input(input):
         if i.y > maxy:
             maxy = i.y
 
+    return minx, maxx, miny, maxy
+
+
+def plot_input(input):
+    """Configura o canvas para mostrar os pontos passados."""
+    if len(input) == 0:
+        return
+
+    if isinstance(input, PointArray):
+        minx, maxx, miny, maxy = input.bounds()
+    else:
+        minx, maxx, miny, maxy = bounds(input)
+
     if minx == maxx:
         if minx == 0:
             minx = -1
@@ -92,30 +105,64 @@ def plot_input(input):
 
     control.freeze_update()
     gui.config_canvas(minx, maxx, miny, maxy)
+    control.clear_ids()
 
-    for i in input:
-        i.plot()
+    if isinstance(input, PointArray):
+        input.plot()
+    else:
+        for i in input:
+            i.plot()
 
     # para "garantir" que os updates nao estao congelados
     control.thaw_update(10000000)
 
 
-def run_algorithm(alg, input):
+def run_algorithm(alg, input, prefilter=None):
     """roda o algoritmo alg, usando input como entrada
 
+    input pode ser uma lista de pontos/segmentos/poligonos ou um
+    PointArray. Um PointArray so' e' passado diretamente ao algoritmo
+    se nada for desenhado; caso contrario o algoritmo recebe uma lista
+    de Point (visoes dos elementos do PointArray).
+
+    Se nada for desenhado, o algoritmo roda com as primitivas de prim
+    e sem camada de controle (veja geocomp.common.headless).
+
+    Se prefilter for passado (por exemplo,
+    geocomp.convexhull.akl_toussaint), ele e' aplicado a entrada antes
+    do algoritmo e deve retornar o par (entrada filtrada, numero de
+    elementos eliminados). Suas operacoes primitivas entram na conta, e
+    o numero de eliminados e' acrescentado a extra_info. Quem chama
+    decide se o filtro vale para alg (veja
+    geocomp.convexhull.so_fecho): o filtro e' sempre aplicado.
+
     Retorna uma lista contendo o total de operacoes primitivas executadas
     e uma string opcionalmente retornada pelo algoritmo"""
-    if len(input) > 0:
-        plot_input(input)
-
     show = 1
     if gui.hide_algorithm():
         show = 0
+
+    if show and isinstance(input, PointArray):
+        input = input.to_points()
+
+    if len(input) > 0:
+        plot_input(input)
+
+    if not show:
         hide_all()
 
     input_dup = input[:]
+    eliminated = None
 
-    ret = alg (input_dup)
+    if not show:
+        saved = headless.bind()
+    try:
+        if prefilter is not None:
+            input_dup, eliminated = prefilter(input_dup)
+        ret = alg (input_dup)
+    finally:
+        if not show:
+            headless.unbind(saved)
 
     if not show:
         unhide_all()
@@ -129,6 +176,11 @@ def run_algorithm(alg, input):
     extra_info = None
     if hasattr (ret, 'extra_info'):
         extra_info = ret.extra_info
+    if eliminated is not None:
+        if extra_info:
+            extra_info = '%s, eliminados: %d' % (extra_info, eliminated)
+        else:
+            extra_info = 'eliminados: %d' % eliminated
 
     cont = prim.get_count ()
     prim.reset_count ()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Camada de controle vazia, usada quando nada e' desenhado
+
+Mesmo com hide_all, cada primitiva de guiprim (ou as versoes proprias de
+um algoritmo, como as de quickhull) ainda chama triang, que chama
+lineto, thaw_update, sleep, remove_lineto... e cada uma dessas funcoes
+so' descobre que nao ha' nada a fazer depois de algumas chamadas.
+
+bind troca, em todos os modulos de algoritmos carregados, as primitivas
+com desenho pelas de geocomp.common.prim e o modulo control por este
+modulo, cujas funcoes nao fazem nada. As primitivas de prim sao as
+mesmas usadas por guiprim, entao o numero de operacoes contadas nao
+muda. unbind desfaz a troca.
+"""
+
+import sys
+
+from . import prim
+from . import control
+
+# este modulo finge ser o modulo control com os desenhos desativados
+skip = 1
+gui = None
+dont_update = 0
+dont_sleep = 0
+plot_ids = {}
+hilight_ids = {}
+lineto_ids = {}
+
+# primitivas trocadas pelas de prim
+PRIMITIVES = ('area2', 'left', 'left_on', 'right', 'right_on', 'collinear', 'dist2')
+
+# modulos que nao sao tocados por bind
+_KEEP = ('geocomp.common.control', 'geocomp.common.guicontrol',
+	'geocomp.common.guiprim', 'geocomp.common.prim', __name__)
+
+
+def freeze_update (amount = 1):
+	pass
+
+def thaw_update (amount = 1):
+	pass
+
+def update ():
+	pass
+
+def freeze_sleep ():
+	pass
+
+def thaw_sleep ():
+	pass
+
+def sleep (amount = None):
+	pass
+
+def plot_disc (x, y, color, r):
+	return 0
+
+def plot_segment (x0, y0, x1, y1, color=None, linewidth=None):
+	return 0
+
+def plot_ray (x0, y0, x1, y1, color=None, linewidth=None):
+	return 0
+
+def plot_line (x0, y0, x1, y1, color=None, linewidth=None):
+	return 0
+
+def plot_vert_line (x, color=None, linewidth=None):
+	return 0
+
+def plot_horiz_line (y, color=None, linewidth=None):
+	return 0
+
+def plot_parabola (y, px, py, startx, endx, steps=50, color=None, linewidth=None):
+	return 0
+
+def plot_delete (id):
+	return 0
+
+def store_id (table, plot_id, *objs):
+	return plot_id
+
+def pop_id (table, *objs, plot_id = None):
+	return plot_id
+
+def clear_ids ():
+	pass
+
+def set_gui (toolkit):
+	pass
+
+def set_skip (val):
+	pass
+
+
+def _targets ():
+	"Modulos do pacote geocomp (fora os de interface) que podem ser trocados"
+	for name, module in list (sys.modules.items ()):
+		if module is None or not name.startswith ('geocomp.'):
+			continue
+		if name in _KEEP or name.startswith ('geocomp.gui'):
+			continue
+		yield module
+
+def bind ():
+	"""Passa a rodar os algoritmos carregados sem nenhum desenho
+
+	Retorna a lista de trocas feitas, que deve ser passada a unbind"""
+	saved = []
+	for module in _targets ():
+		attrs = vars (module)
+		if attrs.get ('control') is control:
+			saved.append ((module, 'control', control))
+			attrs['control'] = sys.modules[__name__]
+		for name in PRIMITIVES:
+			func = attrs.get (name)
+			if callable (func) and func is not getattr (prim, name):
+				saved.append ((module, name, func))
+				attrs[name] = getattr (prim, name)
+	return saved
+
+def unbind (saved):
+	"Desfaz as trocas feitas por bind"
+	for module, name, value in reversed (saved):
+		setattr (module, name, value)
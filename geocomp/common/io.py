@@ -1,12 +1,22 @@
 #!/usr/bin/env python
 """Modulo para leitura de um arquivo de dados"""
 
+import warnings
+from itertools import islice
+
 from geocomp.common.point   import Point
 from geocomp.common.polygon import Polygon
 from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import binfile
+
+# Tipos de pedacos devolvidos por iter_read
+POINTS = 'points'
+SEGMENTS = 'segments'
+POLYGONS = 'polygons'
 
 
-def read(filename):
+def read(filename, as_array=False):
     """Reads any type of geometric primitive data structures (Point,
     Polygon, Segment) from a file and returns it as a list.
 
@@ -15,6 +25,11 @@ def read(filename):
     The input can be mixed, it can contains a set of Polygons, Points
     and Segments and not necessarily only one type of data.
 
+    Binary files written by geocomp.common.binfile are detected
+    automatically; their contents are memory-mapped instead of parsed.
+    Since a binary file groups elements by kind, the returned list has
+    all the points first, then the segments and then the polygons.
+
     The following patterns are required during the input operation:
 
     Point: defined by two floating point coordinates, on a line,
@@ -48,8 +63,12 @@ def read(filename):
 
     :param filename: (str) The name of the file that will be read
 
+    :param as_array: (bool) If True, the file must contain only points,
+                     which are returned as a single PointArray instead
+                     of a list of Point objects
+
     :return: (list) A list of geometric primitive data structures
-             read from the file
+             read from the file (or a PointArray, if 'as_array' is set)
 
     Raises:
         FileNotFoundError: if file could not be found
@@ -57,8 +76,13 @@ def read(filename):
         TypeError: if 'filename' is None
 
         ValueError: if some input from the file does not follow the
-                    required patterns
+                    required patterns, or if 'as_array' is set and the
+                    file contains segments or polygons
     """
+    if binfile.is_binary(filename):
+        return _read_binary(filename, as_array)
+    if as_array:
+        return _read_array(filename)
     with open(filename) as file:
         i = 0
         vertices = []
@@ -92,6 +116,229 @@ def read(filename):
                     "Invalid input from file: {}: line: {}: {}".format(filename, i, line))
         return data
 
+
+def _read_binary(filename, as_array):
+    """Reads a binary file. With 'as_array', the memory-mapped points are
+    returned directly, without copying them."""
+    data = binfile.BinaryFile(filename)
+    if not as_array:
+        return data.to_list()
+    if len(data.segments) > 0 or len(data.polygons) > 0:
+        raise ValueError(
+            "Invalid input from file: {}: only points can be read as a "
+            "PointArray".format(filename))
+    return data.points
+
+
+def _read_array(filename):
+    """Reads a file containing only points into a PointArray, without
+    creating a Point object per line."""
+    xs = []
+    ys = []
+    for kind, chunk in iter_read(filename):
+        if kind != POINTS:
+            raise ValueError(
+                "Invalid input from file: {}: only points can be read as a "
+                "PointArray".format(filename))
+        xs.append(chunk.x)
+        ys.append(chunk.y)
+    if len(xs) == 0:
+        return PointArray([], [])
+    return PointArray(np.concatenate(xs), np.concatenate(ys))
+
+
+def iter_read(filename, chunk_size=65536):
+    """Reads the same data as read(), in a single pass, yielding it in
+    chunks instead of building the whole list in memory.
+
+    Yields (kind, chunk) pairs, in file order, where kind is one of
+    POINTS, SEGMENTS or POLYGONS and chunk is, respectively, a
+    PointArray, a list of Segment or a list of Polygon with at most
+    'chunk_size' elements. A chunk only holds consecutive elements of
+    the same kind: whenever the kind changes, the current chunk is
+    yielded.
+
+    Runs of lines holding only points (or only segments) are parsed in
+    bulk by NumPy. Anything else (polygons, commentaries, invalid
+    lines) is parsed line by line, so errors report exactly the same
+    line numbers as read().
+
+    Binary files (see geocomp.common.binfile) are also accepted; their
+    points are yielded first, then their segments and then their
+    polygons.
+
+    :param filename: (str) The name of the file that will be read
+
+    :param chunk_size: (int) Maximum number of elements per chunk (and
+                       number of lines parsed at a time)
+
+    Raises:
+        FileNotFoundError: if file could not be found
+
+        TypeError: if 'filename' is None
+
+        ValueError: if some input from the file does not follow the
+                    patterns required by read()
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if binfile.is_binary(filename):
+        yield from _iter_binary(filename, chunk_size)
+        return
+
+    reader = _ChunkReader(filename, chunk_size)
+    with open(filename) as file:
+        lineno = 0
+        while True:
+            lines = list(islice(file, chunk_size))
+            if len(lines) == 0:
+                break
+            yield from reader.feed(lines, lineno)
+            lineno += len(lines)
+    yield from reader.finish()
+
+
+def _iter_binary(filename, chunk_size):
+    data = binfile.BinaryFile(filename)
+    for start in range(0, len(data.points), chunk_size):
+        yield POINTS, data.points[start:start + chunk_size]
+    for block, kind in ((data.segments, SEGMENTS), (data.polygons, POLYGONS)):
+        for start in range(0, len(block), chunk_size):
+            end = min(start + chunk_size, len(block))
+            yield kind, [block[i] for i in range(start, end)]
+
+
+class _ChunkReader:
+    """State of iter_read: the chunk being built and the polygon being
+    read, which may span several blocks of lines."""
+
+    def __init__(self, filename, chunk_size):
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.kind = None
+        # Segment/Polygon objects, or arrays of (x, y) rows
+        self.items = []
+        # coordinates of points parsed line by line, not yet in items
+        self.flat = []
+        self.count = 0
+        self.expecting_polygon = False
+        self.vertices = []
+
+    def feed(self, lines, lineno):
+        """Parses a block of lines, the first one being line lineno + 1,
+        yielding the chunks that get completed"""
+        if not self.expecting_polygon:
+            coords = self._parse_bulk(lines)
+            if coords is not None:
+                if coords.shape[1] == 2:
+                    yield from self._push_points(coords)
+                else:
+                    for x0, y0, x1, y1 in coords.tolist():
+                        yield from self._push(SEGMENTS, Segment(Point(x0, y0), Point(x1, y1)))
+                return
+
+        i = lineno
+        for line in lines:
+            i += 1
+            line = line.split()
+            if len(line) == 0 or line[0] == "#":
+                continue
+            if line[0] == "[":
+                self.expecting_polygon = True
+            elif line[0] == "]":
+                self.expecting_polygon = False
+                yield from self._push(POLYGONS, Polygon(self.vertices))
+                self.vertices = []
+            elif len(line) == 4:
+                yield from self._push(
+                    SEGMENTS,
+                    Segment(
+                        Point(float(line[0]), float(line[1])),
+                        Point(float(line[2]), float(line[3]))
+                    )
+                )
+            elif len(line) == 2:
+                if self.expecting_polygon:
+                    self.vertices.append(Point(float(line[0]), float(line[1])))
+                else:
+                    yield from self._push(POINTS, (float(line[0]), float(line[1])))
+            else:
+                raise ValueError(
+                    "Invalid input from file: {}: line: {}: {}".format(self.filename, i, line))
+
+    def finish(self):
+        "Yields the last chunk, if any"
+        chunk = self._flush()
+        if chunk is not None:
+            yield chunk
+
+    def _parse_bulk(self, lines):
+        """Parses a block made only of point lines (or only of segment
+        lines) with NumPy. Returns None if the block has anything else."""
+        text = "".join(lines)
+        if "[" in text or "]" in text or "#" in text or text.isspace():
+            return None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                coords = np.loadtxt(lines, dtype=np.float64, ndmin=2, comments=None)
+        except ValueError:
+            return None
+        if coords.shape[1] != 2 and coords.shape[1] != 4:
+            return None
+        return coords
+
+    def _start(self, kind):
+        """Starts a new chunk of the given kind if needed, returning the
+        chunk that was completed (or None)"""
+        if self.kind == kind and self.count < self.chunk_size:
+            return None
+        chunk = self._flush()
+        self.kind = kind
+        return chunk
+
+    def _push(self, kind, item):
+        chunk = self._start(kind)
+        if chunk is not None:
+            yield chunk
+        if kind == POINTS:
+            self.flat.extend(item)
+        else:
+            self.items.append(item)
+        self.count += 1
+
+    def _push_points(self, coords):
+        start = 0
+        while start < len(coords):
+            chunk = self._start(POINTS)
+            if chunk is not None:
+                yield chunk
+            self._seal_flat()
+            take = min(len(coords) - start, self.chunk_size - self.count)
+            self.items.append(coords[start:start + take])
+            self.count += take
+            start += take
+
+    def _seal_flat(self):
+        if len(self.flat) > 0:
+            self.items.append(np.array(self.flat, dtype=np.float64).reshape(-1, 2))
+            self.flat = []
+
+    def _flush(self):
+        if self.count == 0:
+            return None
+        if self.kind == POINTS:
+            self._seal_flat()
+            coords = np.concatenate(self.items)
+            chunk = PointArray(coords[:, 0].copy(), coords[:, 1].copy())
+        else:
+            chunk = self.items
+        ret = (self.kind, chunk)
+        self.kind = None
+        self.items = []
+        self.count = 0
+        return ret
+
 # if __name__ == '__main__':
 #     import sys
 #
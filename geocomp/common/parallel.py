@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Processos paralelos que enxergam um PointArray em memoria compartilhada
+
+Pool (usado com with) copia as coordenadas dos pontos uma unica vez
+para um bloco de memoria compartilhada (multiprocessing.shared_memory)
+e cria um concurrent.futures.ProcessPoolExecutor cujos processos
+anexam esse bloco ao comecar; dentro deles, pontos () devolve o
+PointArray (sem copia). As tarefas recebem e devolvem so' indices.
+
+As operacoes primitivas (de prim) feitas por uma tarefa sao somadas
+aos contadores do processo principal quando o resultado chega.
+
+O numero de processos vem de config.WORKERS (0: um por processador).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from geocomp import config
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import prim
+
+
+def processos ():
+	"Numero de processos a usar (config.WORKERS, ou um por processador)"
+	if config.WORKERS > 0:
+		return config.WORKERS
+	return os.cpu_count () or 1
+
+# os pontos (na memoria compartilhada), em cada processo do pool
+_memoria = None
+_pontos = None
+
+def _anexa (nome, n):
+	"Prepara um processo do pool: anexa o bloco de memoria compartilhada"
+	global _memoria, _pontos
+	_memoria = shared_memory.SharedMemory (name=nome)
+	xy = np.ndarray ((2, n), dtype=np.float64, buffer=_memoria.buf)
+	_pontos = PointArray (xy[0], xy[1])
+
+def pontos ():
+	"Os pontos compartilhados (so' dentro de uma tarefa do pool)"
+	return _pontos
+
+def _executa (func, args):
+	"Roda func (*args) num processo do pool, contando as operacoes"
+	prim.reset_count ()
+	ret = func (*args)
+	return ret, prim.num_area2, prim.num_dist
+
+
+class Pool:
+	"Um pool de k processos que enxergam os pontos de pts (um PointArray)"
+
+	def __init__ (self, pts, k):
+		self.pts = pts
+		self.k = k
+		self.memoria = None
+		self.executor = None
+
+	def __enter__ (self):
+		n = len (self.pts)
+		self.memoria = shared_memory.SharedMemory (create=True, size=max (16 * n, 1))
+		try:
+			xy = np.ndarray ((2, n), dtype=np.float64, buffer=self.memoria.buf)
+			xy[0] = self.pts.x
+			xy[1] = self.pts.y
+			del xy
+			self.executor = ProcessPoolExecutor (self.k, initializer=_anexa,
+			                                     initargs=(self.memoria.name, n))
+		except BaseException:
+			self.memoria.close ()
+			self.memoria.unlink ()
+			raise
+		return self
+
+	def __exit__ (self, *exc):
+		try:
+			self.executor.shutdown ()
+		finally:
+			self.memoria.close ()
+			self.memoria.unlink ()
+		return False
+
+	def map (self, func, tarefas):
+		"""Roda func (*args) para cada args de tarefas (func deve ser uma
+		funcao de modulo); retorna os resultados, na ordem"""
+		futuros = [ self.executor.submit (_executa, func, args) for args in tarefas ]
+		ret = []
+		for futuro in futuros:
+			valor, num_area2, num_dist = futuro.result ()
+			prim.num_area2 = prim.num_area2 + num_area2
+			prim.num_dist = prim.num_dist + num_dist
+			ret.append (valor)
+		return ret
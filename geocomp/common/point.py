@@ -6,21 +6,32 @@ from .prim import dist2
 from geocomp import config
 
 class Point:
-    "Um ponto representado por suas coordenadas cartesianas"
+    """Um ponto representado por suas coordenadas cartesianas (2D ou 3D)
+
+    Alem das coordenadas, um ponto so' tem os campos next e prev,
+    usados pelos poligonos (listas ligadas de pontos). Os identificadores
+    dos desenhos de um ponto ficam em tabelas de geocomp.common.control,
+    de modo que um ponto nao aloca nada para ser desenhado."""
+
+    __slots__ = ('x', 'y', '_z', 'next', 'prev')
+
+    # mantido por compatibilidade
+    polygon_id = -1
 
     def __init__ (self, *args):
-        "Para criar um ponto, passe suas coordenadas."
-        if len(args) == 0:
-            raise ValueError("Point must have at least one coordinate")
-        self.__coord = list(args)
-        self.polygon_id = -1
-        self.lineto_id = {}
+        "Para criar um ponto, passe suas coordenadas (duas ou tres)."
+        if len(args) != 2 and len(args) != 3:
+            raise ValueError("Point must have two or three coordinates")
+        self.x = args[0]
+        self.y = args[1]
+        self._z = args[2] if len(args) == 3 else None
+        self.next = self.prev = None
 
     def __repr__ (self):
         "Retorna uma string da forma '( x1 x2 x3 ... xn )'"
         res = "("
-        for i in self.__coord:
-            res += " " + repr(i) + ","
+        for i in range(self.dimension):
+            res += " " + repr(self[i]) + ","
         return res[:-1] + " )"
 
     def __add__(self, other):
@@ -47,82 +58,73 @@ class Point:
 
     @property
     def dimension(self):
-        return len(self.__coord)
-
-    @property
-    def x(self):
-        return self.__coord[0]
-
-    @x.setter
-    def x(self, x):
-        self.__coord[0] = x
-
-    @property
-    def y(self):
-        if len(self.__coord) < 2:
-            raise ValueError("Point has dimension 1")
-        return self.__coord[1]
-
-    @y.setter
-    def y(self, y):
-        if len(self.__coord) < 2:
-            raise ValueError("Point has dimension 1")
-        self.__coord[1] = y
+        return 2 if self._z is None else 3
 
     @property
     def z(self):
-        if len(self.__coord) < 3:
+        if self._z is None:
             raise ValueError("Point does not have dimension 3")
-        return self.__coord[2]
+        return self._z
 
     @z.setter
     def z(self, z):
-        if len(self.__coord) < 3:
+        if self._z is None:
             raise ValueError("Point does not have dimension 3")
-        self.__coord[2] = z
+        self._z = z
 
     def __getitem__(self, i):
         if i < 0:
             raise ValueError("Negative dimension value")
-        if i >= len(self.__coord):
-            return 0
-        return self.__coord[i]
+        if i == 0:
+            return self.x
+        if i == 1:
+            return self.y
+        if i == 2 and self._z is not None:
+            return self._z
+        return 0
 
     def __setitem__(self, key, value):
-        if key < 0 or key >= len(self.__coord):
+        if key < 0 or key >= self.dimension:
             raise ValueError("Illegal dimension value")
-        self.__coord[key] = value
+        if key == 0:
+            self.x = value
+        elif key == 1:
+            self.y = value
+        else:
+            self._z = value
 
     def approx_equals(self, other, precision=1e-7):
-        for i in range(len(self.__coord)):
+        for i in range(self.dimension):
             if abs(self[i] - other[i]) >= precision:
                 return False
         return True
 
     def plot (self, color=config.COLOR_POINT):
         "Desenha o ponto na cor especificada"
-        self.plot_id = control.plot_disc (
+        plot_id = control.plot_disc (
             self.x,
             self.y,
             color,
             config.RADIUS
         )
-        return self.plot_id
+        return control.store_id (control.plot_ids, plot_id, self)
 
     def unplot(self, id = None):
-        if id == None: id = self.plot_id
+        id = control.pop_id (control.plot_ids, self, plot_id = id)
+        if id == None: return
         control.plot_delete(id)
 
 
     def hilight (self, color=config.COLOR_HI_POINT):
         "Desenha o ponto com 'destaque' (raio maior e cor diferente)"
-        self.hi = control.plot_disc (self.x, self.y, color,
+        hi = control.plot_disc (self.x, self.y, color,
                         config.RADIUS_HILIGHT)
-        return self.hi
+        return control.store_id (control.hilight_ids, hi, self)
 
     def unhilight (self, id = None):
         "Apaga o 'destaque' do ponto"
-        if id == None: id = self.hi
+        id = control.pop_id (control.hilight_ids, self, plot_id = id)
+        if id == None: return
         control.plot_delete (id)
 
 
@@ -131,12 +133,13 @@ class Point:
 
     def lineto (self, p, color=config.COLOR_LINE):
         "Desenha uma linha ate um ponto p na cor especificada"
-        self.lineto_id[p] = control.plot_segment (self.x, self.y, p.x, p.y, color)
-        return self.lineto_id[p]
+        lineto_id = control.plot_segment (self.x, self.y, p.x, p.y, color)
+        return control.store_id (control.lineto_ids, lineto_id, self, p)
 
     def remove_lineto (self, p, id = None):
         "Apaga a linha ate o ponto p"
-        if id == None: id = self.lineto_id[p]
+        id = control.pop_id (control.lineto_ids, self, p, plot_id = id)
+        if id == None: return
         control.plot_delete (id)
 
     def is_inside(self, segment):
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Conjunto de pontos guardado como colunas de coordenadas (NumPy)
+
+Uma lista de Point custa varias centenas de bytes por ponto (o objeto,
+sua lista de coordenadas, dicionarios, ...). Um PointArray guarda apenas
+as colunas x, y (e opcionalmente z) em vetores float64, e cria objetos
+Point somente quando pedido -- por exemplo para desenhar na tela ou
+para devolver os vertices de um fecho convexo.
+
+Os algoritmos que recebem um PointArray rodam sem interface grafica
+(veja geocomp.common.guicontrol.run_algorithm).
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from geocomp.common.point import Point
+from geocomp.common import control
+from geocomp import config
+
+
+class PointArray:
+    "Um conjunto de pontos representado por colunas de coordenadas"
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__ (self, x, y, z=None):
+        """Para criar, passe as colunas de coordenadas
+
+        Qualquer sequencia serve; as colunas sao convertidas (sem copia,
+        se possivel) para vetores float64 de uma dimensao."""
+        if np is None:
+            raise ImportError("PointArray requires NumPy")
+        self.x = np.asarray (x, dtype=np.float64)
+        self.y = np.asarray (y, dtype=np.float64)
+        self.z = None if z is None else np.asarray (z, dtype=np.float64)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape \
+           or (self.z is not None and self.z.shape != self.x.shape):
+            raise ValueError("Coordinate columns must be 1-d and have the same length")
+
+    @classmethod
+    def from_points (cls, points):
+        "Cria um PointArray a partir de uma sequencia de Point"
+        x = [p.x for p in points]
+        y = [p.y for p in points]
+        if len (points) > 0 and all (p.dimension >= 3 for p in points):
+            return cls (x, y, [p.z for p in points])
+        return cls (x, y)
+
+    @classmethod
+    def from_coords (cls, coords):
+        "Cria um PointArray a partir de uma matriz n x 2 (ou n x 3)"
+        coords = np.asarray (coords, dtype=np.float64)
+        if coords.ndim != 2:
+            raise ValueError("Coordinates must be a n x 2 or n x 3 matrix")
+        if coords.shape[1] == 2:
+            return cls (coords[:, 0], coords[:, 1])
+        if coords.shape[1] == 3:
+            return cls (coords[:, 0], coords[:, 1], coords[:, 2])
+        raise ValueError("Coordinates must have 2 or 3 columns")
+
+    def __len__ (self):
+        return len (self.x)
+
+    def __repr__ (self):
+        return 'PointArray(%d pontos, dimensao %d)' % (len (self), self.dimension)
+
+    @property
+    def dimension (self):
+        return 2 if self.z is None else 3
+
+    def point (self, i):
+        "Retorna uma visao (um novo Point) do i-esimo ponto"
+        if self.z is None:
+            return Point (self.x[i].item (), self.y[i].item ())
+        return Point (self.x[i].item (), self.y[i].item (), self.z[i].item ())
+
+    def __getitem__ (self, i):
+        """Um indice inteiro devolve um Point; uma fatia ou um vetor de
+        indices (ou de booleanos) devolve um PointArray"""
+        if isinstance (i, (int, np.integer)):
+            return self.point (i)
+        return self.take (i)
+
+    def take (self, indices):
+        "Retorna o PointArray com os pontos selecionados por indices"
+        z = None if self.z is None else self.z[indices]
+        return PointArray (self.x[indices], self.y[indices], z)
+
+    def __iter__ (self):
+        for i in range (len (self)):
+            yield self.point (i)
+
+    def to_points (self, indices=None):
+        """Retorna uma lista (de python) de Point
+
+        Se indices for passado, so' os pontos com esses indices sao
+        criados, na ordem dada."""
+        sub = self if indices is None else self.take (indices)
+        if sub.z is None:
+            return [Point (x, y) for x, y in zip (sub.x.tolist (), sub.y.tolist ())]
+        return [Point (x, y, z) for x, y, z in
+                zip (sub.x.tolist (), sub.y.tolist (), sub.z.tolist ())]
+
+    def coords (self):
+        "Retorna uma matriz n x 2 (ou n x 3) com as coordenadas"
+        if self.z is None:
+            return np.column_stack ((self.x, self.y))
+        return np.column_stack ((self.x, self.y, self.z))
+
+    def bounds (self):
+        "Retorna (minx, maxx, miny, maxy)"
+        return (self.x.min ().item (), self.x.max ().item (),
+                self.y.min ().item (), self.y.max ().item ())
+
+    def lowest (self):
+        "Indice do ponto mais baixo (o mais a direita, em caso de empate)"
+        return extreme_index (-self.y, self.x)
+
+    def plot (self, color=config.COLOR_POINT):
+        "Desenha todos os pontos, sem criar objetos Point"
+        if control.skip: return
+        for x, y in zip (self.x.tolist (), self.y.tolist ()):
+            control.plot_disc (x, y, color, config.RADIUS)
+
+
+def extreme_index (primary, secondary):
+    """Indice do elemento que maximiza primary, desempatando pelo maior
+    valor de secondary"""
+    cand = np.flatnonzero (primary == primary.max ())
+    return int (cand[secondary[cand].argmax ()])
+
+
+def as_points (l):
+    """Retorna l como uma lista de Point
+
+    Usada pelos algoritmos que ainda nao tem uma versao propria para
+    PointArray."""
+    if isinstance (l, PointArray):
+        return l.to_points ()
+    return l
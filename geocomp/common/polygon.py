@@ -36,6 +36,7 @@ class Polygon:
 
     def hilight (self, color_line = config.COLOR_HI_POLYGON, color_point = config.COLOR_HI_POLYGON_POINT):
         "Desenha o poligono com destaque na tela"
+        if control.skip: return
         p = self.pts
         while p.next != self.pts:
             self.hid[p] = p.lineto (p.next, color_line)
@@ -47,6 +48,7 @@ class Polygon:
 
     def plot (self, color = config.COLOR_POLYGON):
         "Desenha o poligono na tela"
+        if control.skip: return
         p = self.pts
         while p.next != self.pts:
             self.cid[p] = p.lineto (p.next, color)
@@ -57,6 +59,7 @@ class Polygon:
 
     def hide (self):
         "Apaga o poligono na tela"
+        if control.skip: return
         p = self.pts
         while p.next != self.pts:
             if p in self.cid:
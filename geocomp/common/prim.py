@@ -59,6 +59,79 @@ def dist2 (a, b):
 
     return dy*dy + dx*dx
 
+# Versoes em lote das primitivas acima: um segmento (ou ponto) fixo e
+# um PointArray de candidatos. Cada uma retorna um vetor (NumPy) com um
+# valor por candidato e soma o tamanho do lote aos contadores, de modo
+# que o numero de operacoes continue comparavel ao das versoes escalares.
+
+def area2_many (a, b, pts):
+    "Retorna um vetor com area2 (a, b, p) para cada ponto p de pts"
+    global num_area2
+    num_area2 = num_area2 + len (pts)
+    return (b.x - a.x)*(pts.y - a.y) - (b.y - a.y)*(pts.x - a.x)
+
+def area2_pairs (a, bs, cs):
+    """Retorna um vetor com area2 (a, bs[i], cs[i]) para cada i (bs e cs
+    sao PointArray do mesmo tamanho)"""
+    global num_area2
+    num_area2 = num_area2 + len (bs)
+    return (bs.x - a.x)*(cs.y - a.y) - (bs.y - a.y)*(cs.x - a.x)
+
+def left_mask (a, b, pts):
+    "Vetor booleano: p esta a esquerda do segmento orientado ab?"
+    return area2_many (a, b, pts) > 0
+
+def left_on_mask (a, b, pts):
+    "Vetor booleano: p esta a esquerda ou sobre o segmento orientado ab?"
+    return area2_many (a, b, pts) >= 0
+
+def right_mask (a, b, pts):
+    "Vetor booleano: p esta a direita do segmento orientado ab?"
+    return area2_many (a, b, pts) < 0
+
+def right_on_mask (a, b, pts):
+    "Vetor booleano: p esta a direita ou sobre o segmento orientado ab?"
+    return area2_many (a, b, pts) <= 0
+
+def collinear_mask (a, b, pts):
+    "Vetor booleano: a, b, p sao colineares?"
+    return area2_many (a, b, pts) == 0
+
+def dist2_many (a, pts):
+    "Retorna um vetor com o quadrado da distancia entre a e cada ponto de pts"
+    global num_dist
+    num_dist = num_dist + len (pts)
+    dy = pts.y - a.y
+    dx = pts.x - a.x
+
+    return dy*dy + dx*dx
+
+def area2_chain (pts):
+    """Retorna um vetor com area2 (pts[i-1], pts[i], pts[i+1]) para cada
+    0 < i < len (pts) - 1, ou seja, as curvas de uma poligonal"""
+    global num_area2
+    if len (pts) < 3:
+        return pts.x[:0].copy ()
+    num_area2 = num_area2 + len (pts) - 2
+    x, y = pts.x, pts.y
+    return (x[1:-1] - x[:-2])*(y[2:] - y[:-2]) - (y[1:-1] - y[:-2])*(x[2:] - x[:-2])
+
+def area2_idx (x, y, a, b, c):
+    """Retorna area2 dos pontos de indices a, b e c, cujas coordenadas
+    estao nas sequencias x e y"""
+    global num_area2
+    num_area2 = num_area2 + 1
+    return (x[b] - x[a])*(y[c] - y[a]) - (y[b] - y[a])*(x[c] - x[a])
+
+def dist2_idx (x, y, a, b):
+    """Retorna o quadrado da distancia entre os pontos de indices a e b,
+    cujas coordenadas estao nas sequencias x e y"""
+    global num_dist
+    num_dist = num_dist + 1
+    dy = y[b] - y[a]
+    dx = x[b] - x[a]
+    return dy*dy + dx*dx
+
 def get_count ():
     "Retorna o numero total de operacoes primitivas realizadas"
     return num_area2 + num_dist
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Fonte de numeros aleatorios dos algoritmos probabilisticos
+
+Os algoritmos aleatorizados (convexhull.incr_prob, convexhull.bhatta_sen,
+convexhull.dynamic) sorteiam por meio deste modulo, e nao direto pelo
+modulo random. Com seed (s) as execucoes ficam reproduziveis (opcao -s
+de cligeocomp.py); set_source troca a fonte por qualquer objeto com a
+interface de random.Random.
+"""
+
+import random as _random
+
+_fonte = _random.Random ()
+
+def seed (s=None):
+	"Reinicia a fonte atual com a semente s (None: semente do sistema)"
+	_fonte.seed (s)
+
+def set_source (fonte=None):
+	"""Passa a sortear com fonte (com a interface de random.Random);
+	None volta a uma fonte nova do modulo random. Retorna a fonte antiga"""
+	global _fonte
+	antiga = _fonte
+	_fonte = fonte if fonte is not None else _random.Random ()
+	return antiga
+
+def source ():
+	"A fonte atual"
+	return _fonte
+
+def random ():
+	"Numero em [0, 1)"
+	return _fonte.random ()
+
+def uniform (a, b):
+	"Numero entre a e b"
+	return _fonte.uniform (a, b)
+
+def randrange (*args):
+	"Como random.randrange"
+	return _fonte.randrange (*args)
+
+def shuffle (l):
+	"Embaralha a lista l (no lugar)"
+	_fonte.shuffle (l)
@@ -78,6 +78,15 @@ COLOR_ALT4 = 'green'
 COLOR_ALT5 = 'orange'
 
 
+# numero de processos usados pelos algoritmos paralelos
+#   (convexhull.chan_par); 0 = um por processador
+WORKERS = 0
+
+# a cada quantas insercoes/remocoes as invariantes da arvore rubro-negra
+#   da linha de varredura (point_visibility) sao verificadas, em O(n);
+#   0 = nunca (a verificacao e' so' para depuracao)
+BST_CHECK_EVERY = 0
+
 # --------------------------------------------
 # nao mexa daqui para baixo
 # --------------------------------------------
@@ -88,3 +97,5 @@ if DELAY > MAX_DELAY: DELAY = MAX_DELAY
 if LINEWIDTH <= 0: LINEWIDTH = 1
 if RADIUS <= 0: RADIUS = 2
 if RADIUS_HILIGHT <= 0: RADIUS_HILIGHT = 5
+if WORKERS < 0: WORKERS = 0
+if BST_CHECK_EVERY < 0: BST_CHECK_EVERY = 0
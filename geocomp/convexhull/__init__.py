@@ -8,22 +8,33 @@ Algoritmos disponiveis:
 - Graham
 - Embrulho Para Presente
 - Quick Hull
+- Cadeia Monotona (Andrew)
 - Incremental Probabilistico
-- Merge Hull
-- Um algoritmo otimo proposto por Chan
+- Merge Hull (e uma versao paralela)
+- Um algoritmo otimo proposto por Chan (e uma versao paralela)
 - Um algoritmo otimo proposto por Bhattacharya e Sen
+- Fecho dinamico de Overmars e van Leeuwen (insercoes e remocoes)
 
 algoritmo otimo = executa em tempo O(n lg(h)), n = numero de pontos,
                                                h = numero de arestas no fecho
+
+Qualquer um deles pode ser precedido pela eliminacao de pontos
+interiores de Akl e Toussaint (akl_toussaint); so_fecho diz para quais
+algoritmos (estes e os de par mais distante) o filtro vale.
 """
 from . import graham
 from . import gift
 from . import quickhull
+from . import monotone
 from . import incremental
 from . import incr_prob
 from . import mergehull
+from . import mergehull_par
 from . import chan
+from . import chan_par
 from . import bhatta_sen
+from . import dynamic
+from ._prefilter import akl_toussaint, so_fecho
 
 # cada entrada deve ter:
 #  [ 'nome-do-modulo', 'nome-da-funcao', 'nome do algoritmo' ]
@@ -31,11 +42,15 @@ children = (
 	( 'graham', 'Graham', 'Graham' ),
 	( 'gift', 'Gift', 'Embrulho\nPara Presente' ),
 	( 'quickhull', 'Quickhull', 'Quickhull' ),
+	( 'monotone', 'Monotone', 'Cadeia\nMonotona' ),
 	( 'incremental', 'Incremental', 'Incremental' ),
 	( 'incr_prob', 'IncrProb', 'Incremental\nProbabilistico' ),
 	( 'mergehull', 'Mergehull', 'Mergehull' ),
+	( 'mergehull_par', 'MergehullPar', 'Mergehull\n(paralelo)' ),
 	( 'chan', 'Chan', 'Chan' ),
-	( 'bhatta_sen', 'Bhatta_Sen', 'Bhattacharya\nSen')
+	( 'chan_par', 'ChanPar', 'Chan\n(paralelo)' ),
+	( 'bhatta_sen', 'Bhatta_Sen', 'Bhattacharya\nSen'),
+	( 'dynamic', 'Dynamic', 'Fecho\nDinamico' )
 
 )
 
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Eliminacao de pontos interiores de Akl e Toussaint
+
+Os pontos extremos nas oito direcoes (x, x+y, y, y-x, -x, -x-y, -y, x-y)
+estao no fecho convexo, entao o octogono formado por eles esta contido
+no fecho, e os pontos estritamente dentro dele nao podem ser vertices
+do fecho (nem estar sobre uma aresta). Em entradas como as de
+Dados/disc e Dados/box, a maior parte dos pontos cai dentro do
+octogono e pode ser descartada antes do algoritmo.
+
+O filtro pode ser passado a geocomp.common.guicontrol.run_algorithm
+(ou ligado com a opcao -p de cligeocomp.py) para qualquer algoritmo
+cuja resposta so' dependa do fecho convexo: os de fecho convexo e os
+de par mais distante (farthest.diameter, brute, brute_par e approx),
+ja que os dois pontos mais distantes tambem sao vertices do fecho.
+so_fecho (alg) diz se alg e' um deles; para os outros (vizinhos mais
+distantes, k-centros, visibilidade...), eliminar pontos muda a
+resposta, e a entrada deve ser usada inteira.
+"""
+
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import prim
+
+
+# modulos dos algoritmos cuja resposta so' depende do fecho convexo
+MODULOS = ( 'geocomp.convexhull', 'geocomp.farthest.diameter',
+            'geocomp.farthest.brute', 'geocomp.farthest.brute_par',
+            'geocomp.farthest.approx' )
+
+# direcoes (coeficientes de x e de y), em sentido anti-horario
+DIRECOES = ( (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1) )
+
+def so_fecho (alg):
+	"""Verdadeiro se a resposta do algoritmo alg (uma funcao) so' depende
+	do fecho convexo da entrada, e o filtro pode ser aplicado antes dele"""
+	modulo = getattr (alg, '__module__', None) or ''
+	for m in MODULOS:
+		if modulo == m or modulo.startswith (m + '.'):
+			return True
+	return False
+
+def octogono (pontos):
+	"""Vertices, em sentido anti-horario e sem repeticoes, do octogono
+	dos pontos extremos da lista (de Point) pontos"""
+	vertices = []
+	for a, b in DIRECOES:
+		p = max (pontos, key=lambda p: a * p.x + b * p.y)
+		if len (vertices) == 0 or p.x != vertices[-1].x or p.y != vertices[-1].y:
+			vertices.append (p)
+	while len (vertices) > 1 and vertices[0].x == vertices[-1].x \
+	      and vertices[0].y == vertices[-1].y:
+		vertices.pop ()
+	return vertices
+
+def akl_toussaint (l):
+	"""Elimina os pontos de l que estao estritamente dentro do octogono
+	dos extremos
+
+	l pode ser uma lista de Point ou um PointArray. Retorna o par
+	(pontos que sobraram, numero de pontos eliminados); os pontos que
+	sobram estao na mesma ordem de l. Cada teste de um ponto contra um
+	lado do octogono conta como uma chamada de area2."""
+	if isinstance (l, PointArray):
+		return akl_toussaint_array (l)
+	if len (l) < 3:
+		return l, 0
+
+	vertices = octogono (l)
+	if len (vertices) < 3:
+		return l, 0
+
+	lados = [ (vertices[i], vertices[(i+1) % len (vertices)]) for i in range (len (vertices)) ]
+	sobra = []
+	for p in l:
+		for a, b in lados:
+			if not prim.left (a, b, p):
+				sobra.append (p)
+				break
+	return sobra, len (l) - len (sobra)
+
+def akl_toussaint_array (pts):
+	"Versao de akl_toussaint para um PointArray (vetorizada)"
+	if len (pts) < 3:
+		return pts, 0
+
+	vertices = []
+	for a, b in DIRECOES:
+		i = int ((a * pts.x + b * pts.y).argmax ())
+		if len (vertices) == 0 or pts.x[i] != pts.x[vertices[-1]] \
+		   or pts.y[i] != pts.y[vertices[-1]]:
+			vertices.append (i)
+	while len (vertices) > 1 and pts.x[vertices[0]] == pts.x[vertices[-1]] \
+	      and pts.y[vertices[0]] == pts.y[vertices[-1]]:
+		vertices.pop ()
+	if len (vertices) < 3:
+		return pts, 0
+
+	# candidatos a serem eliminados: os que estao a esquerda de todos
+	# os lados vistos ate agora
+	dentro = np.arange (len (pts))
+	for i in range (len (vertices)):
+		a = pts.point (vertices[i])
+		b = pts.point (vertices[(i+1) % len (vertices)])
+		dentro = dentro[prim.left_mask (a, b, pts.take (dentro))]
+
+	fica = np.ones (len (pts), dtype=bool)
+	fica[dentro] = False
+	return pts.take (fica), len (dentro)
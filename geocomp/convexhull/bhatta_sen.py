@@ -5,13 +5,25 @@
     Planar Convex Hull Algorithm. 
   J. Algorithms, 25:177--193, 1997
  http://citeseer.nj.nec.com/206645.html
+
+Os conjuntos de pontos de cada passo sao filtrados sem list.remove: um
+ponto descartado num par sorteado troca de lugar com o ultimo da lista
+(O(1)), e as podas dos passos 5 e 6 montam listas novas numa unica
+passada. Cada nivel da recursao custa, assim, tempo linear.
+
+Com um PointArray (sem desenho), bhatta_sen_array faz o mesmo sobre
+vetores de indices: os pares sao formados e podados de uma vez, com
+mascaras booleanas (NumPy), e a recursao vira uma pilha.
 """
 
 from geocomp.common import control
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, as_points, extreme_index, np
+from geocomp.common import prim
 from geocomp.common.guiprim import *
 from geocomp import config
-import random
+from geocomp.common import rng
+from geocomp.convexhull.quickhull import avanco
 
 def inside_restricted (a, b, c, p):
 	"""verifica se p esta dentro do triangulo a,b,c
@@ -24,6 +36,17 @@ def inside_restricted (a, b, c, p):
 		return 0
 	return 1
 
+def filtra (S, fica):
+	"""Lista com os pontos p de S para os quais fica (p) e' verdadeiro;
+	os outros deixam de ser destacados"""
+	ret = []
+	for p in S:
+		if fica (p):
+			ret.append (p)
+		else:
+			p.unhilight ()
+	return ret
+
 def bhatta_sen_upper_rec (a, b, S):
 	"""Constroi a parte superior do fecho convexo"""
 	
@@ -33,18 +56,21 @@ def bhatta_sen_upper_rec (a, b, S):
 	while again:
 		if len (S) == 1:
 			return [ S[0] ]
-		j = int (random.uniform (0, len (S)//2))
+		j = rng.randrange (len (S)//2)
 		again = 0
 
 		p1 = S[2*j+1]
 		p2 = S[2*j]
 		p1.hilight ()
 		p2.hilight ()
+		# o ponto descartado da' lugar ao ultimo de S
 		if inside_restricted (b, a, S[2*j+1], S[2*j]):
-			S.remove (S[2*j])
+			S[2*j] = S[-1]
+			S.pop ()
 			again = 1
 		elif inside_restricted (b, a, S[2*j], S[2*j+1]):
-			S.remove (S[2*j+1])
+			S[2*j+1] = S[-1]
+			S.pop ()
 			again = 1
 
 		p1.unhilight ()
@@ -66,6 +92,9 @@ def bhatta_sen_upper_rec (a, b, S):
 		if area_i > area_m:
 			m = i
 			area_m = area_i
+		elif area_i == area_m and avanco (p1, p2, S[i]) > avanco (p1, p2, S[m]):
+			# entre pontos colineares, so' o da ponta e' vertice
+			m = i
 	pm = S[m]
 	control.plot_delete (id)
 
@@ -76,14 +105,11 @@ def bhatta_sen_upper_rec (a, b, S):
 	S2 = []
 
 	# step 5
-	i = j
 	#map (lambda p: p.hilight (config.COLOR_ALT2), S)
 	#control.sleep ()
 	#map (lambda p: p.unhilight (), S)
 	control.sleep ()
-	cont = []
 	for j in range (0, len(S)//2):
-		cont.extend ([2*j, 2*j+1])
 		if S[2*j].x < S[2*j+1].x:
 			p1 = S[2*j]
 			p2 = S[2*j+1]
@@ -124,10 +150,7 @@ def bhatta_sen_upper_rec (a, b, S):
 	control.sleep ()
 	
 	# step 6
-	for p in S1[:]:
-		if not left (b, pm, p):
-			S1.remove (p)
-			p.unhilight ()
+	S1 = filtra (S1, lambda p: left (b, pm, p))
 
 	control.sleep ()
 	list(map (lambda p: p.unhilight (), S1))
@@ -135,10 +158,7 @@ def bhatta_sen_upper_rec (a, b, S):
 	list(map (lambda p: p.hilight (), S2))
 	control.sleep ()
 
-	for p in S2[:]:
-		if not left (pm, a, p):
-			S2.remove (p)
-			p.unhilight ()
+	S2 = filtra (S2, lambda p: left (pm, a, p))
 	control.sleep ()
 	list(map (lambda p: p.unhilight (), S2))
 
@@ -175,18 +195,21 @@ def bhatta_sen_lower_rec (a, b, S):
 	while again:
 		if len (S) == 1:
 			return [ S[0] ]
-		j = int (random.uniform (0, len (S)//2))
+		j = rng.randrange (len (S)//2)
 		again = 0
 
 		p1 = S[2*j+1]
 		p2 = S[2*j]
 		p1.hilight ()
 		p2.hilight ()
+		# o ponto descartado da' lugar ao ultimo de S
 		if inside_restricted (b, a, S[2*j+1], S[2*j]):
-			S.remove (S[2*j])
+			S[2*j] = S[-1]
+			S.pop ()
 			again = 1
 		elif inside_restricted (b, a, S[2*j], S[2*j+1]):
-			S.remove (S[2*j+1])
+			S[2*j+1] = S[-1]
+			S.pop ()
 			again = 1
 
 		p1.unhilight ()
@@ -207,6 +230,9 @@ def bhatta_sen_lower_rec (a, b, S):
 		if area_i > area_m:
 			m = i
 			area_m = area_i
+		elif area_i == area_m and avanco (p1, p2, S[i]) > avanco (p1, p2, S[m]):
+			# entre pontos colineares, so' o da ponta e' vertice
+			m = i
 	pm = S[m]
 	control.plot_delete (id)
 
@@ -217,14 +243,11 @@ def bhatta_sen_lower_rec (a, b, S):
 	S2 = []
 
 	# step 5
-	i = j
 	#map (lambda p: p.hilight (config.COLOR_ALT2), S)
 	#control.sleep ()
 	#map (lambda p: p.unhilight (), S)
 	control.sleep ()
-	cont = []
 	for j in range (0, len(S)//2):
-		cont.extend ([2*j, 2*j+1])
 		if S[2*j].x < S[2*j+1].x:
 			p1 = S[2*j]
 			p2 = S[2*j+1]
@@ -265,10 +288,7 @@ def bhatta_sen_lower_rec (a, b, S):
 	control.sleep ()
 	
 	# step 6
-	for p in S1[:]:
-		if not right (a, pm, p):
-			S1.remove (p)
-			p.unhilight ()
+	S1 = filtra (S1, lambda p: right (a, pm, p))
 
 	control.sleep ()
 	list(map (lambda p: p.unhilight (), S1))
@@ -276,10 +296,7 @@ def bhatta_sen_lower_rec (a, b, S):
 	list(map (lambda p: p.hilight (), S2))
 	control.sleep ()
 
-	for p in S2[:]:
-		if not right (pm, b, p):
-			S2.remove (p)
-			p.unhilight ()
+	S2 = filtra (S2, lambda p: right (pm, b, p))
 	control.sleep ()
 	list(map (lambda p: p.unhilight (), S2))
 
@@ -303,7 +320,13 @@ def bhatta_sen_lower_rec (a, b, S):
 	return ret1
 
 def Bhatta_Sen (l):
-	"""Algoritmo otimo proposto por Bhattacharya e Sen para encontrar o fecho convexo de l"""
+	"""Algoritmo otimo proposto por Bhattacharya e Sen para encontrar o fecho convexo de l
+
+	Com um PointArray, usa a versao vetorizada (bhatta_sen_array)."""
+	if isinstance (l, PointArray):
+		return bhatta_sen_array (l)
+	l = as_points (l)
+	if len (l) == 0: return None
 	south = north = east = west = 0
 	# encontrando o ponto mais baixo
 	for i in range (1, len(l)):
@@ -347,7 +370,8 @@ def Bhatta_Sen (l):
 		id = a.lineto (b, config.COLOR_ALT4)
 		aux = []
 		if len (S1) > 0:
-			if dirs[i] == south  or  dirs[i] == west:
+			# south -> east e west -> south: parte inferior
+			if i == 0  or  i == 3:
 				aux = bhatta_sen_lower_rec (a, b, S1)
 			else:
 				aux = bhatta_sen_upper_rec (a, b, S1)
@@ -359,10 +383,131 @@ def Bhatta_Sen (l):
 			a.lineto (b)
 		fecho.extend (aux)
 
-	if len (l) == 1:
+	if len (fecho) == 0:
 		fecho = [ l[0] ]
 	pol = Polygon (fecho)
 	pol.plot ()
 	pol.extra_info = "vertices: %d" %len (fecho)
 
 	return pol
+
+
+def dentro (x, y, a, b, c, p):
+	"inside_restricted para os pontos de indices a, b, c e p (coordenadas em x e y)"
+	return prim.area2_idx (x, y, b, c, p) >= 0 and prim.area2_idx (x, y, c, a, p) >= 0
+
+def bhatta_sen_array_iter (pts, a, b, S, lado):
+	"""Versao vetorizada (sem desenho) de bhatta_sen_upper_rec (lado 1)
+	e de bhatta_sen_lower_rec (lado -1) para uma aresta (a, b)
+
+	a e b sao indices em pts; S e' o vetor de indices dos pontos a
+	direita de ab. Os passos 1 a 3 sorteiam pares como na versao com
+	desenho. Nos passos 5 e 6, todos os pares sao classificados e
+	podados de uma vez, com mascaras booleanas. Retorna a lista de
+	indices do fecho de a ate b (sem b)."""
+	x = pts.x
+	y = pts.y
+	xl = x.tolist ()
+	yl = y.tolist ()
+	fecho = []
+	pilha = [ (a, b, S) ]
+	while pilha:
+		a, b, S = pilha.pop ()
+
+		# step 1/2/3: o ponto descartado da' lugar ao ultimo de S
+		n = len (S)
+		while n > 1:
+			j = rng.randrange (n//2)
+			p = int (S[2*j])
+			q = int (S[2*j+1])
+			if dentro (xl, yl, b, a, q, p):
+				S[2*j] = S[n-1]
+			elif dentro (xl, yl, b, a, p, q):
+				S[2*j+1] = S[n-1]
+			else:
+				break
+			n = n - 1
+		S = S[:n]
+		if n <= 1:
+			fecho.append (a)
+			fecho.extend (S.tolist ())
+			continue
+
+		# step 4
+		p1 = int (S[2*j])
+		p2 = int (S[2*j+1])
+		if prim.area2_idx (xl, yl, p1, p2, a) > 0:
+			p1, p2 = p2, p1
+		q1 = pts.point (p1)
+		q2 = pts.point (p2)
+		area = prim.area2_many (q1, q2, pts.take (S))
+		cand = S[area == area.max ()]
+		if len (cand) > 1:
+			# entre pontos colineares, so' o da ponta e' vertice
+			proj = (x[cand] - q1.x) * (q2.x - q1.x) + (y[cand] - q1.y) * (q2.y - q1.y)
+			cand = cand[proj.argmax ():]
+		m = int (cand[0])
+		pm = pts.point (m)
+
+		# step 5: P1[k] e' o ponto mais a esquerda do par k
+		h = n//2
+		troca = x[S[0:2*h:2]] >= x[S[1:2*h:2]]
+		P1 = np.where (troca, S[1:2*h:2], S[0:2*h:2])
+		P2 = np.where (troca, S[0:2*h:2], S[1:2*h:2])
+		esq = x[P2] <= pm.x
+		dir = ~esq & (pm.x <= x[P1])
+		meio = ~esq & ~dir
+		# um par de um lado de pm perde o ponto mais perto dele se o
+		# outro estiver do lado de fora da reta que passa por pm e por ele
+		lados = esq | dir
+		B = np.where (esq, P2, P1)[lados]
+		C = np.where (esq, P1, P2)[lados]
+		fora = np.zeros (h, dtype=bool)
+		fora[lados] = lado * prim.area2_pairs (pm, pts.take (B), pts.take (C)) > 0
+		resto = S[2*h:]
+		S1 = np.concatenate ((P1[esq | meio], P2[esq & fora], resto))
+		S2 = np.concatenate ((P2[dir | meio], P1[dir & ~fora], resto))
+
+		# step 6
+		L, R = (b, a) if lado == 1 else (a, b)
+		S1 = S1[lado * prim.area2_many (pts.point (L), pm, pts.take (S1)) > 0]
+		S2 = S2[lado * prim.area2_many (pm, pts.point (R), pts.take (S2)) > 0]
+
+		# step 7
+		Sa, Sb = (S2, S1) if lado == 1 else (S1, S2)
+		pilha.append ((m, b, Sb))
+		pilha.append ((a, m, Sa))
+	return fecho
+
+def bhatta_sen_indices (pts):
+	"""Indices (em pts) dos vertices do fecho convexo do PointArray pts,
+	em ordem anti-horaria (sem desenho)"""
+	if len (pts) == 0: return []
+	x, y = pts.x, pts.y
+	dirs = [ extreme_index (-y, x), extreme_index (x, y),
+	         extreme_index (y, x), extreme_index (-x, y) ]
+
+	livres = np.arange (len (pts))
+	fecho = []
+	for i in range (0, len (dirs)):
+		j = (i+1) % 4
+		if dirs[i] == dirs[j]:
+			continue
+		a = dirs[i]
+		b = dirs[j]
+		d = prim.area2_many (pts.point (a), pts.point (b), pts.take (livres)) < 0
+		# south -> east e west -> south: parte inferior
+		lado = -1 if i == 0 or i == 3 else 1
+		fecho.extend (bhatta_sen_array_iter (pts, a, b, livres[d], lado))
+		livres = livres[~d]
+	if len (fecho) == 0:
+		fecho = [ dirs[0] ]
+	return fecho
+
+def bhatta_sen_array (pts):
+	"Bhattacharya e Sen sobre um PointArray (sem desenho)"
+	if len (pts) == 0: return None
+	fecho = bhatta_sen_indices (pts)
+	hull = Polygon (pts.to_points (fecho))
+	hull.extra_info = 'vertices: %d'%len (fecho)
+	return hull
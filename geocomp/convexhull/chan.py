@@ -3,15 +3,28 @@
 Optimal Output-Sensitive Convex Hull Algorithms in Two and Three Dimensions
    Discrete & Computational Geometry, volume 16,1996
 url = "citeseer.nj.nec.com/article/chan96optimal.html"
+
+Cada mini-fecho e' guardado tambem como uma lista (de python) com os
+seus vertices em sentido anti-horario, e a tangente de um ponto a ele
+e' achada por busca binaria nessa lista, em O(log m).
+
+Quando uma rodada falha (o fecho tem mais de m vertices), a proxima,
+com m ao quadrado, nao recalcula os mini-fechos a partir dos pontos:
+cada novo mini-fecho e' o fecho dos vertices dos m mini-fechos antigos
+que ele junta. So' o embrulho da rodada que falhou e' perdido; o numero
+de operacoes gastas nele aparece em extra_info.
 """
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import as_points
 from geocomp.common import control
+from geocomp.common import prim
 from geocomp.common.guiprim import *
 from geocomp.convexhull.graham import Graham
 
 
 def Chan (l):
+	l = sem_repetidos (as_points (l))
 	n = len (l)
 	if n == 0: return None
 	if n == 1 or n == 2:
@@ -20,100 +33,154 @@ def Chan (l):
 		ret.extra_info = 'vertices: %d'%n
 		return ret
 
+	CHs = [ [ p ] for p in l ]
+	poligonos = None
+	m = 1
+	perdido = 0
+	rodadas = 0
 	i = 2
 	while 1:
 		H = min (1<< (1<<i), n)
+		poligonos, CHs = junta_fechos (CHs, H // m if H < n else len (CHs))
 		m = H
-		ch = Hull2D (l, m, H)
-		#print ch
-		if ch != None: 
-			ch.extra_info = 'vertices: %d'%len (ch.to_list ())
+		rodadas = rodadas + 1
+		antes = prim.get_count ()
+		ch = Hull2D (poligonos, CHs, H)
+		if ch != None:
+			ch.extra_info = 'vertices: %d, rodadas: %d, operacoes perdidas: %d' \
+			                %(len (ch.to_list ()), rodadas, perdido)
 			return ch
+		perdido = perdido + prim.get_count () - antes
 		i = i + 1
 
-def Hull2D (P, m, H):
+def sem_repetidos (l):
+	"""Lista com os pontos de l sem repeticoes (fica o primeiro de cada
+	par de coordenadas); o embrulho identifica os pontos por identidade"""
+	vistos = set ()
+	unicos = []
+	for p in l:
+		if (p.x, p.y) not in vistos:
+			vistos.add ((p.x, p.y))
+			unicos.append (p)
+	return unicos
 
-	#print m, H
-	lines = []
-	n = len (P)
-	CHs = []
-	num = n/m
-
-	a = 0
-	while a < n:
-		b = min (a+m, n)
-		l = P[a:b]
+def junta_fechos (CHs, k):
+	"""Junta cada k mini-fechos consecutivos de CHs (listas de vertices)
+	num so', o fecho (calculado por Graham) dos seus vertices
+
+	Retorna os novos mini-fechos como Polygon e como listas de vertices"""
+	poligonos = []
+	novos = []
+	for a in range (0, len (CHs), k):
+		l = []
+		for ch in CHs[a:a+k]: l.extend (ch)
 		ids = []
 		for p in l: ids.append (p.hilight ())
-		ch = Graham (l)
-		#ch.hide ()
-		for p in P[a:b]: p.unhilight (ids.pop ())
-		CHs.append (ch)
-		a = b
-
-	i0 = 0
-	# encontrando o ponto mais a direita
-	p0 = CHs[0].pts
+		ch = Graham (l[:])
+		for p, i in zip (l, ids): p.unhilight (i)
+		ch.hide ()
+		poligonos.append (ch)
+		novos.append (ch.to_list ())
+	return poligonos, novos
+
+def melhor (q, p, r):
+	"""Dos candidatos p e r a proximo vertice do fecho depois de q,
+	retorna o que deixa o outro a esquerda (ou o mais distante, se q, p
+	e r sao colineares)"""
+	direction = area2 (q, p, r)
+	if direction < 0:
+		return r
+	if direction == 0 and dist2 (q, p) < dist2 (q, r):
+		return r
+	return p
+
+def tangente (q, V, pos):
+	"""Vertice r do fecho V (lista em sentido anti-horario) tal que
+	todos os vertices de V estao a esquerda da reta q->r ou sobre ela
+	(o mais distante de q, se houver mais de um)
+
+	q e' um vertice do fecho de todos os pontos; pos e' a posicao de q
+	em V, ou None se q nao esta em V (e entao q esta fora de V)."""
+	n = len (V)
+	if pos is not None:
+		return V[(pos + 1) % n]
+	if n <= 3:
+		r = V[0]
+		for p in V[1:]:
+			r = melhor (q, r, p)
+		return r
+
+	# Vistos de q, os angulos dos vertices crescem (sentido anti-horario)
+	# do menor ao maior e depois decrescem. Queremos o primeiro vertice
+	# de um trecho crescente: desce (i-1) e nao desce (i).
+	def desce (i):
+		return area2 (q, V[i], V[(i+1) % n]) <= 0
+
+	d0 = desce (0)
+	if not d0 and desce (n-1):
+		return V[0]
+	lo = 1
+	hi = n - 1
+	while lo < hi:
+		c = (lo + hi) // 2
+		dc = desce (c)
+		# area2 (q, V[0], V[c]) > 0: o angulo de V[c] e' maior que o de V[0]
+		if not d0:
+			if dc or area2 (q, V[0], V[c]) > 0: lo = c + 1
+			else: hi = c
+		else:
+			if not dc or area2 (q, V[0], V[c]) > 0: hi = c
+			else: lo = c + 1
+	return V[lo]
+
+def Hull2D (poligonos, CHs, H):
+	"""Embrulho de presente sobre os mini-fechos de CHs (listas de
+	vertices; poligonos sao os mesmos mini-fechos, para desenhar).
+	Retorna o fecho, ou None se ele tem mais de H vertices"""
+	lines = []
+	onde = {}
+	for k in range (len (CHs)):
+		for i in range (len (CHs[k])):
+			onde[id (CHs[k][i])] = (k, i)
+
+	# o ponto mais a direita (o mais alto deles) esta no fecho
+	p0 = CHs[0][0]
 	for ch in CHs:
-		for p in ch.to_list ():
-			if p.x > p0.x: p0 = p
-			elif p.x == p0.x: 
-				if p.x > p0.x: p0 = p
-	
+		for p in ch:
+			if p.x > p0.x or (p.x == p0.x and p.y > p0.y): p0 = p
+
 	fecho = [ p0 ]
-	for ch in CHs: ch.hide ()
-	#control.sleep (2)
 	for k in range (0, H):
+		q = fecho[-1]
 		Q = []
-		for ch in CHs:
+		k_q, i_q = onde[id (q)]
+		for j in range (len (CHs)):
+			pos = i_q if k_q == j else None
+			if pos is not None and len (CHs[j]) == 1: continue
+			ch = poligonos[j]
 			ch.plot ()
-			p = ch.pts
-			initial = 1
-			while 1:
-				direction = area2 (fecho[-1], p, p.next)
-				if direction < 0:
-					p = p.next
-					initial = 0
-				elif direction == 0 \
-					and dist2 (fecho[-1], p) \
-					    < dist2 (fecho[-1], p.next):
-					p = p.next
-					initial = 0
-				elif initial:
-					p = p.next
-				else:
-					Q.append (p)
-					p.hilight ()
-					control.sleep ()
-					ch.pts = p.prev
-					ch.hide ()
-					break
-			
+			p = tangente (q, CHs[j], pos)
+			Q.append (p)
+			p.hilight ()
+			control.sleep ()
+			ch.hide ()
 
 		control.sleep ()
 		p = Q[0]
-		for q in Q[1:]:
-			direction = area2 (fecho[-1], p, q)
-			if direction < 0:
-				p = q
-			elif direction == 0:
-				if (dist2 (fecho[-1], p) < dist2 (fecho[-1], q)):
-					p = q
-
-		for q in Q: q.unhilight ()
-		lines.append (fecho[-1].lineto (p, 'green'))
+		for r in Q[1:]:
+			p = melhor (q, p, r)
+
+		for r in Q: r.unhilight ()
+		lines.append (q.lineto (p, 'green'))
 		fecho.append (p)
-		if p == p0: 
-			#for ch in CHs: ch.hide ()
-			#print 'fecho =',`fecho`
+		if p is p0:
 			fecho.pop ()
 			for i in lines:
 				control.plot_delete (i)
 			poly = Polygon (fecho)
 			poly.plot ()
 			return poly
-	
-	#for ch in CHs: ch.hide ()
+
 	for i in lines:
 		control.plot_delete (i)
 	return None
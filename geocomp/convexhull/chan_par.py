@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Algoritmo de Chan com os mini-fechos calculados em paralelo
+
+Em cada rodada de chan.Chan, os n/m mini-fechos sao independentes.
+Aqui eles sao divididos entre os processos de um
+geocomp.common.parallel.Pool, que enxergam as coordenadas dos pontos
+numa memoria compartilhada. Uma tarefa recebe so' os intervalos de
+indices dos seus grupos (na primeira rodada) ou os vetores de indices
+dos vertices dos mini-fechos que ela junta (nas seguintes), e devolve
+os vetores de indices dos vertices dos novos mini-fechos, calculados
+pela cadeia monotona. O embrulho (chan.Hull2D) continua no processo
+principal.
+
+O numero de processos vem de config.WORKERS (opcao -j de cligeocomp.py).
+Com um so' processo, sem NumPy ou quando o algoritmo e' desenhado,
+ChanPar simplesmente chama chan.Chan. As operacoes primitivas feitas
+pelos processos entram na contagem.
+"""
+
+from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common.parallel import Pool, pontos, processos
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.convexhull.chan import Chan, Hull2D, sem_repetidos
+from geocomp.convexhull.monotone import monotone_indices
+
+
+def _fechos (grupos):
+	"""Calcula (num processo do pool) os mini-fechos dos grupos, cada um
+	dado por um par (inicio, fim) de indices ou por um vetor de indices
+
+	Retorna a lista dos vetores de indices dos vertices de cada
+	mini-fecho"""
+	pts = pontos ()
+	tipo = np.int32 if len (pts) < 2**31 else np.int64
+	ret = []
+	for g in grupos:
+		if isinstance (g, tuple):
+			fecho = g[0] + monotone_indices (pts.take (slice (*g)))
+		else:
+			fecho = g[monotone_indices (pts.take (g))]
+		ret.append (fecho.astype (tipo))
+	return ret
+
+def em_paralelo (pool, grupos):
+	"Divide os grupos em ate' pool.k tarefas; retorna os mini-fechos, em ordem"
+	t = -(-len (grupos) // pool.k)
+	ret = []
+	for fechos in pool.map (_fechos, [ (grupos[a:a+t],) for a in range (0, len (grupos), t) ]):
+		ret.extend (fechos)
+	return ret
+
+def ChanPar (l):
+	"Algoritmo de Chan com os mini-fechos calculados por varios processos"
+	k = processos ()
+	if np is None or not control.skip or k <= 1:
+		return Chan (l)
+	return chan_paralelo (l, k)
+
+def chan_paralelo (l, k):
+	"""Algoritmo de Chan (sem desenho) com os mini-fechos calculados por
+	k processos (mesmo que k seja 1)"""
+	if isinstance (l, PointArray):
+		_, unicos = np.unique (l.coords (), axis=0, return_index=True)
+		pts = l.take (np.sort (unicos))
+		ponto = pts.point
+	else:
+		l = sem_repetidos (l)
+		pts = PointArray.from_points (l)
+		ponto = l.__getitem__
+	n = len (pts)
+	if n <= 2:
+		return Chan (pts.to_points ())
+
+	with Pool (pts, k) as pool:
+		ret = executa_rodadas (pool, n, ponto)
+	ret.extra_info = ret.extra_info + ', processos: %d'%k
+	return ret
+
+def executa_rodadas (pool, n, ponto):
+	"As rodadas de Chan, com os mini-fechos calculados no pool"
+	fechos = None
+	m = 1
+	perdido = 0
+	rodadas = 0
+	i = 2
+	while 1:
+		H = min (1<< (1<<i), n)
+		if fechos is None:
+			grupos = [ (a, min (a + H, n)) for a in range (0, n, H) ]
+		else:
+			j = H // m if H < n else len (fechos)
+			grupos = [ np.concatenate (fechos[a:a+j]) for a in range (0, len (fechos), j) ]
+		fechos = em_paralelo (pool, grupos)
+		m = H
+		rodadas = rodadas + 1
+
+		CHs = [ [ ponto (v) for v in f.tolist () ] for f in fechos ]
+		poligonos = [ Polygon (ch) for ch in CHs ]
+		antes = prim.get_count ()
+		ch = Hull2D (poligonos, CHs, H)
+		if ch != None:
+			ch.extra_info = 'vertices: %d, rodadas: %d, operacoes perdidas: %d' \
+			                %(len (ch.to_list ()), rodadas, perdido)
+			return ch
+		perdido = perdido + prim.get_count () - antes
+		i = i + 1
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+"""Fecho convexo dinamico (Overmars e van Leeuwen)
+
+DynamicHull mantem o fecho convexo de um conjunto de pontos que muda:
+insert (p) e delete (p) levam tempo O(log^3 n) (esperado) e hull ()
+devolve o fecho atual como um Polygon.
+
+Os pontos ficam numa arvore balanceada (uma treap) ordenada por (x, y).
+Cada no' guarda as cadeias inferior e superior do fecho dos pontos da
+sua sub-arvore. A cadeia de um no' e' a concatenacao de um prefixo da
+cadeia do filho esquerdo com um sufixo da do filho direito, ligados
+por uma ponte (com o ponto do proprio no' no meio). Para que essa
+concatenacao nao custe O(n), as cadeias sao treaps persistentes
+(nenhum no' e' alterado depois de criado; um corte ou uma juncao copia
+so' um caminho), e o pai compartilha quase tudo com os filhos.
+
+A ponte entre duas cadeias separadas (todos os pontos de uma vem antes
+dos da outra na ordem (x, y)) e' achada por uma busca binaria dentro de
+outra: para cada candidato a da cadeia da esquerda, a tangente de a a
+cadeia da direita sai de uma descida na treap, em O(log n). Cada
+insercao ou remocao recalcula as cadeias de O(log n) nos.
+
+A cadeia inferior vai do menor ao maior ponto virando sempre a
+esquerda; a superior, virando sempre a direita (como na cadeia
+monotona). Pontos no interior de arestas do fecho ficam de fora.
+"""
+
+from geocomp.common import rng
+
+from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import as_points
+from geocomp.common import prim
+
+
+# sentido das curvas em cada cadeia
+INFERIOR = 1
+SUPERIOR = -1
+
+
+class Cadeia:
+	"No' (imutavel) de uma treap persistente com os vertices de uma cadeia"
+
+	__slots__ = ('p', 'prio', 'left', 'right', 'size', 'first', 'last')
+
+	def __init__ (self, p, prio, left, right):
+		self.p = p
+		self.prio = prio
+		self.left = left
+		self.right = right
+		self.size = 1
+		self.first = self.last = p
+		if left is not None:
+			self.size = self.size + left.size
+			self.first = left.first
+		if right is not None:
+			self.size = self.size + right.size
+			self.last = right.last
+
+def cadeia_junta (a, b):
+	"Concatena as cadeias a e b (criando so' os nos de um caminho)"
+	if a is None: return b
+	if b is None: return a
+	if a.prio > b.prio:
+		return Cadeia (a.p, a.prio, a.left, cadeia_junta (a.right, b))
+	return Cadeia (b.p, b.prio, cadeia_junta (a, b.left), b.right)
+
+def cadeia_corta (c, k):
+	"Retorna o par (k primeiros vertices de c, resto de c)"
+	if c is None: return None, None
+	n = 0 if c.left is None else c.left.size
+	if k <= n:
+		a, b = cadeia_corta (c.left, k)
+		return a, Cadeia (c.p, c.prio, b, c.right)
+	a, b = cadeia_corta (c.right, k - n - 1)
+	return Cadeia (c.p, c.prio, c.left, a), b
+
+def cadeia_lista (c, l = None):
+	"Lista com os vertices de c, em ordem"
+	if l is None: l = []
+	if c is not None:
+		cadeia_lista (c.left, l)
+		l.append (c.p)
+		cadeia_lista (c.right, l)
+	return l
+
+def tangente (q, c, lado):
+	"""Tangente de q (que vem antes de todos os pontos de c) a cadeia c
+
+	Retorna (j, r): r e' o vertice de tangencia e j, sua posicao em c.
+	Havendo varios vertices na reta tangente, fica o ultimo."""
+	no = c
+	base = 0
+	seguinte = None
+	j = r = None
+	while no is not None:
+		i = base + (0 if no.left is None else no.left.size)
+		prox = seguinte if no.right is None else no.right.first
+		if prox is not None and lado * prim.area2 (q, no.p, prox) <= 0:
+			base = i + 1
+			no = no.right
+		else:
+			j, r = i, no.p
+			seguinte = no.p
+			no = no.left
+	return j, r
+
+def ponte (a, b, lado):
+	"""Ponte entre as cadeias a e b (todos os pontos de a vem antes dos
+	de b)
+
+	Retorna (i, j): a cadeia da uniao e' formada pelos vertices de a
+	ate' a posicao i, seguidos pelos de b a partir da posicao j."""
+	no = a
+	base = 0
+	seguinte = None
+	achou = None
+	while no is not None:
+		i = base + (0 if no.left is None else no.left.size)
+		j, r = tangente (no.p, b, lado)
+		prox = seguinte if no.right is None else no.right.first
+		if prox is not None and lado * prim.area2 (no.p, r, prox) < 0:
+			base = i + 1
+			no = no.right
+		else:
+			achou = (i, j)
+			seguinte = no.p
+			no = no.left
+	return achou
+
+def une (a, b, lado):
+	"Cadeia do fecho da uniao das cadeias a e b (a antes de b)"
+	if a is None: return b
+	if b is None: return a
+	i, j = ponte (a, b, lado)
+	return cadeia_junta (cadeia_corta (a, i + 1)[0], cadeia_corta (b, j)[1])
+
+
+class No:
+	"No' da arvore dos pontos, com as cadeias da sua sub-arvore"
+
+	__slots__ = ('key', 'p', 'prio', 'left', 'right', 'inferior', 'superior')
+
+	def __init__ (self, p):
+		self.key = (p.x, p.y)
+		self.p = p
+		self.prio = rng.random ()
+		self.left = self.right = None
+		self.atualiza ()
+
+	def atualiza (self):
+		"Recalcula as cadeias a partir das dos filhos"
+		for lado, nome in ((INFERIOR, 'inferior'), (SUPERIOR, 'superior')):
+			c = Cadeia (self.p, self.prio, None, None)
+			if self.left is not None:
+				c = une (getattr (self.left, nome), c, lado)
+			if self.right is not None:
+				c = une (c, getattr (self.right, nome), lado)
+			setattr (self, nome, c)
+
+def junta (a, b):
+	"Junta as arvores a e b (todas as chaves de a menores que as de b)"
+	if a is None: return b
+	if b is None: return a
+	if a.prio > b.prio:
+		a.right = junta (a.right, b)
+		a.atualiza ()
+		return a
+	b.left = junta (a, b.left)
+	b.atualiza ()
+	return b
+
+def corta (no, key):
+	"Retorna o par (chaves < key, chaves > key) (key nao esta' na arvore)"
+	if no is None: return None, None
+	if no.key < key:
+		a, b = corta (no.right, key)
+		no.right = a
+		no.atualiza ()
+		return no, b
+	a, b = corta (no.left, key)
+	no.left = b
+	no.atualiza ()
+	return a, no
+
+def insere (no, novo):
+	"Insere o no' novo na arvore no; retorna a nova raiz"
+	if no is None: return novo
+	if novo.prio > no.prio:
+		novo.left, novo.right = corta (no, novo.key)
+		novo.atualiza ()
+		return novo
+	if novo.key < no.key:
+		no.left = insere (no.left, novo)
+	else:
+		no.right = insere (no.right, novo)
+	no.atualiza ()
+	return no
+
+def remove (no, key):
+	"Remove o no' com a chave key da arvore no; retorna a nova raiz"
+	if no.key == key:
+		return junta (no.left, no.right)
+	if key < no.key:
+		no.left = remove (no.left, key)
+	else:
+		no.right = remove (no.right, key)
+	no.atualiza ()
+	return no
+
+def monta (nos):
+	"""Monta a arvore com os nos da lista nos (ordenada pela chave) em
+	tempo linear, calculando as cadeias de cada no' uma unica vez"""
+	# pilha: o caminho mais a direita da arvore (cada no' e' o filho
+	# direito do anterior); um no' so' e' calculado ao sair da pilha
+	pilha = []
+	for no in nos:
+		ultimo = None
+		while len (pilha) > 0 and pilha[-1].prio < no.prio:
+			ultimo = pilha.pop ()
+			ultimo.atualiza ()
+			if len (pilha) > 0 and pilha[-1].prio < no.prio:
+				pilha[-1].right = ultimo
+		no.left = ultimo
+		pilha.append (no)
+	while len (pilha) > 1:
+		ultimo = pilha.pop ()
+		ultimo.atualiza ()
+		pilha[-1].right = ultimo
+	if len (pilha) == 0: return None
+	pilha[0].atualiza ()
+	return pilha[0]
+
+
+class DynamicHull:
+	"""Fecho convexo de um conjunto de pontos que muda
+
+	Pontos repetidos (mesmas coordenadas) podem ser inseridos; o ponto
+	so' sai do conjunto quando todas as suas copias forem removidas."""
+
+	def __init__ (self, pontos = ()):
+		self.copias = {}
+		nos = []
+		for p in sorted (pontos, key=lambda p: (p.x, p.y)):
+			key = (p.x, p.y)
+			if key in self.copias:
+				self.copias[key].append (p)
+			else:
+				self.copias[key] = [ p ]
+				nos.append (No (p))
+		self.raiz = monta (nos)
+
+	def __len__ (self):
+		return sum (len (c) for c in self.copias.values ())
+
+	def __contains__ (self, p):
+		return (p.x, p.y) in self.copias
+
+	def insert (self, p):
+		"Insere o ponto p"
+		key = (p.x, p.y)
+		if key in self.copias:
+			self.copias[key].append (p)
+			return
+		self.copias[key] = [ p ]
+		self.raiz = insere (self.raiz, No (p))
+
+	def delete (self, p):
+		"""Remove o ponto p (ou uma copia dele)
+
+		Gera KeyError se nao houver ponto com as coordenadas de p."""
+		key = (p.x, p.y)
+		copias = self.copias[key]
+		# a copia que e' o proprio p (Point.__eq__ so' compara as
+		# coordenadas); se nenhuma for, sai a mais recente
+		k = next ((i for i, c in enumerate (copias) if c is p), len (copias) - 1)
+		del copias[k]
+		if len (copias) > 0:
+			return
+		del self.copias[key]
+		self.raiz = remove (self.raiz, key)
+
+	def vertices (self):
+		"""Lista com os vertices do fecho, em sentido anti-horario
+
+		De cada ponto repetido, aparece a copia mais antiga que ainda
+		esta' no conjunto."""
+		if self.raiz is None: return []
+		inferior = cadeia_lista (self.raiz.inferior)
+		superior = cadeia_lista (self.raiz.superior)
+		return [ self.copias[(p.x, p.y)][0] for p in inferior + superior[-2:0:-1] ]
+
+	def hull (self):
+		"O fecho atual, como um Polygon (ou None, se nao ha' pontos)"
+		v = self.vertices ()
+		if len (v) == 0: return None
+		hull = Polygon (v)
+		hull.extra_info = 'vertices: %d'%len (v)
+		return hull
+
+
+def Dynamic (l):
+	"""Fecho convexo da lista de pontos l com um DynamicHull
+
+	A arvore e' montada de uma vez com todos os pontos (ordenados por
+	(x, y)) por monta, sem passar por insert."""
+	l = as_points (l)
+	if len (l) == 0: return None
+	hull = DynamicHull (l).hull ()
+	hull.plot ()
+	return hull
@@ -2,11 +2,19 @@
 """Algoritmo Embrulho para Presente"""
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, np
 from geocomp.common import control
+from geocomp.common import prim
 from geocomp.common.guiprim import *
 
 def Gift (l):
-	"Algoritmo Embrulho para Presente para encontrar o fecho convexo de uma lista l de pontos"
+	"""Algoritmo Embrulho para Presente para encontrar o fecho convexo de uma lista l de pontos
+
+	Com um PointArray, usa a versao vetorizada (gift_indices). Uma
+	lista sempre passa pelo laco classico, de modo que o numero de
+	operacoes e' o mesmo com e sem desenho."""
+	if isinstance (l, PointArray):
+		return gift_array (l)
 
 	# achando ponto mais baixo
 	i0 = 0
@@ -42,3 +50,128 @@ def Gift (l):
 	ch = Polygon (fecho)
 	ch.extra_info = 'vertices: %d'%len (fecho)
 	return ch
+
+# numero de pontos tratados de cada vez por passo_array (para que os
+# vetores intermediarios caibam no cache)
+LOTE = 1 << 15
+
+def gift_array (pts):
+	"Embrulho para presente sobre um PointArray (sem desenho)"
+	if len (pts) == 0: return None
+	fecho = gift_indices (pts)
+	ch = Polygon (pts.to_points (fecho))
+	ch.extra_info = 'vertices: %d'%len (fecho)
+	return ch
+
+def gift_indices (pts):
+	"""Indices (em pts, um PointArray nao vazio) dos vertices do fecho,
+	em ordem anti-horaria, pelo embrulho para presente
+
+	Cada passo e' uma unica passada, em lotes, sobre os pontos
+	(passo_array): ela escolhe o proximo vertice por um arg-max e, com
+	area2 exata, confere a aresta escolhida no passo anterior. Entre os
+	pontos colineares com uma aresta, fica o mais distante, como em
+	Gift."""
+	n = len (pts)
+	i0 = pts.lowest ()
+	fecho = [ i0 ]
+	p = pts.point (i0)
+	# o ponto mais baixo nao tem aresta anterior (ver passo_array)
+	q = None
+	while 1:
+		errado, frente, r = passo_array (pts, q, p)
+		if errado:
+			# algum ponto esta a direita de q -> p (q nao e' None: nenhum
+			# ponto fica abaixo de i0)
+			fecho[-1] = gira (pts, q, fecho[-1])
+		elif frente is not None:
+			# p nao e' o ponto mais distante de q na aresta
+			fecho[-1] = frente
+		elif fecho[-1] == i0 and len (fecho) > 1:
+			# a ultima aresta (ate' i0) foi conferida
+			fecho.pop ()
+			break
+		elif r is None or len (fecho) > n:
+			break
+		else:
+			fecho.append (r)
+			q = p
+		p = pts.point (fecho[-1])
+	return fecho
+
+def passo_array (pts, q, p):
+	"""Um passo do embrulho a partir da aresta q -> p (que deveria ser
+	uma aresta do fecho com todos os pontos a esquerda ou sobre ela)
+
+	Se q e' None, p e' o ponto mais baixo e a direcao da aresta anterior
+	e' (1, 0); ela e' usada diretamente, sem criar um ponto falso a
+	esquerda de p (que, com coordenadas enormes, se arredondaria para
+	o proprio p).
+
+	Retorna (errado, frente, r). errado e' verdadeiro se algum ponto
+	esta estritamente a direita de q -> p; senao, frente e' o indice do
+	ponto mais distante, na mesma reta, depois de p, ou None se nao ha
+	nenhum. Nesses dois casos r nao vale nada. Senao, r e' o candidato a
+	vertice seguinte (None se todos os pontos sao iguais a p).
+
+	Com v = s - p escrito nas coordenadas da aresta q -> p (dot ao longo
+	dela, cross na perpendicular), o giro de p ate' s cresce com o
+	pseudo-angulo -dot / (|dot| + cross), e r e' o arg-max de
+	dot / (|dot| + cross). Como essa conta e' feita em ponto flutuante, r
+	pode nao ser o vertice certo; o proximo passo (a partir de p -> r)
+	confere isso com area2 exata."""
+	n = len (pts)
+	if q is None:
+		dx, dy = 1, 0
+	else:
+		dx = p.x - q.x
+		dy = p.y - q.y
+	errado = False
+	frente = None
+	mais = 0
+	r = None
+	melhor = -2
+	for a in range (0, n, LOTE):
+		lote = pts.take (slice (a, a + LOTE))
+		if q is None:
+			# area2 em relacao a direcao (1, 0) a partir de p
+			prim.num_area2 = prim.num_area2 + len (lote)
+			cross = lote.y - p.y
+		else:
+			cross = prim.area2_many (q, p, lote)
+		if cross.min () < 0:
+			errado = True
+			break
+		dot = (lote.x - p.x) * dx + (lote.y - p.y) * dy
+		den = np.abs (dot) + cross
+		# den == 0 so' para as copias de p
+		with np.errstate (invalid='ignore', divide='ignore'):
+			chave = dot / den
+		chave[den == 0] = -2
+		k = int (chave.argmax ())
+		if chave[k] >= 1:
+			# pode haver pontos na reta de q -> p, depois de p
+			col = np.flatnonzero ((cross == 0) & (dot > 0))
+			if len (col) > 0:
+				c = col[dot[col].argmax ()]
+				if dot[c] > mais:
+					mais = dot[c]
+					frente = a + int (c)
+		if chave[k] > melhor and frente is None:
+			melhor = chave[k]
+			r = a + k
+	return errado, frente, r
+
+def gira (pts, q, j0):
+	"""Vertice seguinte a q no fecho, achado girando o candidato j0 no
+	sentido horario enquanto houver pontos a direita de q -> j0 (o mais
+	distante de q, entre os colineares)"""
+	while 1:
+		area = prim.area2_many (q, pts.point (j0), pts)
+		j = int (area.argmin ())
+		if area[j] >= 0:
+			break
+		j0 = j
+	col = (area == 0).nonzero ()[0]
+	dist = prim.dist2_many (q, pts.take (col))
+	return int (col[dist.argmax ()])
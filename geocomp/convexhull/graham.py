@@ -2,13 +2,15 @@
 """Algoritmo de Graham"""
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import as_points
 from geocomp.common import control
 from geocomp.common.guiprim import *
-from functools import cmp_to_key
+from geocomp.common import angular
 
 
 def Graham (l):
 	"Algoritmo de Graham para achar o fecho convexo de uma lista l de pontos"
+	l = as_points (l)
 
 	if len (l) == 0: return None
 
@@ -31,27 +33,9 @@ def Graham (l):
 
 	l.remove (p0)
 
-	def cmp (x, y, z = p0):
-		"""Funcao para ordenar os pontos ao redor de z
-
-		Usada com a funcao sort, ordena os pontos de uma lista
-		de acordo com o angulo que cada ponto forma com o ponto 
-		z e a reta horizontal. Em caso de empate, o ponto mais
-		distante aparece primeiro."""
-		area = area2 (z, x, y)
-		if area > 0:
-			return -1
-		elif area < 0:
-			return 1
-		else:
-			dist_z_x = dist2 (z, x)
-			dist_z_y = dist2 (z, y)
-			if dist_z_y < dist_z_x:
-				return -1
-			return dist_z_y > dist_z_x
-
-	# Ordena os pontos pelo seus angulos
-	l.sort (key=cmp_to_key(cmp))
+	# Ordena os pontos pelo seus angulos ao redor de p0. Em caso de
+	# empate, o ponto mais distante aparece primeiro.
+	l = angular.sort_around (p0, l, farthest_first=True)
 
 	# eliminando pontos colineares
 	l2 = [ l[0] ]
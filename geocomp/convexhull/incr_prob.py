@@ -1,9 +1,19 @@
 #!/usr/bin/env python
-"Algoritmo Incremental Probabilistico"
-
-import random
+"""Algoritmo Incremental Probabilistico
+
+Cada ponto ainda fora do fecho fica ligado, num grafo de conflitos, a
+aresta do fecho cruzada pelo segmento que vai dele ao baricento O do
+primeiro triangulo; cada aresta (identificada pelo seu vertice inicial)
+fica ligada aos pontos que a cruzam. Quando um ponto entra no fecho, so'
+os pontos ligados as arestas que somem sao reclassificados, e cada um
+deles muda de aresta em O(1). Com a ordem de insercao aleatoria (ver
+geocomp.common.rng), o consumo de tempo esperado e' O(n log n).
+"""
+
+from geocomp.common import rng
 from geocomp.common.point import Point
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import as_points
 from geocomp.common import control
 from geocomp.common.guiprim import *
 from geocomp import config
@@ -14,7 +24,9 @@ def intersect_restricted (a, b, c, d):
 
 	NAO FUNCIONA NO CASO GERAL:
 	Ela admite que left (c, d, b) == TRUE. Alem disso,
-	ela so' retorna verdadeiro se collinear (c, d, a) == FALSE"""
+	ela so' retorna verdadeiro se collinear (c, d, a) == FALSE.
+	Se ab passa por um vertice, so' a aresta que comeca nele
+	(c) e' intersectada, e nao a que termina nele (d)."""
 	a_x = min (a.x, b.x)
 	a_y = min (a.y, b.y)
 	b_x = max (a.x, b.x)
@@ -33,7 +45,7 @@ def intersect_restricted (a, b, c, d):
 	abd = area2 (a, b, d)
 	cda = area2 (c, d, a)
 
-	return (abd != 0) and (abc > 0) != (abd > 0) and not (cda >= 0)
+	return (abd != 0) and (abc == 0 or (abc > 0) != (abd > 0)) and not (cda >= 0)
 	
 	
 
@@ -58,15 +70,59 @@ def vertices_tangentes (intersect, p):
 	return tan
 
 	
-def classify (convex, points, start):
-	"Associa cada ponto em points a uma aresta visivel do triangulo convex"
+class Conflitos:
+	"""Grafo de conflitos entre os pontos fora do fecho e as arestas
+
+	aresta[id (p)] e' o vertice inicial da aresta ligada ao ponto p;
+	pontos[id (v)] e' um dicionario (indexado por id) com os pontos
+	ligados a aresta que comeca em v. Ligar, desligar ou mudar um ponto
+	de aresta custa O(1)."""
+
+	def __init__ (self):
+		self.aresta = {}
+		self.pontos = {}
+
+	def liga (self, p, v):
+		"Liga o ponto p a aresta que comeca em v"
+		self.aresta[id (p)] = v
+		self.pontos.setdefault (id (v), {})[id (p)] = p
+
+	def liga_todos (self, l, v):
+		"Liga todos os pontos de l a aresta que comeca em v (que nao tinha pontos)"
+		self.pontos[id (v)] = { id (p): p for p in l }
+		for p in l:
+			self.aresta[id (p)] = v
+
+	def desliga (self, p):
+		"Tira o ponto p do grafo; retorna o vertice da aresta a que estava ligado"
+		v = self.aresta.pop (id (p))
+		del self.pontos[id (v)][id (p)]
+		return v
+
+	def retira (self, v):
+		"""Tira a aresta que comeca em v do grafo; retorna a lista dos
+		pontos ligados a ela (que ficam sem aresta)"""
+		l = list (self.pontos.pop (id (v), {}).values ())
+		for p in l:
+			del self.aresta[id (p)]
+		return l
+
+	def fora (self, p):
+		"Verdadeiro se p esta ligado a alguma aresta (ou seja, fora do fecho)"
+		return id (p) in self.aresta
+
+	def __getitem__ (self, p):
+		"Vertice inicial da aresta ligada a p"
+		return self.aresta[id (p)]
+
+
+def classify (convex, points, start, G):
+	"""Liga cada ponto de points[start:] a uma aresta visivel do triangulo
+	convex, no grafo de conflitos G; retorna o baricento O do triangulo"""
 
 	first = convex.pts
 	second = first.next
 	third = second.next
-	first.L = []
-	second.L = []
-	third.L = []
 
 	# O e' um ponto dentro do fecho convexo (que ainda e' um triangulo)
 	Ox = (first.x + second.x + third.x) / 3.0
@@ -76,11 +132,8 @@ def classify (convex, points, start):
 
 	for i in range (start, len (points)):
 		for p in (first, second, third):
-			points[i].interior = 1
 			if intersect_restricted (points[i], O, p, p.next):
-				p.L.append (points[i])
-				points[i].intersect = p
-				points[i].interior = 0
+				G.liga (points[i], p)
 				points[i].lineto (p, config.COLOR_ALT1)
 				break
 	
@@ -89,21 +142,14 @@ def classify (convex, points, start):
 
 def IncrProb (l):
 	"Algoritmo incremental probabilistico para encontrar o fecho convexo"
+	l = as_points (l)
 
 	if len (l) == 0: return None
 
 	# Embaralhando o vetor de entrada
-	for i in range (len (l) -1, -1, -1):
-		index = int (random.uniform (0, i+1))
-		aux = l[i]
-		l[i] = l[index]
-		l[index] = aux
+	rng.shuffle (l)
 	
-	# Inicializando alguns campos...
-	for i in range (0, len(l)):
-		l[i].L = []
-		l[i].interior = 0
-		
+	G = Conflitos ()
 
 	# Criando um fecho convexo com 1 ponto
 	fecho = Polygon ([ l[0] ])
@@ -172,7 +218,7 @@ def IncrProb (l):
 			length = length + 1
 			fecho.pts = pts
 			fecho.plot ()
-			O = classify (fecho, l, k)
+			O = classify (fecho, l, k, G)
 			break
 
 	# Ja temos um fecho com 3 pontos -> basta cresce-lo
@@ -182,53 +228,40 @@ def IncrProb (l):
 		hi = l[k].hilight ()
 		control.thaw_update ()
 
-		if l[k].interior:
+		if not G.fora (l[k]):
 			control.sleep ()
 			continue
 
-		l[k].remove_lineto (l[k].intersect)
+		l[k].remove_lineto (G[l[k]])
 		control.sleep ()
 
-		tan = vertices_tangentes (l[k].intersect, l[k])
-
-		l[k].intersect.L.remove (l[k])
+		tan = vertices_tangentes (G.desliga (l[k]), l[k])
 
 		l0 = []
 		l1 = []
-		# atualizando a classificacao dos pontos
+		# atualizando a classificacao dos pontos ligados as arestas
+		#  entre tan[0] e tan[1], que vao sumir
 		vertex = tan[0]
 		while vertex != tan[1]:
-			for p in vertex.L:
-				id = p.hilight (config.COLOR_ALT3)
-				p.remove_lineto (p.intersect)
-
-				if p == l[k]:
-					p.unhilight (id)
-					continue
+			for p in G.retira (vertex):
+				hi_p = p.hilight (config.COLOR_ALT3)
+				p.remove_lineto (vertex)
 
 				if left (l[k], O, p):
-					if left_on (tan[0], l[k], p):
-						p.interior = 1
-						p.intersect = None
-					else:
-						p.intersect = tan[0]
-						p.lineto (p.intersect, config.COLOR_ALT1)
+					if not left_on (tan[0], l[k], p):
+						p.lineto (tan[0], config.COLOR_ALT1)
 						l0.append (p)
 				else:
-					if left_on (l[k], tan[1], p):
-						p.interior = 1
-						p.intersect = None
-					else:
-						p.intersect = l[k]
-						p.lineto (p.intersect, config.COLOR_ALT1)
+					if not left_on (l[k], tan[1], p):
+						p.lineto (l[k], config.COLOR_ALT1)
 						l1.append (p)
 
-				p.unhilight (id)
+				p.unhilight (hi_p)
 
 			vertex = vertex.next
 
-		tan[0].L = l0
-		l[k].L = l1
+		G.liga_todos (l0, tan[0])
+		G.liga_todos (l1, l[k])
 
 		# atualizando o fecho
 		control.freeze_update ()
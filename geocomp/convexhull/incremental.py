@@ -2,61 +2,57 @@
 "Algoritmo Incremental"
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.point import Point
+from geocomp.common import angular
+from geocomp.common.pointarray import as_points
 from geocomp.common import control
 from geocomp.common.guiprim import *
+from geocomp.point_visibility.binary_search_tree import BinarySearchTree
 
 
-def vertices_tangentes (Q, p):
-	"""retorna os dois vertices de tangencia de Q em relacao a p
+def vertices_tangentes (arvore, l, chave, p):
+	"""retorna os dois vertices de tangencia do fecho em relacao a p
 
-	Se existirem (i.e. se p estiver fora de Q), os vertices de tangencia
-	sao retornados em uma lista. Na posicao [0] dessa lista esta o vertice
-	"anterior" a p, e na posicao 1 o vertice "posterior" a p.
+	O fecho esta guardado em arvore (uma arvore rubro-negra), cujos
+	nos tem como chave a posicao (veja angular.angle_ranks) do angulo
+	de cada vertice ao redor de um ponto interior O e como id o indice
+	do vertice em l. chave e' a posicao do angulo de p.
 
-	Se p estiver dentro de Q, retorna uma lista vazia."""
+	O lado uv do fecho atravessado pela semi-reta de O para p e' achado
+	na arvore em O(log h): u e' o vertice de maior chave <= chave. p
+	esta fora do fecho se e so se esta a direita de uv; nesse caso, os
+	vertices de tangencia sao achados andando a partir de u para tras
+	e a partir de v para frente, ate' que p fique a esquerda. Os
+	vertices visitados no caminho deixam o fecho, entao o custo total
+	dessas caminhadas e' O(n).
 
-	tan = []
-	arestas = []
+	Se existirem (i.e. se p estiver fora do fecho), os vertices de
+	tangencia sao retornados em uma lista. Na posicao [0] dessa lista
+	esta o vertice "anterior" a p, e na posicao 1 o vertice "posterior"
+	a p. Se p estiver dentro do fecho, retorna uma lista vazia."""
 
-	pts = Q.pts
-	area_old = area2 (pts.prev, pts, p)
-	last = (area_old >= 0) # left_on
-	for pts in Q.to_list ():
-		prev = pts.prev
-		next = pts.next
-		cur = pts
+	no = arvore.floor (chave)
+	if not no:
+		no = arvore.maximum ()
+	u = l[no.id]
+	v = u.next
 
-		area = area2 (cur, next, p)
-
-		now = (area >= 0) # left_on
-		if last != now:
-			if area_old == 0: 
-				# novo ponto e' colinear c/ aresta anterior
-				#  --> pegamos verice mais distante
-				tan.append (prev)
-			elif area == 0:
-				# novo ponto e' colinear c/ proxima aresta
-				#  --> pegamos vertice mais distante
-				tan.append (next)
-			else:
-				tan.append (cur)
-		last = now
-		area_old = area
-
-	if len (tan) == 0:
+	if left_on (u, v, p):
 		return []
-	
-	if len (tan) != 2:
-		print('\n\n===> len (tan) != 0 e != 2 !!!!\n\n')
 
-	if right (tan[0], tan[1], p):
-		return [ tan[0], tan[1] ]
-	else:
-		return [ tan[1], tan[0] ]
+	# pontos colineares com um lado sao tratados como visiveis:
+	# ficamos com o vertice mais distante
+	while not left (u.prev, u, p):
+		u = u.prev
+	while not left (v, v.next, p):
+		v = v.next
+
+	return [ u, v ]
 	
 
 def Incremental (l):
 	"Algoritmo incremental para o problema do fecho convexo de uma lista de pontos"
+	l = as_points (l)
 
 	if len (l) == 0: return None
 
@@ -132,18 +128,41 @@ def Incremental (l):
 			break
 
 	# Ja tenho um fecho com 3 pontos -> basta "cresce-lo"
+	# Os vertices do fecho ficam tambem numa arvore, indexados pelo
+	# angulo ao redor de um ponto O dentro do triangulo inicial
+	# (e portanto dentro de todos os fechos seguintes).
+	if length == 3:
+		a = fecho.pts
+		b = a.next
+		c = b.next
+		O = Point ((a.x + b.x + c.x) / 3, (a.y + b.y + c.y) / 3)
+		chaves = angular.angle_ranks (O, l)
+		indice = {}
+		arvore = BinarySearchTree (check_invariants=False)
+		for i in range (k+1):
+			if l[i] is a or l[i] is b or l[i] is c:
+				indice[id (l[i])] = i
+				arvore.insert (i, chaves[i])
+
 	for k in range (k+1, len (l)):
 		pts = fecho.pts
 		l[k-1].unhilight (hi)
 		hi = l[k].hilight ()
 		control.thaw_update ()
 
-		tan = vertices_tangentes (fecho, l[k])
+		tan = vertices_tangentes (arvore, l, chaves[k], l[k])
 		# l[k] esta fora do fecho atual <=> len (tan) == 2
 		if len (tan) == 2:
 			control.freeze_update ()
 			fecho.hide ()
 
+			w = tan[0].next
+			while w is not tan[1]:
+				arvore.delete (indice.pop (id (w)))
+				w = w.next
+			indice[id (l[k])] = k
+			arvore.insert (k, chaves[k])
+
 			tan[0].next.prev = None
 			tan[0].next = l[k]
 			l[k].prev = tan[0]
@@ -3,56 +3,71 @@
 """Algoritmo Merge Hull"""
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import as_points
 from geocomp.common import control
 from geocomp.common.guiprim import *
-from functools import cmp_to_key
+from geocomp.common import prim
+
+# numero maximo de pontos de cada bloco inicial (cujo fecho e' calculado
+# diretamente, pela cadeia monotona)
+BLOCO = 8
 
 def Mergehull (l):
-	"""Algoritmo Merge Hull para o problema do Fecho Convexo"""
+	"""Algoritmo Merge Hull para o problema do Fecho Convexo
+
+	Versao de baixo para cima, sem recursao: os pontos, ordenados por
+	(x, y), sao divididos em blocos de ate' BLOCO pontos, e os fechos
+	vizinhos sao juntados dois a dois, em rodadas, ate' sobrar um so'.
+	Sem desenho, os fechos sao listas de indices (veja mergehull_idx);
+	com desenho, sao Polygon, e as tangentes sao mostradas como antes."""
+	l = as_points (l)
 	if len (l) == 0: return None
-	
-	def cmp (a, b):
-		if a.x < b.x: return -1
-		if a.x > b.x: return 1
-		if a.y < b.y: return -1
-		return a.y > b.y
-	
-	l.sort (key=cmp_to_key(cmp))
 
-	(min_pt, max_pt, hull) = mergehull_rec (l)
+	l.sort (key=lambda p: (p.x, p.y))
+	unicos = [ l[0] ]
+	for p in l[1:]:
+		if p.x != unicos[-1].x or p.y != unicos[-1].y:
+			unicos.append (p)
+	l = unicos
+
+	x = [ p.x for p in l ]
+	y = [ p.y for p in l ]
+	if control.skip:
+		lista, maior = mergehull_idx (x, y, 0, len (l))
+		hull = Polygon ([ l[i] for i in lista ])
+	else:
+		fechos = []
+		for a in range (0, len (l), BLOCO):
+			lista, maior = fecho_bloco (x, y, a, min (a + BLOCO, len (l)))
+			pol = Polygon ([ l[i] for i in lista ])
+			pol.plot ()
+			fechos.append ((l[lista[0]], l[lista[maior]], pol))
+		while len (fechos) > 1:
+			fechos = rodada (fechos, junta)
+		hull = fechos[0][2]
 
 	hull.extra_info = 'vertices: %d'%len (hull.to_list ())
 	return hull
 
-def mergehull_rec (l):
-	"""Funcao recursiva que implementa o Merge Hull
-
-	Retorna os pontos com coordenada x minima e maxima do fecho convexo
-	encontrado, alem do proprio fecho.
-	"""
-	n = len (l)
-	if n == 1:
-		#l[0].prev = l[0].next = l[0]
-		pol = Polygon ( [ l[0] ] )
-		pol.plot ()
-		#control.sleep ()
-		return (l[0], l[0], pol)
-	
-	# Divisao
-	l1 = l[:n//2]
-	l2 = l[n//2:]
-
-	id = control.plot_vert_line ((l2[0].x + l1[-1].x) / 2.)
-	control.sleep ()
-
-	# Conquista
-	ch1 = mergehull_rec (l1)
-
-	ch2 = mergehull_rec (l2)
-
+def rodada (fechos, junta):
+	"""Junta, com a funcao junta, os fechos vizinhos da lista fechos dois
+	a dois; retorna a lista dos novos fechos"""
+	novos = []
+	for i in range (0, len (fechos) - 1, 2):
+		novos.append (junta (fechos[i], fechos[i+1]))
+	if len (fechos) % 2 == 1:
+		novos.append (fechos[-1])
+	return novos
+
+def junta (ch1, ch2):
+	"""Junta (desenhando) os fechos ch1 e ch2, dados como triplas (menor
+	ponto, maior ponto, Polygon); todos os pontos de ch1 vem antes dos
+	de ch2. Retorna a tripla do novo fecho."""
 	v = ch1[1]
 	u = ch2[0]
 
+	id = control.plot_vert_line ((u.x + v.x) / 2.)
+	control.sleep ()
 	control.plot_delete (id)
 
 	# Combinar
@@ -159,31 +174,147 @@ def inferior_tangent (v, u):
 	return (v, u)
 	
 
-def is_tan (a, b, c, d, e, f):
-	"Funcao generica usada pelas funcoes is_{sup,inf}_tan_ch{1,2}"
-	if f (a, b, c): return 1
+# lado do teste de tangencia: c a esquerda ou a direita de ab
+ESQUERDA = 1
+DIREITA = -1
+
+def is_tan (a, b, c, d, e, lado):
+	"""Funcao generica usada pelas funcoes is_{sup,inf}_tan_ch{1,2}
+
+	Uma unica chamada de area2 decide o lado de c e se a, b e c sao
+	colineares (como em is_tan_idx, de modo que as duas versoes contam
+	as mesmas operacoes)"""
+	area = area2 (a, b, c)
+	if lado * area > 0: return 1
 	if d: return 0
-	if not collinear (a, b, c): return 0
+	if area != 0: return 0
 	if dist2 (e, c) > dist2 (b, a): return 0
 	return 1
 
 def is_sup_tan_ch1 (v, u):
 	"Retorna verdadeiro se vu tangente superior ao poligono que contem v"
 	if v == v.next: return 1
-	return is_tan (v, u, v.next, v != v.next.next, u, right)
+	return is_tan (v, u, v.next, v != v.next.next, u, DIREITA)
 
 def is_sup_tan_ch2 (v, u):
 	"Retorna verdadeiro se vu tangente superior ao poligono que contem u"
 	if u == u.next: return 1
-	return is_tan (v, u, u.prev, u != u.prev.prev, v, right)
+	return is_tan (v, u, u.prev, u != u.prev.prev, v, DIREITA)
 
 def is_inf_tan_ch1 (v, u):
 	"Retorna verdadeiro se vu tangente inferior ao poligono que contem v"
 	if v == v.next: return 1
-	return is_tan (v, u, v.prev, v != v.prev.prev, u, left)
+	return is_tan (v, u, v.prev, v != v.prev.prev, u, ESQUERDA)
 
 def is_inf_tan_ch2 (v, u):
 	"Retorna verdadeiro se vu tangente inferior ao poligono que contem u"
 	if u == u.next: return 1
-	return is_tan (v, u, u.next, u != u.next.next, v, left)
+	return is_tan (v, u, u.next, u != u.next.next, v, ESQUERDA)
+
+
+# Versoes sem desenho, para fechos dados como listas de indices (em
+# sentido anti-horario, comecando pelo menor ponto) de pontos cujas
+# coordenadas estao nas listas x e y, ordenados por (x, y). Um fecho e'
+# um par (lista, posicao do maior ponto na lista).
+
+def is_tan_idx (x, y, a, b, c, d, e, lado):
+	"Versao de is_tan para indices (lado: ESQUERDA ou DIREITA)"
+	area = prim.area2_idx (x, y, a, b, c)
+	if lado * area > 0: return 1
+	if d: return 0
+	if area != 0: return 0
+	if prim.dist2_idx (x, y, e, c) > prim.dist2_idx (x, y, b, a): return 0
+	return 1
+
+def superior_tangent_idx (x, y, L, v, R, u):
+	"""Versao de superior_tangent para fechos dados por listas de
+	indices: v e u sao posicoes em L e em R. Retorna o par de posicoes"""
+	nL = len (L)
+	nR = len (R)
+
+	def ch1 (v, u):
+		return nL == 1 or is_tan_idx (x, y, L[v], R[u], L[(v+1) % nL], nL != 2, R[u], DIREITA)
+
+	def ch2 (v, u):
+		return nR == 1 or is_tan_idx (x, y, L[v], R[u], R[(u-1) % nR], nR != 2, L[v], DIREITA)
+
+	c1 = ch1 (v, u)
+	c2 = ch2 (v, u)
+	while not (c1 and c2):
+		while not c1:
+			v = (v + 1) % nL
+			c1 = ch1 (v, u)
+		c2 = ch2 (v, u)
+		while not c2:
+			u = (u - 1) % nR
+			c2 = ch2 (v, u)
+		c1 = ch1 (v, u)
+	return (v, u)
+
+def inferior_tangent_idx (x, y, L, v, R, u):
+	"Versao de inferior_tangent para fechos dados por listas de indices"
+	nL = len (L)
+	nR = len (R)
+
+	def ch1 (v, u):
+		return nL == 1 or is_tan_idx (x, y, L[v], R[u], L[(v-1) % nL], nL != 2, R[u], ESQUERDA)
+
+	def ch2 (v, u):
+		return nR == 1 or is_tan_idx (x, y, L[v], R[u], R[(u+1) % nR], nR != 2, L[v], ESQUERDA)
+
+	c1 = ch1 (v, u)
+	c2 = ch2 (v, u)
+	while not (c1 and c2):
+		while not c1:
+			v = (v - 1) % nL
+			c1 = ch1 (v, u)
+		c2 = ch2 (v, u)
+		while not c2:
+			u = (u + 1) % nR
+			c2 = ch2 (v, u)
+		c1 = ch1 (v, u)
+	return (v, u)
 
+def junta_idx (x, y, ch1, ch2):
+	"""Junta os fechos ch1 e ch2 (todos os pontos de ch1 antes dos de
+	ch2), como em junta; retorna o novo fecho"""
+	L, maxL = ch1
+	R, maxR = ch2
+	sv, su = superior_tangent_idx (x, y, L, maxL, R, 0)
+	iv, iu = inferior_tangent_idx (x, y, L, maxL, R, 0)
+
+	# de sv ate' iv em L, de iu ate' su em R (sentido anti-horario)
+	if sv <= iv: esq = L[sv:iv+1]
+	else: esq = L[sv:] + L[:iv+1]
+	if iu <= su: dir = R[iu:su+1]
+	else: dir = R[iu:] + R[:su+1]
+
+	# o menor ponto (L[0]) esta' em esq; a lista comeca por ele
+	r = (len (L) - sv) % len (L)
+	lista = esq[r:] + dir + esq[:r]
+	return (lista, len (esq) - r + (maxR - iu) % len (R))
+
+def fecho_bloco (x, y, a, b):
+	"""Fecho dos (poucos) pontos de indices a, ..., b-1, pela cadeia
+	monotona"""
+	inferior = []
+	for i in range (a, b):
+		while len (inferior) >= 2 and prim.area2_idx (x, y, inferior[-2], inferior[-1], i) <= 0:
+			inferior.pop ()
+		inferior.append (i)
+	if len (inferior) == 1:
+		return (inferior, 0)
+	superior = []
+	for i in range (b - 1, a - 1, -1):
+		while len (superior) >= 2 and prim.area2_idx (x, y, superior[-2], superior[-1], i) <= 0:
+			superior.pop ()
+		superior.append (i)
+	return (inferior[:-1] + superior[:-1], len (inferior) - 1)
+
+def mergehull_idx (x, y, a, b):
+	"""Fecho dos pontos de indices a, ..., b-1 (distintos), pelo Merge
+	Hull de baixo para cima e sem desenho"""
+	fechos = [ fecho_bloco (x, y, i, min (i + BLOCO, b)) for i in range (a, b, BLOCO) ]
+	while len (fechos) > 1:
+		fechos = rodada (fechos, lambda ch1, ch2: junta_idx (x, y, ch1, ch2))
+	return fechos[0]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Merge Hull em paralelo
+
+Os pontos, ordenados por (x, y), sao divididos em uma faixa (um
+intervalo de indices, sem copiar a lista) por processo de um
+geocomp.common.parallel.Pool. Cada processo calcula o fecho da sua
+faixa com o Merge Hull sobre indices (mergehull.mergehull_idx) e
+devolve so' o vetor de indices dos vertices. O processo principal junta
+os fechos das faixas, dois a dois, com as mesmas tangentes superior e
+inferior de mergehull, na versao para indices.
+
+O numero de processos vem de config.WORKERS (opcao -j de cligeocomp.py).
+Com um so' processo, sem NumPy ou quando o algoritmo e' desenhado,
+MergehullPar simplesmente chama mergehull.Mergehull.
+"""
+
+from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common.parallel import Pool, pontos, processos
+from geocomp.common import control
+from geocomp.convexhull.mergehull import Mergehull, mergehull_idx, junta_idx, rodada
+
+
+def _fecho_faixa (a, b):
+	"""Calcula (num processo do pool) o fecho dos pontos de indices
+	a, ..., b-1; retorna o vetor de indices dos vertices e a posicao do
+	maior ponto nele"""
+	pts = pontos ()
+	tipo = np.int32 if len (pts) < 2**31 else np.int64
+	lista, maior = mergehull_idx (pts.x[a:b].tolist (), pts.y[a:b].tolist (), 0, b - a)
+	return a + np.array (lista, dtype=tipo), maior
+
+def MergehullPar (l):
+	"Merge Hull com as faixas calculadas por varios processos"
+	k = processos ()
+	if np is None or not control.skip or k <= 1:
+		return Mergehull (l)
+	return mergehull_paralelo (l, k)
+
+def mergehull_paralelo (l, k):
+	"""Merge Hull (sem desenho) com as faixas calculadas por k processos
+	(mesmo que k seja 1)"""
+	if isinstance (l, PointArray):
+		pts = l
+		ponto = l.point
+	else:
+		pts = PointArray.from_points (l)
+		ponto = l.__getitem__
+	if len (pts) == 0: return None
+
+	# ordena por (x, y), sem pontos repetidos
+	ordem = np.lexsort ((pts.y, pts.x))
+	x = pts.x[ordem]
+	y = pts.y[ordem]
+	novo = np.ones (len (ordem), dtype=bool)
+	novo[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+	ordem = ordem[novo]
+	s = pts.take (ordem)
+
+	n = len (s)
+	k = min (k, n)
+	faixas = [ (n * i // k, n * (i + 1) // k) for i in range (k) ]
+	with Pool (s, k) as pool:
+		fechos = pool.map (_fecho_faixa, faixas)
+
+	x = s.x.tolist ()
+	y = s.y.tolist ()
+	fechos = [ (f.tolist (), maior) for f, maior in fechos ]
+	while len (fechos) > 1:
+		fechos = rodada (fechos, lambda ch1, ch2: junta_idx (x, y, ch1, ch2))
+
+	lista = fechos[0][0]
+	hull = Polygon ([ ponto (int (ordem[i])) for i in lista ])
+	hull.extra_info = 'vertices: %d, processos: %d'%(len (lista), k)
+	return hull
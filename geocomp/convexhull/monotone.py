@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""Algoritmo da cadeia monotona (Andrew)"""
+
+from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.common.guiprim import *
+
+
+def Monotone (l, keep_collinear = False):
+	"""Algoritmo da cadeia monotona para achar o fecho convexo de uma lista l de pontos
+
+	Os pontos sao ordenados por x (e por y, em caso de empate) e o fecho
+	e' montado como duas cadeias que so viram a esquerda: a inferior, da
+	esquerda para a direita, e a superior, da direita para a esquerda.
+
+	Se keep_collinear for falso (o padrao, como nos outros algoritmos),
+	os pontos que estao no interior de uma aresta do fecho nao aparecem
+	na resposta; caso contrario, eles aparecem como vertices."""
+	if isinstance (l, PointArray):
+		return monotone_array (l, keep_collinear)
+
+	if len (l) == 0: return None
+
+	l = sorted (l, key=lambda p: (p.x, p.y))
+
+	# pontos repetidos
+	l2 = [ l[0] ]
+	for p in l[1:]:
+		if p.x != l2[-1].x or p.y != l2[-1].y:
+			l2.append (p)
+	l = l2
+
+	# So um ponto foi passado. Retorna um fecho c/ apenas um ponto
+	if len (l) == 1:
+		ret = Polygon (l)
+		ret.plot ()
+		ret.extra_info = 'vertices: 1'
+		return ret
+
+	inferior = cadeia (l, keep_collinear, config.COLOR_ALT1)
+	superior = cadeia (l[::-1], keep_collinear, config.COLOR_ALT4)
+
+	for pilha in (inferior, superior):
+		for i in range (0, len (pilha)-1):
+			pilha[i].remove_lineto (pilha[i+1])
+
+	if keep_collinear and len (inferior) == len (l) and len (superior) == len (l):
+		# todos os pontos sao colineares
+		fecho = inferior
+	else:
+		fecho = inferior[:-1] + superior[:-1]
+
+	poligono = Polygon (fecho)
+	poligono.plot ()
+	control.thaw_update ()
+
+	poligono.extra_info = 'vertices: %d'%len (fecho)
+	return poligono
+
+def cadeia (l, keep_collinear, cor):
+	"""Constroi a cadeia dos pontos de l (ja ordenados) que so vira a esquerda
+
+	Os lados da cadeia ficam desenhados com a cor cor"""
+	pilha = [ l[0] ]
+	for p in l[1:]:
+		p.hilight ()
+		pilha[-1].lineto (p, cor)
+		control.sleep ()
+
+		while len (pilha) >= 2 and descarta (pilha[-2], pilha[-1], p, keep_collinear):
+			pilha[-2].remove_lineto (pilha[-1])
+			pilha[-1].remove_lineto (p)
+
+			pilha.pop ()
+
+			pilha[-1].lineto (p, cor)
+			control.sleep ()
+
+		pilha.append (p)
+		p.unhilight ()
+
+	return pilha
+
+def descarta (a, b, c, keep_collinear):
+	"Verdadeiro se b nao pode ficar entre a e c numa cadeia que vira a esquerda"
+	if keep_collinear:
+		return right (a, b, c)
+	return right_on (a, b, c)
+
+
+def cadeia_array (pts, idx, keep_collinear):
+	"""Versao de cadeia para um PointArray (sem desenho)
+
+	idx e' o vetor de indices, em pts, dos pontos da cadeia, na ordem.
+	Enquanto isso elimina muitos pontos de uma vez, todos os pontos em
+	que a poligonal nao vira a esquerda sao removidos ao mesmo tempo
+	(nenhum deles pode estar na cadeia); o resto e' feito pela pilha
+	usual. Retorna o vetor de indices da cadeia."""
+	while len (idx) > 2:
+		area = prim.area2_chain (pts.take (idx))
+		if keep_collinear:
+			ruins = area < 0
+		else:
+			ruins = area <= 0
+		k = int (np.count_nonzero (ruins))
+		if k == 0:
+			return idx
+		manter = np.ones (len (idx), dtype=bool)
+		manter[1:-1] = ~ruins
+		idx = idx[manter]
+		if 8 * k < len (idx):
+			break
+
+	if keep_collinear:
+		ruim = prim.right
+	else:
+		ruim = prim.right_on
+	pilha = []
+	for i, p in zip (idx.tolist (), pts.to_points (idx)):
+		while len (pilha) >= 2 and ruim (pilha[-2][1], pilha[-1][1], p):
+			pilha.pop ()
+		pilha.append ((i, p))
+	return np.array ([i for i, p in pilha], dtype=np.intp)
+
+def monotone_array (pts, keep_collinear = False):
+	"Cadeia monotona sobre um PointArray (sem desenho)"
+	if len (pts) == 0: return None
+
+	fecho = monotone_indices (pts, keep_collinear)
+	hull = Polygon (pts.to_points (fecho))
+	hull.extra_info = 'vertices: %d'%len (fecho)
+	return hull
+
+def monotone_indices (pts, keep_collinear = False):
+	"""Vetor com os indices, em pts (um PointArray nao vazio), dos
+	vertices do fecho convexo, em sentido anti-horario"""
+	ordem = np.lexsort ((pts.y, pts.x))
+	x = pts.x[ordem]
+	y = pts.y[ordem]
+	novo = np.ones (len (ordem), dtype=bool)
+	novo[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+	ordem = ordem[novo]
+
+	if len (ordem) == 1:
+		fecho = ordem
+	else:
+		s = pts.take (ordem)
+		# a cadeia inferior so tem pontos que nao estao acima da reta
+		# entre o primeiro e o ultimo ponto, e a superior, abaixo
+		area = prim.area2_many (s.point (0), s.point (len (s) - 1), s)
+		inferior = cadeia_array (s, np.flatnonzero (area <= 0), keep_collinear)
+		superior = cadeia_array (s, np.flatnonzero (area >= 0)[::-1], keep_collinear)
+		if keep_collinear and len (inferior) == len (s) and len (superior) == len (s):
+			fecho = ordem[inferior]
+		else:
+			fecho = ordem[np.concatenate ((inferior[:-1], superior[:-1]))]
+	return fecho
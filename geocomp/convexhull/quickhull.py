@@ -3,6 +3,7 @@
 """Algoritmo Quick Hull"""
 
 from geocomp.common.polygon import Polygon
+from geocomp.common.pointarray import PointArray, extreme_index, np
 from geocomp.common import control
 from geocomp.common import prim
 from geocomp import config
@@ -53,10 +54,14 @@ def collinear (a, b, c):
 	#triang (a, b, c)
 	return ret
 
-def quickhull_rec (a, b, S):
+def quickhull_rec (a, b, S, dist):
 	"""Constroi o fecho de a ate b. 
 	
-	Todos os pontos de S estao a direita de ab
+	Todos os pontos de S estao a direita de ab, e dist[i] e'
+	area2 (b, a, S[i]). Como em quickhull_iter, o ponto c mais distante
+	de ab sai de dist e cada ponto de S e' testado uma unica vez contra
+	as duas novas arestas, de modo que as duas versoes fazem as mesmas
+	operacoes primitivas.
 	"""
 	
 	if len (S) == 0:
@@ -64,45 +69,99 @@ def quickhull_rec (a, b, S):
 		return [a]
 	
 	j = 0
-	area_j = area2 (b, a, S[j])
+	triang (a, b, S[j])
 	for i in range (1, len(S)):
-		area_i = area2 (b, a, S[i])
-		if area_i > area_j:
+		triang (a, b, S[i])
+		if dist[i] > dist[j]:
+			j = i
+		elif dist[i] == dist[j] and avanco (a, b, S[i]) > avanco (a, b, S[j]):
+			# pontos tao longe quanto c, mas antes dele, vao para S1
 			j = i
-			area_j = area_i
 	
 	c = S[j]
 
 	S1 = []
 	S2 = []
+	dist1 = []
+	dist2 = []
 
-	lado_a = left (b, c, a)
-	lado_b = left (a, c, b)
+	id1 = a.lineto (c, config.COLOR_ALT5)
+	id2 = c.lineto (b, config.COLOR_ALT5)
+	for p in S:
+		area = area2 (a, c, p)
+		if area < 0:
+			S1.append (p)
+			dist1.append (-area)
+			continue
+		area = area2 (c, b, p)
+		if area < 0:
+			S2.append (p)
+			dist2.append (-area)
+	a.remove_lineto (c, id1)
+	c.remove_lineto (b, id2)
 
-	id = a.lineto (c, config.COLOR_ALT5)
-	for i in range (0, len (S)):
-		if right (a, c, S[i]):
-			S1.append (S[i])
-	a.remove_lineto (c, id)
 	id = a.lineto (c, config.COLOR_ALT4)
-	fecho = quickhull_rec (a, c, S1)
-
+	fecho = quickhull_rec (a, c, S1, dist1)
 	a.remove_lineto (c, id)
-	id = c.lineto (b, config.COLOR_ALT5)
-	for i in range (0, len (S)):
-		if right (c, b, S[i]):
-			S2.append (S[i])
-	c.remove_lineto (b, id)
 	
 	id = c.lineto (b, config.COLOR_ALT4)
-	fecho.extend (quickhull_rec (c, b, S2))
+	fecho.extend (quickhull_rec (c, b, S2, dist2))
 	c.remove_lineto (b, id)
 
 	return fecho
 
 def Quickhull (l):
-	"Algoritmo Quick Hull para achar o fecho convexo da lista de pontos l"
+	"""Algoritmo Quick Hull para achar o fecho convexo da lista de pontos l
+
+	Se nada esta sendo desenhado, usa a versao iterativa (quickhull_iter),
+	que faz as mesmas operacoes primitivas que a recursiva (quickhull_rec);
+	com um PointArray, a versao vetorizada (quickhull_array)."""
+	if isinstance (l, PointArray):
+		return quickhull_array (l)
+	if len (l) == 0: return None
+
+	dirs = extremos (l)
+	if control.skip:
+		fecho = quickhull_iter (l, dirs)
+	else:
+		arestas = []
+		for i in range (0, len (dirs)):
+			j = (i+1) % 4
+			if dirs[i] != dirs[j]:
+				arestas.append ((l[dirs[i]], l[dirs[j]]))
 
+		# cada ponto fica com a primeira aresta do quadrilatero dos
+		# extremos que o tem a sua direita
+		ids = [ a.lineto (b, config.COLOR_ALT5) for a, b in arestas ]
+		grupos = [ [] for e in arestas ]
+		areas = [ [] for e in arestas ]
+		for p in l:
+			for g in range (len (arestas)):
+				area = area2 (arestas[g][0], arestas[g][1], p)
+				if area < 0:
+					grupos[g].append (p)
+					areas[g].append (-area)
+					break
+		for g in range (len (arestas)):
+			arestas[g][0].remove_lineto (arestas[g][1], ids[g])
+
+		fecho = []
+		for g in range (len (arestas)):
+			a, b = arestas[g]
+			id = a.lineto (b, config.COLOR_ALT4)
+			aux = quickhull_rec (a, b, grupos[g], areas[g])
+			a.remove_lineto (b, id)
+			fecho.extend (aux)
+
+	if len (l) == 1:
+		fecho = [ l[0] ]
+	hull = Polygon (fecho)
+	hull.extra_info = 'vertices: %d'%len (hull.to_list ())
+	return hull
+
+def extremos (l):
+	"""Indices dos pontos extremos de l: o mais baixo, o mais a direita,
+	o mais alto e o mais a esquerda (nessa ordem)"""
 	south = north = east = west = 0
 	# encontrando o ponto mais baixo
 	for i in range (1, len(l)):
@@ -130,29 +189,188 @@ def Quickhull (l):
 			if l[i].y > l[east].y:
 				east = i
 
+	return [ south, east, north, west ]
+
+
+def quickhull_iter (l, dirs):
+	"""Versao iterativa (sem desenho) de Quick Hull
+
+	Os indices dos pontos ficam num unico vetor, buf, e cada aresta
+	(a, b) que ainda precisa ser resolvida e' uma entrada (a, b, lo, hi)
+	de uma pilha: buf[lo:hi] sao os pontos a direita de ab. Junto com
+	cada indice fica guardado, em dist, area2 (b, a, p), calculada quando
+	p foi separado; assim o ponto c mais distante de ab sai de graca.
+
+	Para dividir buf[lo:hi] entre ac e cb, cada ponto e' testado uma
+	unica vez contra as duas novas arestas (um ponto nao pode estar a
+	direita das duas, pois estaria mais longe de ab que c), e o trecho
+	e' rearranjado no lugar: os pontos a direita de ac vao para o
+	comeco, os a direita de cb para o fim. Retorna a lista de vertices."""
+	n = len (l)
+	arestas = []
+	for i in range (0, len (dirs)):
+		j = (i+1) % 4
+		if dirs[i] != dirs[j]:
+			arestas.append ((dirs[i], dirs[j]))
+
+	# separa os pontos entre as arestas do quadrilatero dos extremos
+	grupos = [ [] for e in arestas ]
+	areas = [ [] for e in arestas ]
+	for k in range (n):
+		p = l[k]
+		for g in range (len (arestas)):
+			area = prim.area2 (l[arestas[g][0]], l[arestas[g][1]], p)
+			if area < 0:
+				grupos[g].append (k)
+				areas[g].append (-area)
+				break
+
+	buf = []
+	dist = []
+	pilha = []
+	for g in range (len (arestas)):
+		pilha.append ((arestas[g][0], arestas[g][1], len (buf), len (buf) + len (grupos[g])))
+		buf.extend (grupos[g])
+		dist.extend (areas[g])
+	pilha.reverse ()
+
+	fecho = []
+	while pilha:
+		a, b, lo, hi = pilha.pop ()
+		if lo == hi:
+			fecho.append (l[a])
+			continue
+
+		pa = l[a]
+		pb = l[b]
+		m = lo
+		for k in range (lo + 1, hi):
+			if dist[k] > dist[m]:
+				m = k
+			elif dist[k] == dist[m] and avanco (pa, pb, l[buf[k]]) > avanco (pa, pb, l[buf[m]]):
+				# pontos tao longe quanto c, mas antes dele, vao para S1
+				m = k
+		c = buf[m]
+		pc = l[c]
+
+		# buf[lo:lt] a direita de ac, buf[gt:hi] a direita de cb
+		lt = i = lo
+		gt = hi
+		while i < gt:
+			p = l[buf[i]]
+			area = prim.area2 (pa, pc, p)
+			if area < 0:
+				buf[lt], buf[i] = buf[i], buf[lt]
+				dist[i] = dist[lt]
+				dist[lt] = -area
+				lt = lt + 1
+				i = i + 1
+				continue
+			area = prim.area2 (pc, pb, p)
+			if area < 0:
+				gt = gt - 1
+				buf[gt], buf[i] = buf[i], buf[gt]
+				dist[i] = dist[gt]
+				dist[gt] = -area
+			else:
+				i = i + 1
+
+		pilha.append ((c, b, gt, hi))
+		pilha.append ((a, c, lo, lt))
+
+	return fecho
+
+def avanco (a, b, p):
+	"Produto escalar de p - a com b - a (desempate entre pontos tao distantes de ab)"
+	return (p.x - a.x) * (b.x - a.x) + (p.y - a.y) * (b.y - a.y)
+
+
+def quickhull_array_iter (pts, a, b, S, dist):
+	"""Versao vetorizada de quickhull_iter para uma aresta (a, b)
+
+	a e b sao indices em pts; S e' o vetor de indices dos pontos a
+	direita de ab e dist, o vetor com area2 (b, a, p) para cada um
+	deles. Cada divisao testa os pontos contra ac e, so os que nao
+	estao a direita de ac, contra cb. Retorna a lista de indices do
+	fecho de a ate b (sem b)."""
+	fecho = []
+	pilha = [ (a, b, S, dist) ]
+	while pilha:
+		a, b, S, dist = pilha.pop ()
+		if len (S) == 0:
+			fecho.append (a)
+			continue
+
+		pa = pts.point (a)
+		pb = pts.point (b)
+		cand = np.flatnonzero (dist == dist.max ())
+		if len (cand) > 1:
+			# pontos tao longe quanto c, mas antes dele, vao para S1
+			proj = (pts.x[S[cand]] - pa.x) * (pb.x - pa.x) + (pts.y[S[cand]] - pa.y) * (pb.y - pa.y)
+			cand = cand[proj.argmax ():proj.argmax () + 1]
+		c = int (S[cand[0]])
+		pc = pts.point (c)
+
+		area1 = prim.area2_many (pa, pc, pts.take (S))
+		d1 = area1 < 0
+		resto = np.flatnonzero (~d1)
+		area2 = prim.area2_many (pc, pb, pts.take (S[resto]))
+		d2 = area2 < 0
+
+		pilha.append ((c, b, S[resto[d2]], -area2[d2]))
+		pilha.append ((a, c, S[d1], -area1[d1]))
+	return fecho
+
+def quickhull_indices (pts):
+	"""Indices (em pts) dos vertices do fecho convexo do PointArray pts,
+	em ordem anti-horaria (sem desenho)"""
+	if len (pts) == 0: return []
+	if len (pts) == 1: return [ 0 ]
+	x, y = pts.x, pts.y
+	south = extreme_index (-y, x)
+	east = extreme_index (x, y)
+	north = extreme_index (y, x)
+	west = extreme_index (-x, y)
+
+	# cada ponto fica com a primeira aresta do quadrilatero dos
+	# extremos que o tem a sua direita
+	livres = np.arange (len (pts))
 	fecho = []
 	dirs = [ south, east, north, west ]
 	for i in range (0, len (dirs)):
 		j = (i+1) % 4
 		if dirs[i] == dirs[j]:
 			continue
-		S1 = []
-		a = l[dirs[i]]
-		b = l[dirs[j]]
-		id = a.lineto (b, config.COLOR_ALT5)
-		for p in l:
-			if right (a, b, p):
-				S1.append (p)
-		a.remove_lineto (b, id)
-		id = a.lineto (b, config.COLOR_ALT4)
-		aux = quickhull_rec (a, b, S1)
-		a.remove_lineto (b, id)
-		fecho.extend (aux)
-
+		a = dirs[i]
+		b = dirs[j]
+		area = prim.area2_many (pts.point (a), pts.point (b), pts.take (livres))
+		d = area < 0
+		fecho.extend (quickhull_array_iter (pts, a, b, livres[d], -area[d]))
+		livres = livres[~d]
+	return fecho
 
-	if len (l) == 1:
-		fecho = [ l[0] ]
-	hull = Polygon (fecho)
-	hull.extra_info = 'vertices: %d'%len (hull.to_list ())
+def quickhull_array (pts):
+	"Quick Hull sobre um PointArray (sem desenho)"
+	if len (pts) == 0: return None
+	fecho = quickhull_indices (pts)
+	hull = Polygon (pts.to_points (fecho))
+	hull.extra_info = 'vertices: %d'%len (fecho)
 	return hull
 
+def quickhull_chunks (chunks):
+	"""Fecho convexo de pontos dados em pedacos (PointArray), como os
+	pedacos de pontos devolvidos por geocomp.common.io.iter_read
+
+	So' o fecho parcial e o pedaco atual ficam na memoria: cada pedaco
+	e' juntado aos vertices do fecho anterior e o fecho e' recalculado.
+	Retorna um PointArray com os vertices do fecho, em ordem
+	anti-horaria, ou None se nao houver pontos."""
+	fecho = None
+	for pts in chunks:
+		if fecho is not None:
+			pts = PointArray (np.concatenate ((fecho.x, pts.x)),
+			                  np.concatenate ((fecho.y, pts.y)))
+		if len (pts) == 0:
+			continue
+		fecho = pts.take (quickhull_indices (pts))
+	return fecho
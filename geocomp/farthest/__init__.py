@@ -7,13 +7,32 @@ maxima
 Algoritmos disponveis:
 - Fora bruta
 - Diametro
+- Forca bruta em paralelo
+- Diametro aproximado (erro relativo de no maximo 1%)
+- Vizinho mais distante de cada ponto
+- Os k pares mais distantes
+- k centros pela amostragem do ponto mais distante
+
+Os calibres rotativos do Diametro (calipers) tambem dao a largura e os
+retangulos minimos de um poligono convexo.
 """
 from . import diameter
 from . import brute
+from . import brute_par
+from . import approx
+from . import neighbors
+from . import topk
+from . import kcenter
+from ._calipers import calipers
 
 children = [
 	[ 'diameter', 'Diameter', 'Diametro' ],
-	[ 'brute', 'Brute', 'Forca Bruta' ]
+	[ 'brute', 'Brute', 'Forca Bruta' ],
+	[ 'brute_par', 'BrutePar', 'Forca Bruta\n(paralela)' ],
+	[ 'approx', 'Approx', 'Diametro\n(aproximado)' ],
+	[ 'neighbors', 'AllFarthest', 'Vizinhos\nMais Distantes' ],
+	[ 'topk', 'TopK', 'k Pares\nMais Distantes' ],
+	[ 'kcenter', 'KCenter', 'k Centros' ]
 ]
 
 __all__ = [a[0] for a in children]
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""Calibres rotativos (rotating calipers) sobre um poligono convexo
+
+calipers (fecho) gira, todas juntas, quatro retas de suporte do
+poligono convexo fecho, a 90 graus umas das outras (os calibres 0, 1,
+2 e 3: de baixo, da direita, de cima e da esquerda, no comeco). Cada
+calibre fica encostado num vertice; a cada passo gira-se ate' que a
+aresta seguinte a um deles encoste no seu calibre (um evento), e o
+vertice desse calibre avanca. Um giro total de 90 graus basta: cada
+aresta encosta em exatamente um calibre, e os pares de calibres
+opostos (0 e 2, 1 e 3) passam juntos por todas as direcoes de 0 a 180
+graus. Entao, numa unica passada O(h), saem:
+
+- todos os pares antipodas de vertices;
+- o diametro (o par antipoda mais distante);
+- a largura (a menor distancia entre duas retas de suporte paralelas,
+  sempre entre uma aresta e o vertice oposto a ela);
+- os retangulos de menor area e de menor perimetro que contem o
+  poligono (um lado de cada um contem uma aresta do poligono).
+
+Nada e' desenhado aqui; quem usa (farthest.diameter.Diameter, por
+exemplo) desenha o que quiser com o resultado. O poligono pode ser um
+Polygon, uma lista de Point em sentido anti-horario ou, com um
+PointArray pts, uma sequencia de indices em pts (como os devolvidos
+por quickhull_indices). Ele nao pode ter vertices repetidos.
+"""
+
+import math
+
+from geocomp.common.point import Point
+from geocomp.common.polygon import Polygon
+from geocomp.common import prim
+
+
+class Calipers:
+	"""Resultado de calipers
+
+	Os vertices (e os pares) sao dados como no poligono recebido:
+	objetos Point ou indices no PointArray."""
+
+	def __init__ (self, vertices):
+		self.vertices = vertices
+		# pares antipodas (cada par aparece uma vez)
+		self.pares = []
+		# par mais distante e o quadrado da sua distancia
+		self.diametro = None
+		self.dist2 = 0
+		# largura e a faixa que a realiza: (p, q, r), com r o vertice
+		# oposto a aresta pq
+		self.largura = 0.0
+		self.faixa = None
+		# retangulos minimos: 4 Point, em sentido anti-horario
+		self.area = 0.0
+		self.retangulo_area = None
+		self.perimetro = 0.0
+		self.retangulo_perimetro = None
+
+
+def _aresta (x, y, a, k):
+	"Vetor da aresta que sai do vertice a, girado de -90 graus k vezes"
+	b = (a + 1) % len (x)
+	dx = x[b] - x[a]
+	dy = y[b] - y[a]
+	for i in range (k):
+		dx, dy = dy, -dx
+	return dx, dy
+
+def _antes (u, w):
+	"Verdadeiro se a direcao w vem antes de u (no sentido anti-horario)"
+	prim.num_area2 = prim.num_area2 + 1
+	return u[0] * w[1] - u[1] * w[0] < 0
+
+def _paralelas (u, w):
+	"Verdadeiro se as direcoes u e w sao iguais (as duas a menos de 180 graus)"
+	prim.num_area2 = prim.num_area2 + 1
+	return u[0] * w[1] - u[1] * w[0] == 0
+
+def _retangulo (x, y, a, u, dmin, dmax, alt):
+	"""Os cantos do retangulo com um lado na reta do vertice a na direcao
+	u, entre as projecoes dmin e dmax (em unidades de |u|^2) e de altura
+	alt (idem)"""
+	l2 = u[0] * u[0] + u[1] * u[1]
+	nx = -u[1] * alt / l2
+	ny = u[0] * alt / l2
+	x0 = x[a] + u[0] * dmin / l2
+	y0 = y[a] + u[1] * dmin / l2
+	x1 = x[a] + u[0] * dmax / l2
+	y1 = y[a] + u[1] * dmax / l2
+	return [ Point (x0, y0), Point (x1, y1), Point (x1 + nx, y1 + ny), Point (x0 + nx, y0 + ny) ]
+
+def calipers (fecho, pts=None):
+	"""Calibres rotativos sobre o poligono convexo fecho (em sentido
+	anti-horario); retorna um objeto Calipers"""
+	if pts is not None:
+		vertices = [ int (i) for i in fecho ]
+		x = pts.x[vertices].tolist ()
+		y = pts.y[vertices].tolist ()
+	else:
+		if isinstance (fecho, Polygon):
+			fecho = fecho.vertices ()
+		vertices = list (fecho)
+		x = [ p.x for p in vertices ]
+		y = [ p.y for p in vertices ]
+	ret = Calipers (vertices)
+	h = len (vertices)
+	if h == 0:
+		return ret
+	if h <= 2:
+		ret.diametro = (vertices[0], vertices[-1])
+		ret.dist2 = prim.dist2_idx (x, y, 0, h - 1)
+		if h == 2:
+			ret.pares = [ ret.diametro ]
+		ret.faixa = (vertices[0], vertices[-1], vertices[0])
+		ret.retangulo_area = [ Point (x[i], y[i]) for i in (0, h - 1, h - 1, 0) ]
+		ret.retangulo_perimetro = ret.retangulo_area
+		ret.perimetro = 2 * math.sqrt (ret.dist2)
+		return ret
+
+	# vertices dos calibres de baixo, da direita, de cima e da esquerda;
+	# num empate, o primeiro (em sentido anti-horario) da aresta que
+	# encosta no calibre
+	ordem = range (h)
+	c = [ min (ordem, key=lambda i: (y[i], x[i])),
+	      min (ordem, key=lambda i: (-x[i], y[i])),
+	      min (ordem, key=lambda i: (-y[i], -x[i])),
+	      min (ordem, key=lambda i: (x[i], -y[i])) ]
+	pares = [ (c[0], c[2]), (c[1], c[3]) ]
+	largura = None
+	area = None
+	perimetro = None
+	for evento in range (h):
+		# o calibre k e' o primeiro a encostar numa aresta
+		k = 0
+		u = _aresta (x, y, c[0], 0)
+		for t in range (1, 4):
+			w = _aresta (x, y, c[t], t)
+			if _antes (u, w):
+				k = t
+				u = w
+		if u[0] <= 0:
+			# o giro passaria de 90 graus
+			break
+
+		a = c[k]
+		b = (a + 1) % h
+		o = c[(k+2) % 4]
+		u = _aresta (x, y, a, 0)
+
+		# largura e retangulos com um lado sobre a aresta ab
+		alt = prim.area2_idx (x, y, a, b, o)
+		l2 = prim.dist2_idx (x, y, a, b)
+		w = alt / math.sqrt (l2)
+		if largura is None or w < largura:
+			largura = w
+			ret.faixa = (a, b, o)
+		r = c[(k+1) % 4]
+		s = c[(k+3) % 4]
+		dmax = (x[r] - x[a]) * u[0] + (y[r] - y[a]) * u[1]
+		dmin = (x[s] - x[a]) * u[0] + (y[s] - y[a]) * u[1]
+		ar = alt * (dmax - dmin) / l2
+		pr = 2 * (alt + dmax - dmin) / math.sqrt (l2)
+		if area is None or ar < area:
+			area = ar
+			ret.retangulo_area = (a, u, dmin, dmax, alt)
+		if perimetro is None or pr < perimetro:
+			perimetro = pr
+			ret.retangulo_perimetro = (a, u, dmin, dmax, alt)
+
+		# o vertice do calibre k avanca; se a aresta do calibre oposto
+		# tambem encosta agora, os quatro extremos das duas sao antipodas
+		if _paralelas (_aresta (x, y, a, k), _aresta (x, y, o, (k+2) % 4)):
+			pares.append ((a, (o + 1) % h))
+		c[k] = b
+		pares.append ((b, o))
+
+	ret.largura = largura
+	ret.area = area
+	ret.perimetro = perimetro
+	ret.faixa = tuple (vertices[i] for i in ret.faixa)
+	ret.retangulo_area = _retangulo (x, y, *ret.retangulo_area)
+	ret.retangulo_perimetro = _retangulo (x, y, *ret.retangulo_perimetro)
+
+	# o estado final de um par de calibres opostos e' o inicial do outro
+	vistos = set ()
+	mais = -1
+	for i, j in pares:
+		if (i, j) in vistos or (j, i) in vistos: continue
+		vistos.add ((i, j))
+		ret.pares.append ((vertices[i], vertices[j]))
+		d = prim.dist2_idx (x, y, i, j)
+		if d > mais:
+			mais = d
+			ret.diametro = (vertices[i], vertices[j])
+	ret.dist2 = mais
+	return ret
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""Diametro aproximado (com erro relativo de no maximo EPS)
+
+Sejam u_0, ..., u_{k-1} as direcoes de angulos 0, pi/k, ..., (k-1)pi/k.
+A direcao do par mais distante p, q faz um angulo de no maximo pi/(2k)
+com alguma delas, e a projecao de p e q nela tem comprimento pelo menos
+|pq| cos (pi/(2k)). Entao, se L e' a maior largura dos pontos nas k
+direcoes (a diferenca entre a maior e a menor projecao),
+
+	L <= diametro <= L / cos (pi/(2k)).
+
+Com k = teto (pi / (2 arccos (1/(1+EPS)))) (12 direcoes para EPS = 1%,
+O(1/sqrt (EPS)) em geral), o par mais distante entre os 2k pontos
+extremos das direcoes esta a no maximo (1+EPS) do diametro. Os pontos
+sao projetados nas k direcoes de uma so' vez (em lotes de LOTE pontos),
+e so' os extremos ficam guardados; assim approx_chunks le pedacos de
+pontos, como os de geocomp.common.io.iter_read, com memoria constante.
+
+O par devolvido e' o mais distante entre os extremos (por forca bruta);
+a cota superior do diametro, L / cos (pi/(2k)), aparece em extra_info.
+"""
+
+import math
+
+from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import control
+from geocomp.farthest.brute import brute_indices
+
+# erro relativo maximo
+EPS = 0.01
+
+# numero de pontos projetados de uma so' vez
+LOTE = 1 << 16
+
+
+def direcoes (eps):
+	"Numero de direcoes para um erro relativo de no maximo eps"
+	return max (1, int (math.ceil (math.pi / (2 * math.acos (1 / (1 + eps))))))
+
+def Approx (l, eps=None):
+	"""Diametro aproximado (erro relativo de no maximo eps, ou EPS) de
+	uma lista de Point ou de um PointArray"""
+	if isinstance (l, PointArray):
+		pts = l
+	else:
+		pts = PointArray.from_points (l)
+	if len (pts) < 2: return None
+
+	lotes = (pts.take (slice (a, a + LOTE)) for a in range (0, len (pts), LOTE))
+	i, j, ret = aproxima (lotes, eps)
+	if not isinstance (l, PointArray):
+		extra = ret.extra_info
+		ret = Segment (l[i], l[j])
+		ret.extra_info = extra
+
+	if not control.skip:
+		ret.init.hilight ()
+		ret.to.hilight ()
+		ret.init.lineto (ret.to)
+	return ret
+
+def approx_chunks (chunks, eps=None):
+	"""Diametro aproximado de pontos dados em pedacos (PointArray), como
+	os pedacos de pontos devolvidos por geocomp.common.io.iter_read"""
+	i, j, ret = aproxima (chunks, eps)
+	return ret
+
+def aproxima (chunks, eps=None):
+	"""Extremos dos pedacos de pontos chunks em k = direcoes (eps)
+	direcoes, e o par mais distante entre eles
+
+	Retorna os indices (na sequencia de todos os pontos) dos dois pontos
+	do par e o Segment entre eles (com a distancia e a cota em
+	extra_info), ou (None, None, None) se nao ha' dois pontos."""
+	if eps is None: eps = EPS
+	k = direcoes (eps)
+	ang = np.arange (k) * (math.pi / k)
+	cos = np.cos (ang)
+	sen = np.sin (ang)
+
+	# menor e maior projecao em cada direcao, e o ponto que a realiza
+	# (indice e coordenadas)
+	menor = np.full (k, np.inf)
+	maior = np.full (k, -np.inf)
+	imenor = np.zeros (k, dtype=np.int64)
+	imaior = np.zeros (k, dtype=np.int64)
+	xy = np.zeros ((2, 2 * k))
+	# as projecoes de um lote: uma linha por direcao
+	proj = np.empty ((k, LOTE))
+	rascunho = np.empty ((k, LOTE))
+	col = np.arange (k)
+	base = 0
+	for pts in chunks:
+		for a in range (0, len (pts), LOTE):
+			x = pts.x[a:a+LOTE]
+			y = pts.y[a:a+LOTE]
+			p = proj[:, :len (x)]
+			np.multiply.outer (cos, x, out=p)
+			np.add (p, np.multiply.outer (sen, y, out=rascunho[:, :len (x)]), out=p)
+			lo = p.argmin (axis=1)
+			hi = p.argmax (axis=1)
+			novo = p[col, lo] < menor
+			menor[novo] = p[col, lo][novo]
+			imenor[novo] = base + a + lo[novo]
+			xy[0, :k][novo] = x[lo[novo]]
+			xy[1, :k][novo] = y[lo[novo]]
+			novo = p[col, hi] > maior
+			maior[novo] = p[col, hi][novo]
+			imaior[novo] = base + a + hi[novo]
+			xy[0, k:][novo] = x[hi[novo]]
+			xy[1, k:][novo] = y[hi[novo]]
+		base = base + len (pts)
+	if base < 2:
+		return None, None, None
+
+	# o par mais distante entre os extremos; eles podem se repetir
+	indices = np.concatenate ((imenor, imaior))
+	indices, unicos = np.unique (indices, return_index=True)
+	if len (indices) == 1:
+		indices = np.concatenate ((indices, indices))
+		unicos = np.concatenate ((unicos, unicos))
+	cand = PointArray (xy[0, unicos], xy[1, unicos])
+	a, b = brute_indices (cand)
+	d = math.sqrt ((cand.x[a] - cand.x[b]) ** 2 + (cand.y[a] - cand.y[b]) ** 2)
+
+	# cada projecao tem erro de arredondamento de poucos ulps da maior
+	# delas; a folga cobre esse erro na cota
+	largura = (maior - menor).max ()
+	folga = 16 * np.finfo (float).eps * max (np.abs (menor).max (), np.abs (maior).max ())
+	cota = max ((largura + folga) / math.cos (math.pi / (2 * k)), d)
+
+	ret = Segment (cand.point (a), cand.point (b))
+	ret.extra_info = 'distancia: %.2f, cota: %.2f, direcoes: %d'%(d, cota, k)
+	return int (indices[a]), int (indices[b]), ret
@@ -2,15 +2,23 @@
 """Algoritmo forca-bruta"""
 
 from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray, np
 from geocomp.common import control
+from geocomp.common import prim
 from geocomp.common.guiprim import *
 import math
 
 
 def Brute (l):
 	"Algoritmo forca bruta para encontrar o par de pontos mais distante"
+	if isinstance (l, PointArray):
+		return brute_array (l)
 
 	if len (l) < 2: return None
+	if control.skip and np is not None:
+		# sem desenho: os ladrilhos de brute_array, com os pontos de l
+		a, b = brute_indices (PointArray.from_points (l))
+		return segmento (l[a], l[b])
 	
 	farthest = 0
 	a = b = None
@@ -39,3 +47,97 @@ def Brute (l):
 	ret.extra_info = 'distancia: %.2f'%math.sqrt (dist2 (a, b))
 	return ret
 
+
+# lado de um ladrilho (ver brute_array)
+LADO = 1 << 8
+
+def brute_array (pts):
+	"""Forca bruta sobre um PointArray (sem desenho)
+
+	Os indices sao divididos em faixas de LADO pontos, e as distancias
+	entre os pontos de duas faixas (um ladrilho da matriz de distancias,
+	com no maximo LADO^2 elementos) sao calculadas de uma so' vez. Cada
+	par de pontos e' comparado uma unica vez."""
+	if len (pts) < 2: return None
+	a, b = brute_indices (pts)
+	return segmento (pts.point (a), pts.point (b))
+
+def brute_indices (pts):
+	"Indices (em pts, com pelo menos dois pontos) do par mais distante"
+	d, a, b = melhor_par (pts.x, pts.y, ladrilhos (len (pts)))
+	return a, b
+
+def segmento (a, b):
+	"O Segment ab, com a distancia em extra_info"
+	ret = Segment (a, b)
+	ret.extra_info = 'distancia: %.2f'%math.sqrt (prim.dist2 (a, b))
+	return ret
+
+def ladrilhos (n):
+	"""Os ladrilhos (a0, a1, b0, b1), com a0 <= b0, que cobrem os pares
+	de indices (i, j), i < j, de n pontos"""
+	ret = []
+	for a in range (0, n, LADO):
+		a1 = min (a + LADO, n)
+		if a1 - a >= 2:
+			ret.append ((a, a1, a, a1))
+		for b in range (a1, n, LADO):
+			ret.append ((a, a1, b, min (b + LADO, n)))
+	return ret
+
+def distancias (x, y, a0, a1, b0, b1, dx=None, dy=None):
+	"""Matriz das distancias (ao quadrado) entre os pontos de indices i
+	em [a0, a1) e j em [b0, b1); as posicoes com i >= j (num ladrilho da
+	diagonal, com a0 == b0) ficam com -1
+
+	dx e dy, se dados, sao matrizes de pelo menos (a1-a0) x (b1-b0)
+	usadas como rascunho (reaproveita-las evita alocar memoria a cada
+	ladrilho); a matriz devolvida e' uma visao de dx."""
+	m = a1 - a0
+	w = b1 - b0
+	if dx is None:
+		dx = np.empty ((m, w))
+		dy = np.empty ((m, w))
+	dx = dx[:m, :w]
+	dy = dy[:m, :w]
+	np.subtract.outer (x[a0:a1], x[b0:b1], out=dx)
+	np.subtract.outer (y[a0:a1], y[b0:b1], out=dy)
+	np.multiply (dx, dx, out=dx)
+	np.multiply (dy, dy, out=dy)
+	np.add (dx, dy, out=dx)
+	if a0 == b0:
+		dx[np.tri (m, dtype=bool)] = -1
+		prim.num_dist = prim.num_dist + m * (m - 1) // 2
+	else:
+		prim.num_dist = prim.num_dist + m * w
+	return dx
+
+def ladrilho (x, y, a0, a1, b0, b1, dx=None, dy=None):
+	"""Par (i, j) mais distante, com i em [a0, a1), j em [b0, b1) e
+	i < j; retorna (distancia ao quadrado, i, j)
+
+	Se ha' empate, fica o primeiro par na ordem (i, j). dx e dy sao como
+	em distancias."""
+	d = distancias (x, y, a0, a1, b0, b1, dx, dy)
+	k = int (d.argmax ())
+	i, j = divmod (k, b1 - b0)
+	return float (d[i, j]), a0 + i, b0 + j
+
+def melhor_par (x, y, lista):
+	"""Par mais distante dos ladrilhos de lista (ver ladrilho); retorna
+	(distancia ao quadrado, i, j)"""
+	lado = max (max (a1 - a0, b1 - b0) for a0, a1, b0, b1 in lista)
+	dx = np.empty ((lado, lado))
+	dy = np.empty ((lado, lado))
+	ret = None
+	for t in lista:
+		ret = maior (ret, ladrilho (x, y, *t, dx=dx, dy=dy))
+	return ret
+
+def maior (r, s):
+	"O mais distante dos pares r e s (ou r, se s e' None, e vice-versa)"
+	if r is None: return s
+	if s is None: return r
+	if s[0] > r[0] or (s[0] == r[0] and s[1:] < r[1:]):
+		return s
+	return r
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Forca bruta em paralelo
+
+Os ladrilhos da matriz de distancias (veja brute.brute_array) sao
+divididos, em grupos consecutivos, entre os processos de um
+geocomp.common.parallel.Pool, que enxergam as coordenadas dos pontos
+numa memoria compartilhada. Cada tarefa recebe so' os intervalos de
+indices dos seus ladrilhos e devolve o par mais distante entre eles;
+o processo principal fica com o maior. As distancias calculadas pelos
+processos entram na contagem: sao exatamente n(n-1)/2.
+
+O numero de processos vem de config.WORKERS (opcao -j de cligeocomp.py).
+Com um so' processo, sem NumPy ou quando o algoritmo e' desenhado,
+BrutePar simplesmente chama brute.Brute.
+"""
+
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common.parallel import Pool, pontos, processos
+from geocomp.common import control
+from geocomp.farthest.brute import Brute, ladrilhos, melhor_par, maior, segmento
+
+
+def _melhor_grupo (grupo):
+	"Par mais distante (num processo do pool) dos ladrilhos de grupo"
+	pts = pontos ()
+	return melhor_par (pts.x, pts.y, grupo)
+
+def BrutePar (l):
+	"Forca bruta com os ladrilhos calculados por varios processos"
+	k = processos ()
+	if np is None or not control.skip or k <= 1:
+		return Brute (l)
+	return brute_paralelo (l, k)
+
+def brute_paralelo (l, k):
+	"""Forca bruta (sem desenho) com os ladrilhos calculados por k
+	processos (mesmo que k seja 1)"""
+	if isinstance (l, PointArray):
+		pts = l
+		ponto = l.point
+	else:
+		pts = PointArray.from_points (l)
+		ponto = l.__getitem__
+	n = len (pts)
+	if n < 2: return None
+
+	# alguns grupos por processo, para equilibrar a carga
+	lista = ladrilhos (n)
+	t = -(-len (lista) // (4 * k))
+	with Pool (pts, k) as pool:
+		pares = pool.map (_melhor_grupo, [ (lista[a:a+t],) for a in range (0, len (lista), t) ])
+
+	d = None
+	for par in pares:
+		d = maior (d, par)
+	ret = segmento (ponto (d[1]), ponto (d[2]))
+	ret.extra_info = ret.extra_info + ', processos: %d'%k
+	return ret
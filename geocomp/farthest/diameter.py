@@ -2,10 +2,13 @@
 "Algoritmo Diametro"
 
 from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray, as_points
 import math
 from geocomp.common import control
 from geocomp.common.guiprim import *
 from geocomp.convexhull.graham import Graham
+from geocomp.convexhull.quickhull import quickhull_chunks, quickhull_indices
+from geocomp.farthest._calipers import calipers
 
 def Diameter (l):
 	"""Algoritmo Diametro para encontrar o par de pontos mais distantes
@@ -14,7 +17,14 @@ def Diameter (l):
 	- determinar o fecho convexo dos pontos passados
 	- determinar o conjunto de pares antipodas do fecho convexo
 	- determinar o par antipoda cujos pontos estao a uma distancia maxima
-	"""
+
+	Os dois ultimos passos sao uma passada de calibres rotativos
+	(_calipers.calipers); o desenho so' e' feito depois dela, e so' se
+	ha' uma interface grafica. Sem desenho, um PointArray vai direto
+	para diameter_array."""
+	if isinstance (l, PointArray) and control.skip:
+		return diameter_array (l)
+	l = as_points (l)
 
 	if len (l) < 2: return None
 	if len (l) == 2:
@@ -28,89 +38,43 @@ def Diameter (l):
 
 	control.sleep ()
 
-	pairs = antipodes (ch)
-	cores = (config.COLOR_ALT1,)
+	cal = calipers (ch)
+	a, b = cal.diametro
 
-	#print `pairs`
+	if not control.skip:
+		for p, q in cal.pares:
+			blink (p, q)
+		for p, q in cal.pares:
+			p.hilight (config.COLOR_ALT1)
+			q.hilight (config.COLOR_ALT1)
+			p.lineto (q, config.COLOR_ALT1)
 
-	i=0
-	for p,q in pairs:
-		p.hilight (cores[i])
-		q.hilight (cores[i])
-		p.lineto (q, cores[i])
-		i = (i+1) % len (cores)
+		control.sleep ()
 
-	control.sleep ()
+		a.hilight ()
+		b.hilight ()
+		a.lineto (b)
 
-	farthest = dist2 (pairs[0][0], pairs[0][1])
-	a = pairs[0][0]
-	b = pairs[0][1]
-	hia = a.hilight ()
-	hib = b.hilight ()
-	id = a.lineto (b)
-
-	for i in range (1, len (pairs)):
-		dist = dist2 (pairs[i][0], pairs[i][1])
-		if dist > farthest:
-			control.freeze_update ()
-			a.unhilight (hia)
-			b.unhilight (hib)
-			control.plot_delete (id)
-
-			farthest = dist
-			a = pairs[i][0]
-			b = pairs[i][1]
-
-			hia = a.hilight ()
-			hib = b.hilight ()
-			id = a.lineto (b)
-			control.thaw_update ()
-	
 	ret = Segment (a, b)
-	ret.extra_info = 'distancia: %.2f'%math.sqrt (farthest)
+	ret.extra_info = 'distancia: %.2f'%math.sqrt (cal.dist2)
 	return ret
 
 def antipodes (poly):
 	"Determina os pares antipodas de um poligono convexo"
-	pairs = []
-	v = poly.to_list ()
-	n = len (v)
-	i = n - 1
-	j = 0
-
-	area      = area2 (v[i], v[ (i+1)%n ], v[j])
-	area_nova = area2 (v[i], v[ (i+1)%n ], v[ (j+1)%n ])
-	while area_nova > area:
-		j = (j + 1) % n
-		area = area_nova
-		area_nova = area2 (v[i], v[ (i+1)%n ], v[ (j+1)%n ])
-	
-	j0 = j
-
-	while j != 0:
-		i = (i + 1) % n
-		pairs.append ( (v[i], v[j]) )
-		blink (v[i], v[j])
-
-		while area2 (v[i], v[(i+1)%n], v[j]) < \
-		      area2 (v[i], v[(i+1)%n], v[(j+1)%n]):
-			j = (j + 1) % n
-			if j == 0: break
-
-			if i != j0 or j != 0:
-				pairs.append ( (v[i], v[j]) )
-				blink (v[i], v[j])
-
-		else:
-			k = (j+1)%n
-			if area2 (v[i], v[(i+1)%n], v[j]) == \
-			   area2 (v[i], v[(i+1)%n], v[k]):
-				if j != 0:
-					if i != j0 or k != 0:
-						pairs.append ( (v[i], v[k]) )
-						blink (v[i], v[k])
-
-	return pairs
+	return calipers (poly).pares
+
+def diameter_array (pts):
+	"Diametro de um PointArray (sem desenho)"
+	if len (pts) < 2: return None
+	fecho = quickhull_indices (pts)
+	if len (fecho) == 0:
+		# todos os pontos sao iguais
+		fecho = [ 0 ]
+	cal = calipers (fecho, pts)
+	i, j = cal.diametro
+	ret = Segment (pts.point (i), pts.point (j))
+	ret.extra_info = 'distancia: %.2f'%math.sqrt (cal.dist2)
+	return ret
 
 def blink (p, q):
 	p.hilight ()
@@ -119,3 +83,13 @@ def blink (p, q):
 	p.unhilight ()
 	q.unhilight ()
 
+
+def diameter_chunks (chunks):
+	"""Diametro de pontos dados em pedacos (PointArray), como os pedacos
+	de pontos devolvidos por geocomp.common.io.iter_read
+
+	O fecho convexo e' mantido enquanto os pedacos sao lidos (veja
+	quickhull_chunks), entao so' ele precisa caber na memoria."""
+	fecho = quickhull_chunks (chunks)
+	if fecho is None: return None
+	return diameter_array (fecho)
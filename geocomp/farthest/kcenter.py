@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Amostragem pelo ponto mais distante (k-centros de Gonzalez)
+
+Comecando de um ponto, escolhe-se k - 1 vezes o ponto mais distante dos
+ja' escolhidos (o que generaliza o par mais distante: o segundo ponto
+e' o mais distante do primeiro). Guarda-se, para cada ponto, o quadrado
+da distancia ao centro mais proximo; cada novo centro custa uma passada
+vetorizada que atualiza esse vetor, em lotes de LOTE pontos (ou do
+tamanho pedido), sem criar vetores temporarios do tamanho da entrada. O
+total e' O(nk).
+
+O raio de cobertura (a maior distancia de um ponto ao seu centro) fica
+a no maximo o dobro do raio otimo para k centros (Gonzalez, 1985).
+"""
+
+import math
+
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.common.guiprim import *
+
+# numero de centros, por padrao
+K = 10
+
+# numero de pontos atualizados de uma so' vez
+LOTE = 1 << 16
+
+
+class Centros:
+	"""Resultado de KCenter: indices (vetor) dos centros escolhidos, na
+	ordem, e o raio de cobertura
+
+	hilight destaca os centros."""
+
+	def __init__ (self, pontos, indices, raio):
+		self.pontos = pontos
+		self.indices = indices
+		self.raio = raio
+		self.extra_info = None
+
+	def __len__ (self):
+		return len (self.indices)
+
+	def hilight (self, color=config.COLOR_ALT1):
+		if control.skip: return
+		for i in self.indices.tolist ():
+			self.pontos[i].hilight (color)
+
+
+def KCenter (l, k=None, inicio=0, lote=None):
+	"""k (ou K) centros da lista (ou PointArray) l pela amostragem do
+	ponto mais distante, comecando do ponto de indice inicio"""
+	if k is None: k = K
+	if isinstance (l, PointArray):
+		pts = l
+	else:
+		pts = PointArray.from_points (l)
+	if len (pts) == 0: return None
+
+	indices, dist = farthest_point_sampling (pts, k, inicio, lote)
+	ret = Centros (l, indices, math.sqrt (dist.max ()))
+	ret.extra_info = 'centros: %d, raio: %.2f'%(len (indices), ret.raio)
+	return ret
+
+def farthest_point_sampling (pts, k, inicio=0, lote=None):
+	"""Ate' k centros do PointArray pts (nao vazio)
+
+	Retorna o vetor dos indices dos centros, na ordem em que foram
+	escolhidos, e o vetor com o quadrado da distancia de cada ponto ao
+	centro mais proximo. Se todos os pontos ficam a distancia 0 de
+	algum centro antes de k, a escolha para. Num empate, fica o ponto de
+	menor indice."""
+	n = len (pts)
+	if lote is None: lote = LOTE
+	k = max (1, min (k, n))
+	indices = np.empty (k, dtype=np.int64)
+	dist = np.full (n, np.inf)
+	c = inicio
+	for t in range (k):
+		indices[t] = c
+		centro = pts.point (c)
+		if not control.skip:
+			centro.hilight (config.COLOR_ALT1)
+			control.sleep ()
+		for a in range (0, n, lote):
+			d = prim.dist2_many (centro, pts.take (slice (a, a + lote)))
+			np.minimum (dist[a:a+lote], d, out=dist[a:a+lote])
+		c = int (dist.argmax ())
+		if dist[c] == 0:
+			return indices[:t+1], dist
+	return indices, dist
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Vizinho mais distante de cada ponto
+
+O ponto mais distante de qualquer ponto p e' um vertice do fecho
+convexo (o disco centrado em p que passa por ele contem todos os
+pontos). Entao basta comparar cada ponto com os h vertices do fecho
+(calculado por quickhull_indices): as distancias sao calculadas de uma
+so' vez, em blocos de no maximo TAM elementos, em O(nh) operacoes mas
+com memoria limitada. Quando h e' muito menor que n (pontos aleatorios
+num disco ou num quadrado, por exemplo), isso e' bem mais rapido que
+comparar todos os pares; mas no pior caso, com os pontos em posicao
+convexa (h = n, como em Dados/circ), sao n^2 distancias, tantas
+quanto na forca bruta.
+
+O resultado (um objeto Pares) traz os pares (i, vizinho de i), como
+indices na entrada, e as distancias ao quadrado, em vetores do NumPy.
+"""
+
+import math
+
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.common.guiprim import *
+from geocomp.convexhull.quickhull import quickhull_indices
+
+# numero maximo de distancias calculadas de uma so' vez
+TAM = 1 << 20
+
+
+class Pares:
+	"""Pares de pontos da entrada pontos: pares e' uma matriz m x 2 de
+	indices e dist2 o vetor das distancias ao quadrado
+
+	hilight desenha um segmento por par."""
+
+	def __init__ (self, pontos, pares, dist2):
+		self.pontos = pontos
+		self.pares = pares
+		self.dist2 = dist2
+		self.extra_info = None
+
+	def __len__ (self):
+		return len (self.pares)
+
+	def hilight (self, color=config.COLOR_ALT1):
+		if control.skip: return
+		for i, j in self.pares.tolist ():
+			self.pontos[i].hilight (color)
+			self.pontos[j].hilight (color)
+			self.pontos[i].lineto (self.pontos[j], color)
+
+
+def AllFarthest (l):
+	"Vizinho mais distante de cada ponto da lista (ou PointArray) l"
+	if isinstance (l, PointArray):
+		pts = l
+	else:
+		pts = PointArray.from_points (l)
+	if len (pts) < 2: return None
+
+	viz, d = farthest_neighbors (pts)
+	ret = Pares (l, np.column_stack ((np.arange (len (pts)), viz)), d)
+	ret.extra_info = 'maior distancia: %.2f, menor: %.2f' \
+	                 %(math.sqrt (d.max ()), math.sqrt (d.min ()))
+	if not control.skip:
+		ret.hilight ()
+	return ret
+
+def farthest_neighbors (pts):
+	"""Vizinho mais distante de cada ponto do PointArray pts (com pelo
+	menos dois pontos), sem desenho
+
+	Retorna o vetor dos indices dos vizinhos e o das distancias ao
+	quadrado. Num empate, fica o vertice do fecho de menor indice."""
+	n = len (pts)
+	fecho = np.sort (np.asarray (quickhull_indices (pts), dtype=np.int64))
+	if len (fecho) < 2:
+		# todos os pontos sao iguais
+		viz = np.zeros (n, dtype=np.int64)
+		viz[0] = 1
+		return viz, np.zeros (n)
+
+	hx = pts.x[fecho]
+	hy = pts.y[fecho]
+	h = len (fecho)
+	viz = np.empty (n, dtype=np.int64)
+	dist = np.empty (n)
+	lote = max (1, TAM // h)
+	for a in range (0, n, lote):
+		b = min (a + lote, n)
+		dx = np.subtract.outer (pts.x[a:b], hx)
+		dy = np.subtract.outer (pts.y[a:b], hy)
+		dx *= dx
+		dy *= dy
+		dx += dy
+		prim.num_dist = prim.num_dist + (b - a) * h
+		k = dx.argmax (axis=1)
+		viz[a:b] = fecho[k]
+		dist[a:b] = dx[np.arange (b - a), k]
+	return viz, dist
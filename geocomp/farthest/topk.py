@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Os k pares de pontos mais distantes
+
+Se f(p) e' a distancia de p ao seu vizinho mais distante (veja
+neighbors.farthest_neighbors), todo par p, q tem |pq| <= min (f(p), f(q)).
+Os pares (p, vizinho de p) dao k pares distintos (se houver tantos), e
+a k-esima maior distancia entre eles, t, e' uma cota inferior para a
+dos k pares mais distantes. Entao so' os pontos com f(p) >= t podem
+estar num desses pares: quase sempre, so' alguns pontos perto do fecho.
+
+O custo e' o de farthest_neighbors, O(nh), mais o de comparar os pares
+de candidatos. Com os pontos em posicao convexa (como em Dados/circ),
+h = n e so' farthest_neighbors ja' calcula n^2 distancias, tantas
+quanto a forca bruta.
+
+Os pares desses candidatos sao comparados em ladrilhos (como em
+brute.brute_array), e os pares a pelo menos t sao guardados num heap
+com os k melhores ate' agora; quando ele enche, o menor deles passa a
+ser o limiar, que so' cresce.
+"""
+
+import heapq
+import math
+
+from geocomp.common.pointarray import PointArray, np
+from geocomp.common import control
+from geocomp.farthest.brute import ladrilhos, distancias
+from geocomp.farthest.neighbors import Pares, farthest_neighbors
+
+# numero de pares, por padrao
+K = 10
+
+
+def TopK (l, k=None):
+	"Os k (ou K) pares mais distantes da lista (ou PointArray) l"
+	if k is None: k = K
+	if isinstance (l, PointArray):
+		pts = l
+	else:
+		pts = PointArray.from_points (l)
+	if len (pts) < 2: return None
+
+	pares, d, candidatos = top_k_pairs (pts, k)
+	ret = Pares (l, pares, d)
+	ret.extra_info = 'pares: %d, menor distancia: %.2f, candidatos: %d' \
+	                 %(len (pares), math.sqrt (d[-1]), candidatos)
+	if not control.skip:
+		ret.hilight ()
+	return ret
+
+def top_k_pairs (pts, k):
+	"""Os k pares mais distantes do PointArray pts (com pelo menos dois
+	pontos), sem desenho
+
+	Retorna a matriz k x 2 dos pares (i, j), i < j, em ordem decrescente
+	de distancia (num empate, na ordem (i, j)), o vetor das distancias
+	ao quadrado e o numero de pontos candidatos."""
+	n = len (pts)
+	k = min (k, n * (n - 1) // 2)
+	viz, f = farthest_neighbors (pts)
+
+	# cota inferior: a k-esima maior distancia entre os pares distintos
+	# (p, vizinho de p)
+	i = np.arange (n)
+	chaves = np.minimum (i, viz) * n + np.maximum (i, viz)
+	chaves, unicos = np.unique (chaves, return_index=True)
+	if len (chaves) >= k:
+		limiar = np.partition (f[unicos], len (chaves) - k)[len (chaves) - k]
+	else:
+		limiar = 0.0
+	cand = np.flatnonzero (f >= limiar)
+	x = pts.x[cand]
+	y = pts.y[cand]
+
+	# heap com os k melhores, o pior no topo: (d, -i, -j)
+	heap = []
+	lista = ladrilhos (len (cand))
+	lado = max (max (a1 - a0, b1 - b0) for a0, a1, b0, b1 in lista)
+	dx = np.empty ((lado, lado))
+	dy = np.empty ((lado, lado))
+	for a0, a1, b0, b1 in lista:
+		d = distancias (x, y, a0, a1, b0, b1, dx, dy)
+		if len (heap) == k:
+			limiar = max (limiar, heap[0][0])
+		li, lj = np.nonzero (d >= limiar)
+		if len (li) == 0: continue
+		dd = d[li, lj]
+		if len (li) > k:
+			ordem = np.lexsort ((lj, li, -dd))[:k]
+			li, lj, dd = li[ordem], lj[ordem], dd[ordem]
+		for t, u, v in zip (dd.tolist (), (a0 + li).tolist (), (b0 + lj).tolist ()):
+			item = (t, -u, -v)
+			if len (heap) < k:
+				heapq.heappush (heap, item)
+			elif item > heap[0]:
+				heapq.heapreplace (heap, item)
+
+	heap.sort (reverse=True)
+	pares = np.array ([ (cand[-u], cand[-v]) for t, u, v in heap ], dtype=np.int64).reshape (-1, 2)
+	dist = np.array ([ t for t, u, v in heap ])
+	return pares, dist, len (cand)
@@ -1,3 +1,6 @@
+import time
+
+
 class Node:
     RED = True
     BLACK = False
@@ -48,10 +51,26 @@ class NilNode(Node):
         return False
 
 class BinarySearchTree:
-    def __init__(self):
+    def __init__(self, check_invariants: bool = False, check_every: int = 1):
+        ''' Initializes an empty tree.
+            :param check_invariants: True if the red-black invariants
+                                     should be checked (in O(n), which
+                                     is only meant for debugging).
+            :param check_every: with check_invariants, the invariants
+                                are checked after every check_every-th
+                                insertion or deletion.
+
+            The number of checks and the time spent on them are kept
+            in checks and check_time (in seconds).
+        '''
         self.root = NilNode.instance()
         self.size = 0
         self.control = {}
+        self.check_invariants = check_invariants
+        self.check_every = max(1, check_every)
+        self.operations = 0
+        self.checks = 0
+        self.check_time = 0.0
 
     def __str__helper(self, node: Node, level: int = 0, indent: str = "   "):
         s = level * indent + str(node)
@@ -78,11 +97,7 @@ class BinarySearchTree:
         self.root.parent = NilNode.instance()
         self.__insert_balance(new_node)
         self.size += 1
-
-        res, err = self.is_rbt()
-        if not res:
-            print(str(self))
-            raise Exception(err)
+        self.__maybe_check()
 
     def __insert(self, act_node, new_node: Node) -> Node:
         if not act_node:
@@ -130,7 +145,7 @@ class BinarySearchTree:
         del self.control[id]
 
         if old.left and old.right:
-            new_old = self.__successor(old)
+            new_old = self.successor(old)
             old.key = new_old.key
             old.id = new_old.id
             self.control[old.id] = old
@@ -152,12 +167,47 @@ class BinarySearchTree:
                 self.__delete_balance(child)
 
         self.size -= 1
+        self.__maybe_check()
+        return old
 
+    def __maybe_check(self):
+        self.operations += 1
+        if self.check_invariants and self.operations % self.check_every == 0:
+            start = time.perf_counter()
+            try:
+                self.check()
+            finally:
+                self.checks += 1
+                self.check_time += time.perf_counter() - start
+
+    def check(self):
+        ''' Checks, in O(n), the red-black invariants, the parent
+            links and the size; raises an Exception if one fails. '''
         res, err = self.is_rbt()
+        if res:
+            res, err = self.__check_links()
         if not res:
             print(str(self))
             raise Exception(err)
-        return old
+
+    def __check_links(self) -> tuple:
+        count = 0
+        stack = [self.root] if self.root else []
+        if self.root and self.root.parent:
+            return (False, f"Root {self.root.id} has a parent")
+        while stack:
+            node = stack.pop()
+            count += 1
+            if self.control.get(node.id) is not node:
+                return (False, f"Node {node.id} is not indexed by its id")
+            for child in (node.left, node.right):
+                if child:
+                    if child.parent is not node:
+                        return (False, f"Node {child.id} has a wrong parent")
+                    stack.append(child)
+        if count != self.size or count != len(self.control):
+            return (False, f"Tree has {count} nodes but size {self.size}")
+        return (True, "")
 
     def __delete_balance(self, node):
         if self.root == node or node.is_red():
@@ -202,7 +252,9 @@ class BinarySearchTree:
             node = node.right
         return node
 
-    def __successor(self, node: Node):
+    def successor(self, node: Node):
+        ''' Returns the node that follows node in key order
+            (a NilNode if node is the maximum). '''
         if node.right:
             return self.minimum(node.right)
         parent = node.parent
@@ -210,6 +262,38 @@ class BinarySearchTree:
             node, parent = parent, parent.parent
         return parent
 
+    def predecessor(self, node: Node):
+        ''' Returns the node that precedes node in key order
+            (a NilNode if node is the minimum). '''
+        if node.left:
+            return self.maximum(node.left)
+        parent = node.parent
+        while parent and node == parent.left:
+            node, parent = parent, parent.parent
+        return parent
+
+    def floor(self, key):
+        ''' Returns the node with the greatest key <= key
+            (a NilNode if there is none). '''
+        node, best = self.root, NilNode.instance()
+        while node:
+            if key < node.key:
+                node = node.left
+            else:
+                best, node = node, node.right
+        return best
+
+    def ceiling(self, key):
+        ''' Returns the node with the smallest key >= key
+            (a NilNode if there is none). '''
+        node, best = self.root, NilNode.instance()
+        while node:
+            if node.key < key:
+                node = node.right
+            else:
+                best, node = node, node.left
+        return best
+
     def __rotate_right(self, node: Node):
         child = node.left
         node.left = child.right
@@ -3,14 +3,15 @@ import math
 from itertools import islice
 from enum import Enum
 
+from geocomp import config
 from geocomp.common import control
 from geocomp.common.segment import Segment
 from geocomp.common.vector import Vector
 from geocomp.common.ray import Ray
 from geocomp.common.point import Point
 from geocomp.common.prim import dist2
+from geocomp.common.angular import angle_ranks, distance_key
 from .binary_search_tree import BinarySearchTree
-from .heap import Heap
 from utils.type_checker import type_checked
 
 class SegmentReference:
@@ -32,9 +33,18 @@ class Event:
         self.point = point
         self.type = type
 
+class VisibleSegments(list):
+    ''' The segments visible from the origin point. When the sweep line
+        tree checks its invariants (config.BST_CHECK_EVERY > 0), the
+        number of checks and their time are reported in extra_info. '''
+    extra_info = None
+
 class SweepLine:
-    def __init__(self, origin_point: Point):
-        self.bst = BinarySearchTree()
+    def __init__(self, origin_point: Point, check_every: int = 0):
+        ''' check_every > 0 checks the tree invariants after every
+            check_every-th update (see BinarySearchTree). '''
+        self.bst = BinarySearchTree(check_invariants=check_every > 0,
+                                    check_every=check_every)
         self.ray = Ray(origin_point, Vector([1, 0]))
 
 @type_checked()
@@ -82,21 +92,6 @@ def point_visibility(data: list) -> list:
 
     visible_segments = set()
 
-    # HACK trocar a ordenação: pontos de inicio, quando empatam, vao crescente por distancia,
-    # já os finais, vao decrescente por distancia
-    @type_checked()
-    def comparison_function(e1: Event, e2: Event) -> float:
-        angle1, angle2 = angle_from_origin(origin_point, e1.point), angle_from_origin(origin_point, e2.point)
-        if abs(angle1 - angle2) < 1e-7:
-            multiplier = float(1 if e1.type == EventType.INSERT else -1)
-
-            if e1.type != e2.type:
-                return -multiplier
-
-            return round(distance_to_origin(origin_point, e1.point)
-                        - distance_to_origin(origin_point, e2.point), 7) * multiplier
-        return angle1 - angle2
-
     @type_checked()
     def counterclockwise(p1: Point, p2: Point) -> float:
         angle1, angle2 = angle_from_origin(origin_point, p1), angle_from_origin(origin_point, p2)
@@ -120,11 +115,22 @@ def point_visibility(data: list) -> list:
         control.sleep()
         segment.plot()
 
-    event_heap = Heap.from_list(event_points,
-                                cmp_function=comparison_function)
+    # Events are ordered by their angle around the origin point. Ties go
+    # to insertions first: insertions by increasing distance, deletions
+    # by decreasing distance.
+    ranks = angle_ranks(origin_point, [event.point for event in event_points])
+
+    def event_key(i: int) -> tuple:
+        event = event_points[i]
+        dx, dy = distance_key(origin_point, event.point)
+        if event.type == EventType.INSERT:
+            return (ranks[i], 0, dx, dy)
+        return (ranks[i], 1, -dx, -dy)
+
+    events = [event_points[i] for i in sorted(range(len(event_points)), key=event_key)]
 
     # STEP 2: Initialize sweep line
-    sweep_line = SweepLine(origin_point)
+    sweep_line = SweepLine(origin_point, config.BST_CHECK_EVERY)
 
     sweep_line.ray.plot('white')
 
@@ -142,8 +148,7 @@ def point_visibility(data: list) -> list:
             segment.plot()
 
     # STEP 3: Sweep line
-    while event_heap:
-        event = event_heap.pop_element()
+    for event in events:
         # 3.1: Take the minimum and put it into the set
         sweep_line.ray.hide()
         sweep_line.ray.direction = Vector.from_angle(angle_from_origin(origin_point, event.point))
@@ -179,4 +184,8 @@ def point_visibility(data: list) -> list:
 
     sweep_line.ray.hide()
     print(visible_segments)
-    return list(visible_segments)
+    result = VisibleSegments(visible_segments)
+    if sweep_line.bst.checks > 0:
+        result.extra_info = 'invariant checks: %d, check time: %.3f s' \
+                            % (sweep_line.bst.checks, sweep_line.bst.check_time)
+    return result
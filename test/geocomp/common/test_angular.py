@@ -0,0 +1,57 @@
+import random
+import unittest
+from fractions import Fraction
+
+from geocomp.common.angular import angle_ranks, sort_around
+from geocomp.common.point   import Point
+
+
+def exact_cross(o, a, b):
+    ax, ay = Fraction(a.x) - Fraction(o.x), Fraction(a.y) - Fraction(o.y)
+    bx, by = Fraction(b.x) - Fraction(o.x), Fraction(b.y) - Fraction(o.y)
+    return ax * by - ay * bx
+
+
+class TestAngular(unittest.TestCase):
+
+    def test_angleRanks_shouldMatchAreaComparisonInUpperHalfPlane(self):
+        rnd = random.Random(8)
+        pivot = Point(0, 0)
+        points = [Point(rnd.randint(-20, 20), rnd.randint(1, 20)) for _ in range(120)]
+        points += [Point(rnd.randint(1, 20), 0) for _ in range(10)]
+        ranks = angle_ranks(pivot, points)
+        for i in range(len(points)):
+            for j in range(len(points)):
+                cross = exact_cross(pivot, points[i], points[j])
+                self.assertEqual(cross > 0, ranks[i] < ranks[j], (points[i], points[j]))
+                self.assertEqual(cross == 0, ranks[i] == ranks[j], (points[i], points[j]))
+
+    def test_angleRanks_shouldOrderAllQuadrantsCounterclockwise(self):
+        pivot = Point(1.5, -2.5)
+        offsets = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+        points = [Point(pivot.x + dx, pivot.y + dy) for dx, dy in offsets]
+        self.assertEqual(list(range(8)), angle_ranks(pivot, points))
+
+    def test_angleRanks_withCollinearPoints_shouldGiveSameRank(self):
+        pivot = Point(0.0, 0.0)
+        points = [Point(5.5, 2.25), Point(11.0, 4.5), Point(2.75, 1.125), Point(0.5, 1.5), Point(1.5, 4.5)]
+        ranks = angle_ranks(pivot, points)
+        self.assertEqual(ranks[0], ranks[1])
+        self.assertEqual(ranks[0], ranks[2])
+        self.assertEqual(ranks[3], ranks[4])
+        self.assertLess(ranks[0], ranks[3])
+
+    def test_angleRanks_withNearlyCollinearFloats_shouldFollowExactFloatValues(self):
+        pivot = Point(0, 0)
+        a, b = Point(1.1, 0.3), Point(7.700000000000001, 2.1)
+        self.assertGreater(exact_cross(pivot, a, b), 0)
+        self.assertEqual([0, 1], angle_ranks(pivot, [a, b]))
+        self.assertEqual([1, 0], angle_ranks(pivot, [b, a]))
+
+    def test_sortAround_shouldBreakTiesByDistance(self):
+        pivot = Point(0, 0)
+        points = [Point(2, 2), Point(0, 0), Point(1, 0), Point(1, 1), Point(3, 0)]
+        self.assertEqual([(1, 0), (3, 0), (1, 1), (2, 2), (0, 0)],
+                         [(p.x, p.y) for p in sort_around(pivot, points)])
+        self.assertEqual([(3, 0), (1, 0), (2, 2), (1, 1), (0, 0)],
+                         [(p.x, p.y) for p in sort_around(pivot, points, farthest_first=True)])
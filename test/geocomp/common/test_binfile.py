@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from geocomp.common            import binfile
+from geocomp.common.io         import read
+from geocomp.common.pointarray import PointArray, np
+
+import test.helper.reader as reader
+
+
+class TestBinFile(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_convert_withPointsSegmentsPolygons_shouldReadSameElements(self):
+        text = "data/test/geocomp/common/io/pt_seg_poly.txt"
+        binfile.convert(text, self.filename)
+        self.assertTrue(binfile.is_binary(self.filename))
+        self.assertFalse(binfile.is_binary(text))
+        self.assertCountEqual([repr(e) for e in read(text)],
+                              [repr(e) for e in read(self.filename)])
+
+    def test_convert_withInvalidInput_shouldRaiseValueErrorWithLineNumber(self):
+        with self.assertRaisesRegex(ValueError, "line: 3"):
+            binfile.convert("data/test/geocomp/common/io/error_file.txt", self.filename)
+
+    def test_read_asArray_shouldReturnMemoryMappedPoints(self):
+        binfile.convert("data/test/geocomp/common/io/only_points.txt", self.filename)
+        points = read(self.filename, as_array=True)
+        self.assertIsInstance(points, PointArray)
+        self.assertIsInstance(points.x.base, np.memmap)
+        expected = reader.read_points("data/test/geocomp/common/io/only_points_expected.txt")
+        self.assertCountEqual(expected, points.to_points())
+
+    def test_binaryFile_shouldCreateSegmentsAndPolygonsOnAccess(self):
+        binfile.convert("data/test/geocomp/common/io/pt_seg_poly.txt", self.filename)
+        data = binfile.BinaryFile(self.filename)
+        expected_segments = reader.read_segments("data/test/geocomp/common/io/only_segments_expected.txt")
+        expected_polygons = reader.read_polygons("data/test/geocomp/common/io/only_polygons_expected.txt")
+        self.assertEqual(len(expected_segments), len(data.segments))
+        self.assertIn(data.segments[-1], expected_segments)
+        self.assertEqual(len(expected_polygons), len(data.polygons))
+        self.assertIn(data.polygons[0], expected_polygons)
+        with self.assertRaises(IndexError):
+            data.polygons[len(data.polygons)]
+
+    def test_read_withTruncatedFile_shouldRaiseValueError(self):
+        binfile.write(self.filename, points=PointArray([0, 1, 2], [3, 4, 5]))
+        with open(self.filename, "r+b") as file:
+            file.truncate(os.path.getsize(self.filename) - 8)
+        with self.assertRaises(ValueError):
+            read(self.filename)
@@ -0,0 +1,86 @@
+import unittest
+
+from geocomp.common import control
+from geocomp.common import guicontrol
+from geocomp.common import guiprim
+from geocomp.common import headless
+from geocomp.common import prim
+from geocomp.common.io import read
+from geocomp.gui import dummy
+from geocomp.convexhull import graham
+from geocomp.convexhull import gift
+from geocomp.convexhull import mergehull
+from geocomp.convexhull import quickhull
+from geocomp.farthest   import diameter
+
+
+FILES = [
+    "Dados/disc/disc-1000",
+    "dados/quad",
+]
+
+# algoritmos que devem contar as mesmas operacoes com e sem desenho
+SAME_COUNT_DRAWN = [gift.Gift, quickhull.Quickhull, mergehull.Mergehull]
+
+
+class TestHeadless(unittest.TestCase):
+
+    def setUp(self):
+        self.old_gui = guicontrol.gui
+        guicontrol.gui = dummy
+        control.set_gui(dummy)
+        prim.reset_count()
+
+    def tearDown(self):
+        guicontrol.gui = self.old_gui
+        control.set_gui(self.old_gui)
+        prim.reset_count()
+
+    def count_with_skip(self, alg, input):
+        control.set_skip(1)
+        try:
+            alg(input[:])
+        finally:
+            control.set_skip(0)
+        count = prim.get_count()
+        prim.reset_count()
+        return count
+
+    def test_runAlgorithm_shouldCountSameOperationsAsDrawingPrimitives(self):
+        for alg in [graham.Graham, quickhull.Quickhull, diameter.Diameter]:
+            for filename in FILES:
+                input = read(filename)
+                expected = self.count_with_skip(alg, input)
+                actual, _ = guicontrol.run_algorithm(alg, input)
+                self.assertEqual(expected, actual, (alg.__name__, filename))
+
+    def test_runAlgorithm_shouldCountSameOperationsDrawnAndHidden(self):
+        for alg in SAME_COUNT_DRAWN:
+            for filename in FILES + ["Dados/circ/circ-050-10000"]:
+                input = read(filename)
+                alg(input[:])
+                drawn = prim.get_count()
+                prim.reset_count()
+                hidden, _ = guicontrol.run_algorithm(alg, input)
+                self.assertEqual(drawn, hidden, (alg.__name__, filename))
+
+    def test_bind_shouldUseRawPrimitivesAndNoOpControl(self):
+        saved = headless.bind()
+        try:
+            self.assertIs(prim.area2, graham.area2)
+            self.assertIs(prim.left, quickhull.left)
+            self.assertIs(headless, quickhull.control)
+        finally:
+            headless.unbind(saved)
+        self.assertIs(guiprim.area2, graham.area2)
+        self.assertIs(control, quickhull.control)
+        self.assertIsNot(prim.left, quickhull.left)
+
+    def test_runAlgorithm_whenAlgorithmRaises_shouldRestoreBindings(self):
+        def broken(l):
+            raise RuntimeError()
+        with self.assertRaises(RuntimeError):
+            guicontrol.run_algorithm(broken, read("dados/quad"))
+        guicontrol.unhide_all()
+        self.assertIs(guiprim.left, graham.left)
+        self.assertIs(control, graham.control)
@@ -1,9 +1,10 @@
 import unittest
 
-from geocomp.common.io      import read
+from geocomp.common.io      import read, iter_read, POINTS, SEGMENTS, POLYGONS
 from geocomp.common.point   import Point
 from geocomp.common.polygon import Polygon
 from geocomp.common.segment import Segment
+from geocomp.common.pointarray import PointArray
 
 import test.helper.reader as reader
 
@@ -53,3 +54,49 @@ class TestIO(unittest.TestCase):
                 self.assertIn(e, expected_segments)
             if type(e) is Polygon:
                 self.assertIn(e, expected_polygons)
+
+    def test_read_asArray_withFileContainingOnlyPoints_shouldReturnPointArray(self):
+        expected = reader.read_points("data/test/geocomp/common/io/only_points_expected.txt")
+        actual = read("data/test/geocomp/common/io/only_points.txt", as_array=True)
+        self.assertIsInstance(actual, PointArray)
+        self.assertCountEqual(expected, actual.to_points())
+
+    def test_read_asArray_withFileContainingSegments_shouldRaiseValueError(self):
+        with self.assertRaises(ValueError):
+            read("data/test/geocomp/common/io/pt_seg_poly.txt", as_array=True)
+
+    def flatten(self, chunks):
+        elements = []
+        for kind, chunk in chunks:
+            if kind == POINTS:
+                self.assertIsInstance(chunk, PointArray)
+                elements.extend(chunk.to_points())
+            else:
+                elements.extend(chunk)
+        return elements
+
+    def test_iterRead_shouldYieldSameElementsInSameOrderAsRead(self):
+        for filename in ["data/test/geocomp/common/io/pt_seg_poly.txt",
+                         "data/test/geocomp/common/io/only_points.txt",
+                         "data/test/geocomp/common/io/only_commentaries.txt"]:
+            expected = read(filename)
+            for chunk_size in [1, 2, 3, 7, 65536]:
+                actual = self.flatten(iter_read(filename, chunk_size))
+                self.assertEqual(expected, actual, (filename, chunk_size))
+
+    def test_iterRead_shouldYieldChunksOfOneKindAndAtMostChunkSize(self):
+        kinds = {POINTS: Point, SEGMENTS: Segment, POLYGONS: Polygon}
+        for kind, chunk in iter_read("data/test/geocomp/common/io/pt_seg_poly.txt", 3):
+            self.assertTrue(0 < len(chunk) <= 3)
+            if kind != POINTS:
+                for e in chunk:
+                    self.assertIs(type(e), kinds[kind])
+
+    def test_iterRead_withFileContainingInvalidInput_shouldReportLineNumber(self):
+        for chunk_size in [1, 2, 65536]:
+            with self.assertRaisesRegex(ValueError, "line: 3:"):
+                list(iter_read("data/test/geocomp/common/io/error_file.txt", chunk_size))
+
+    def test_iterRead_withNonexistentFile_shouldRaiseFileNotFoundError(self):
+        with self.assertRaises(FileNotFoundError):
+            list(iter_read("nonexistent"))
@@ -0,0 +1,102 @@
+import unittest
+
+from geocomp.common       import control
+from geocomp.common.point import Point
+
+
+class TestPoint(unittest.TestCase):
+
+    def test_init_withOneOrFourCoordinates_shouldRaiseValueError(self):
+        with self.assertRaises(ValueError):
+            Point(1)
+        with self.assertRaises(ValueError):
+            Point(1, 2, 3, 4)
+
+    def test_point_shouldNotHaveInstanceDict(self):
+        p = Point(1, 2)
+        self.assertFalse(hasattr(p, '__dict__'))
+        with self.assertRaises(AttributeError):
+            p.lineto_id = {}
+
+    def test_dimension_shouldDependOnNumberOfCoordinates(self):
+        self.assertEqual(2, Point(1, 2).dimension)
+        self.assertEqual(3, Point(1, 2, 3).dimension)
+        self.assertEqual(0, Point(1, 2)[2])
+        self.assertEqual(3, Point(1, 2, 3).z)
+        with self.assertRaises(ValueError):
+            Point(1, 2).z
+
+    def test_repr_shouldListCoordinates(self):
+        self.assertEqual("( 1.0, 2.0 )", repr(Point(1.0, 2.0)))
+        self.assertEqual("( 1, 2, 3 )", repr(Point(1, 2, 3)))
+
+    def test_drawing_whenSkipping_shouldNotRegisterIds(self):
+        control.set_skip(1)
+        try:
+            control.clear_ids()
+            a, b = Point(0, 0), Point(1, 1)
+            a.hilight()
+            a.lineto(b)
+            self.assertEqual({}, control.hilight_ids)
+            self.assertEqual({}, control.lineto_ids)
+        finally:
+            control.set_skip(0)
+
+    def test_unhilight_withRecycledId_shouldNotDeleteOtherPointsDrawing(self):
+        deleted = []
+        old_gui = control.gui
+        control.set_gui(FakeGui(deleted))
+        control.clear_ids()
+        try:
+            a = Point(0, 0)
+            a.hilight()
+            del a
+            # em geral, b fica no lugar (e com o id()) de a
+            b = Point(1, 1)
+            b.unhilight()
+            b.remove_lineto(Point(2, 2))
+        finally:
+            control.set_gui(old_gui)
+        self.assertEqual([], deleted)
+
+    def test_unhilight_afterClearIds_shouldNotDeleteAnything(self):
+        deleted = []
+        old_gui = control.gui
+        control.set_gui(FakeGui(deleted))
+        try:
+            a, b = Point(0, 0), Point(1, 1)
+            a.hilight()
+            a.lineto(b)
+            control.clear_ids()
+            a.unhilight()
+            a.remove_lineto(b)
+            self.assertEqual([], deleted)
+            a.hilight()
+            a.lineto(b)
+            a.remove_lineto(b)
+            a.unhilight()
+            self.assertEqual({}, control.hilight_ids)
+            self.assertEqual({}, control.lineto_ids)
+        finally:
+            control.set_gui(old_gui)
+        self.assertEqual([4, 3], deleted)
+
+
+class FakeGui:
+    "Um toolkit que numera os desenhos e anota os apagados"
+
+    def __init__(self, deleted):
+        self.deleted = deleted
+        self.count = 0
+
+    def plot_disc(self, *args):
+        self.count += 1
+        return self.count
+
+    plot_segment = plot_disc
+
+    def plot_delete(self, id):
+        self.deleted.append(id)
+
+    def update(self):
+        pass
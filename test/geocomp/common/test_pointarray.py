@@ -0,0 +1,44 @@
+import unittest
+
+from geocomp.common.point      import Point
+from geocomp.common.pointarray import PointArray, as_points
+
+
+class TestPointArray(unittest.TestCase):
+
+    def test_init_withColumnsOfDifferentLengths_shouldRaiseValueError(self):
+        with self.assertRaises(ValueError):
+            PointArray([0, 1], [0])
+
+    def test_fromPoints_shouldKeepCoordinatesInOrder(self):
+        points = [Point(1.0, 2.0), Point(3.0, 4.0), Point(-1.0, 0.5)]
+        array = PointArray.from_points(points)
+        self.assertEqual(3, len(array))
+        self.assertEqual(2, array.dimension)
+        self.assertEqual(points, array.to_points())
+
+    def test_fromCoords_withThreeColumns_shouldCreate3dArray(self):
+        array = PointArray.from_coords([[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(3, array.dimension)
+        self.assertEqual(5.0, array[1].z)
+
+    def test_getitem_withInteger_shouldReturnPointView(self):
+        array = PointArray([0, 1, 2], [5, 6, 7])
+        p = array[1]
+        self.assertIs(type(p), Point)
+        self.assertIs(type(p.x), float)
+        self.assertEqual(Point(1.0, 6.0), p)
+
+    def test_getitem_withSliceOrIndices_shouldReturnPointArray(self):
+        array = PointArray([0, 1, 2], [5, 6, 7])
+        self.assertEqual([Point(1.0, 6.0), Point(2.0, 7.0)], array[1:].to_points())
+        self.assertEqual([Point(2.0, 7.0), Point(0.0, 5.0)], array[[2, 0]].to_points())
+
+    def test_bounds_shouldReturnMinAndMaxOfEachColumn(self):
+        array = PointArray([3, -1, 2], [5, 6, -7])
+        self.assertEqual((-1.0, 3.0, -7.0, 6.0), array.bounds())
+
+    def test_asPoints_withList_shouldReturnSameList(self):
+        points = [Point(0, 0)]
+        self.assertIs(points, as_points(points))
+        self.assertEqual(points, as_points(PointArray([0], [0])))
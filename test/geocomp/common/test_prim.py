@@ -2,6 +2,8 @@ import math
 import unittest
 
 import geocomp.common.prim as prim
+from geocomp.common.point      import Point
+from geocomp.common.pointarray import PointArray
 
 
 class TestPrim(unittest.TestCase):
@@ -21,3 +23,33 @@ class TestPrim(unittest.TestCase):
         self.assertEqual(math.pi, prim.ccw_angle([1, 0], [-1, 0]))
         self.assertEqual(3 * math.pi / 2, prim.ccw_angle([1, 0], [0, -1]))
 
+
+    def test_area2Many_shouldMatchArea2AndCountEachCandidate(self):
+        a, b = Point(0, 0), Point(2, 1)
+        candidates = [Point(1, 3), Point(4, 2), Point(-1, -2)]
+        prim.reset_count()
+        expected = [prim.area2(a, b, c) for c in candidates]
+        self.assertEqual(3, prim.get_count())
+
+        prim.reset_count()
+        actual = prim.area2_many(a, b, PointArray.from_points(candidates))
+        self.assertEqual(expected, actual.tolist())
+        self.assertEqual(3, prim.num_area2)
+        prim.reset_count()
+
+    def test_masks_shouldClassifyEachCandidate(self):
+        a, b = Point(0, 0), Point(1, 0)
+        pts = PointArray([0, 2, 5], [1, 0, -1])
+        self.assertEqual([True, False, False], prim.left_mask(a, b, pts).tolist())
+        self.assertEqual([True, True, False], prim.left_on_mask(a, b, pts).tolist())
+        self.assertEqual([False, False, True], prim.right_mask(a, b, pts).tolist())
+        self.assertEqual([False, True, False], prim.collinear_mask(a, b, pts).tolist())
+        prim.reset_count()
+
+    def test_dist2Many_shouldMatchDist2AndCountEachCandidate(self):
+        a = Point(1, 1)
+        pts = PointArray([1, 4, -2], [1, 5, 0])
+        prim.reset_count()
+        self.assertEqual([0, 25, 10], prim.dist2_many(a, pts).tolist())
+        self.assertEqual(3, prim.num_dist)
+        prim.reset_count()
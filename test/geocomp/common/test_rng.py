@@ -0,0 +1,29 @@
+import random
+import unittest
+
+from geocomp.common import rng
+
+
+class TestRng(unittest.TestCase):
+
+    def tearDown(self):
+        rng.set_source(None)
+
+    def test_seed_shouldRepeatTheSameSequence(self):
+        rng.seed(25)
+        first = [rng.random() for _ in range(5)]
+        rng.seed(25)
+        self.assertEqual(first, [rng.random() for _ in range(5)])
+
+    def test_setSource_shouldDrawFromTheGivenSource(self):
+        source = random.Random(3)
+        old = rng.set_source(source)
+        self.assertIs(source, rng.source())
+        expected = random.Random(3)
+        self.assertEqual(expected.random(), rng.random())
+        items = list(range(10))
+        rng.shuffle(items)
+        other = list(range(10))
+        expected.shuffle(other)
+        self.assertEqual(other, items)
+        self.assertIs(source, rng.set_source(old))
@@ -0,0 +1,268 @@
+import math
+import random
+import unittest
+
+from geocomp                   import config
+from geocomp.common            import control, prim, rng
+from geocomp.common.io         import read, iter_read
+from geocomp.common.point      import Point
+from geocomp.common.pointarray import PointArray
+from geocomp.convexhull.graham    import Graham
+from geocomp.convexhull.gift      import Gift
+from geocomp.convexhull.quickhull import Quickhull, quickhull_chunks
+from geocomp.convexhull.monotone  import Monotone
+from geocomp.convexhull.incremental import Incremental
+from geocomp.convexhull.incr_prob import IncrProb
+from geocomp.convexhull.bhatta_sen import Bhatta_Sen
+from geocomp.convexhull.chan      import Chan, tangente
+from geocomp.convexhull.chan_par  import ChanPar
+from geocomp.convexhull.mergehull import Mergehull, mergehull_idx
+from geocomp.convexhull.mergehull_par import MergehullPar
+
+
+FILES = [
+    "Dados/disc/disc-1000",
+    "Dados/circ/circ-100-10000",
+    "Dados/box/box-0128",
+    "Dados/spiral/spiral-1000-11",
+    "dados/vert",
+    "dados/quad",
+    "dados/tres",
+]
+
+
+def hull_set(polygon):
+    return set((p.x, p.y) for p in polygon.vertices())
+
+
+def on_boundary(polygon, points):
+    "Coordinates of the points lying on the boundary of the convex polygon"
+    v = polygon.vertices()
+    ret = set()
+    for p in points:
+        for i in range(len(v)):
+            a, b = v[i], v[(i + 1) % len(v)]
+            cross = (b.x - a.x) * (p.y - a.y) - (b.y - a.y) * (p.x - a.x)
+            if cross == 0 and min(a.x, b.x) <= p.x <= max(a.x, b.x) \
+               and min(a.y, b.y) <= p.y <= max(a.y, b.y):
+                ret.add((p.x, p.y))
+    return ret
+
+
+class TestConvexHull(unittest.TestCase):
+
+    def setUp(self):
+        control.set_skip(1)
+
+    def tearDown(self):
+        control.set_skip(0)
+
+    def assertSameHullAsGraham(self, algorithm, as_array):
+        for filename in FILES:
+            expected = hull_set(Graham(read(filename)))
+            if as_array:
+                actual = algorithm(read(filename, as_array=True))
+            else:
+                actual = algorithm(read(filename))
+            self.assertEqual(expected, hull_set(actual), filename)
+
+    def test_gift_withPointArray_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Gift, True)
+
+    def test_gift_withPointArrayOfGridPoints_shouldMatchGraham(self):
+        rnd = random.Random(19)
+        for size in (1, 3, 10, 1000):
+            for n in (2, 10, 60):
+                points = [Point(rnd.randint(0, size), rnd.randint(0, size)) for _ in range(n)]
+                expected = hull_set(Graham([Point(p.x, p.y) for p in points]))
+                hull = Gift(PointArray.from_points(points))
+                self.assertEqual(expected, hull_set(hull), (size, n))
+                self.assertEqual(len(expected), len(hull.vertices()), (size, n))
+
+    def test_gift_withHugeCoordinates_shouldMatchGraham(self):
+        rnd = random.Random(20)
+        for scale in (1e16, 1e20):
+            square = [Point(0, 0), Point(scale, 0), Point(scale, scale), Point(0, scale)]
+            points = square + [Point(rnd.randint(-5, 5) * scale, rnd.randint(-5, 5) * scale)
+                               for _ in range(30)]
+            for sample in (square, points):
+                expected = hull_set(Graham([Point(p.x, p.y) for p in sample]))
+                for hull in (Gift([Point(p.x, p.y) for p in sample]),
+                             Gift(PointArray.from_points(sample))):
+                    self.assertEqual(expected, hull_set(hull), scale)
+                    self.assertEqual(len(expected), len(hull.vertices()), scale)
+
+    def test_gift_withPointArrayOfEqualPoints_shouldReturnOneVertex(self):
+        hull = Gift(PointArray.from_points([Point(2, 3)] * 5))
+        self.assertEqual([(2, 3)], [(p.x, p.y) for p in hull.vertices()])
+
+    def test_quickhull_withPointArray_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Quickhull, True)
+
+    def test_quickhull_withListOfPoints_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Quickhull, False)
+
+    def test_quickhullChunks_shouldMatchGraham(self):
+        for filename in FILES:
+            expected = hull_set(Graham(read(filename)))
+            actual = quickhull_chunks(chunk for _, chunk in iter_read(filename, 100))
+            self.assertEqual(expected, set(zip(actual.x.tolist(), actual.y.tolist())), filename)
+
+    def test_monotone_withListOfPoints_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Monotone, as_array=False)
+
+    def test_monotone_withPointArray_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Monotone, as_array=True)
+
+    def test_monotone_keepingCollinear_shouldReturnEveryBoundaryPoint(self):
+        for filename in FILES:
+            points = read(filename)
+            expected = on_boundary(Graham(read(filename)), points)
+            for input in [read(filename), read(filename, as_array=True)]:
+                hull = Monotone(input, keep_collinear=True)
+                vertices = [(p.x, p.y) for p in hull.vertices()]
+                self.assertEqual(len(vertices), len(set(vertices)), filename)
+                self.assertEqual(expected, set(vertices), filename)
+
+    def test_quickhull_withCollinearPointsOnEdges_shouldReturnOnlyCorners(self):
+        square = [Point(x, y) for x in range(5) for y in range(5) if x in (0, 4) or y in (0, 4)]
+        corners = {(0, 0), (4, 0), (4, 4), (0, 4)}
+        self.assertEqual(corners, hull_set(Quickhull(square)))
+        self.assertEqual(corners, hull_set(Quickhull(PointArray.from_points(square))))
+
+    def test_incremental_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Incremental, as_array=False)
+
+    def test_incremental_withAllPointsOnHull_shouldMatchGraham(self):
+        rnd = random.Random(11)
+        points = [Point(round(1000 * math.cos(t), 3), round(1000 * math.sin(t), 3))
+                  for t in (rnd.uniform(0, 2 * math.pi) for _ in range(500))]
+        self.assertEqual(hull_set(Graham(points[:])), hull_set(Incremental(points[:])))
+
+    def test_incrProb_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(IncrProb, as_array=False)
+        self.assertSameHullAsGraham(IncrProb, as_array=True)
+
+    def test_incrProb_withGridPoints_shouldMatchGraham(self):
+        rnd = random.Random(17)
+        for size in (3, 10):
+            for n in (4, 10, 60):
+                points = [Point(rnd.randint(0, size), rnd.randint(0, size)) for _ in range(n)]
+                expected = hull_set(Graham([Point(p.x, p.y) for p in points]))
+                self.assertEqual(expected, hull_set(IncrProb(points)), (size, n))
+
+    def test_incrProb_withSameSeed_shouldRepeatTheSameOperations(self):
+        counts = []
+        for _ in range(2):
+            rng.seed(17)
+            prim.reset_count()
+            hull = IncrProb(read("Dados/disc/disc-1000"))
+            counts.append((prim.get_count(), [(p.x, p.y) for p in hull.to_list()]))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_bhattaSen_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Bhatta_Sen, as_array=False)
+        self.assertSameHullAsGraham(Bhatta_Sen, as_array=True)
+
+    def test_bhattaSen_withLowestPointAlsoRightmost_shouldKeepUpperVertices(self):
+        points = [Point(540, 773), Point(947, 439), Point(377, 804), Point(659, 701)]
+        expected = {(540, 773), (947, 439), (377, 804), (659, 701)}
+        self.assertEqual(expected, hull_set(Bhatta_Sen(points)))
+        self.assertEqual(expected, hull_set(Bhatta_Sen(PointArray.from_points(points))))
+
+    def test_bhattaSen_withGridPoints_shouldMatchGraham(self):
+        rnd = random.Random(18)
+        for size in (3, 10, 1000):
+            for n in (1, 2, 10, 60):
+                points = [Point(rnd.randint(0, size), rnd.randint(0, size)) for _ in range(n)]
+                expected = hull_set(Graham([Point(p.x, p.y) for p in points]))
+                for hull in (Bhatta_Sen([Point(p.x, p.y) for p in points]),
+                             Bhatta_Sen(PointArray.from_points(points))):
+                    self.assertEqual(expected, hull_set(hull), (size, n))
+                    self.assertEqual(len(expected), len(hull.vertices()), (size, n))
+
+    def test_chan_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Chan, as_array=False)
+
+    def test_chan_withCollinearAndRepeatedPoints_shouldMatchGraham(self):
+        rnd = random.Random(13)
+        for size in (1, 2, 5, 1000):
+            for n in (3, 20, 300):
+                points = [Point(rnd.randint(0, size), rnd.randint(0, size)) for _ in range(n)]
+                expected = hull_set(Graham([Point(p.x, p.y) for p in points]))
+                actual = Chan(points)
+                self.assertEqual(expected, hull_set(actual), (size, n))
+                self.assertEqual(len(expected), len(actual.vertices()), (size, n))
+
+    def test_chanTangent_shouldMatchBruteForce(self):
+        rnd = random.Random(14)
+        for _ in range(200):
+            size = rnd.choice((3, 10, 1000))
+            polygon = Graham([Point(rnd.randint(0, size), rnd.randint(0, size))
+                              for _ in range(30)])
+            V = polygon.vertices()
+            q = Point(rnd.randint(-size, 2 * size), rnd.randint(-size, 2 * size))
+            if on_boundary(polygon, [q]) or len(V) < 3 \
+               or all((b.x - a.x) * (q.y - a.y) - (b.y - a.y) * (q.x - a.x) > 0
+                      for a, b in zip(V, V[1:] + V[:1])):
+                continue
+            r = tangente(q, V, None)
+            for p in V:
+                cross = (r.x - q.x) * (p.y - q.y) - (r.y - q.y) * (p.x - q.x)
+                self.assertGreaterEqual(cross, 0)
+                if cross == 0:
+                    self.assertLessEqual((p.x - q.x) ** 2 + (p.y - q.y) ** 2,
+                                         (r.x - q.x) ** 2 + (r.y - q.y) ** 2)
+
+    def test_chanPar_shouldMatchGraham(self):
+        old_workers = config.WORKERS
+        config.WORKERS = 2
+        try:
+            self.assertSameHullAsGraham(ChanPar, as_array=False)
+            self.assertSameHullAsGraham(ChanPar, as_array=True)
+            self.assertIn('processos: 2', ChanPar(read("Dados/disc/disc-1000")).extra_info)
+        finally:
+            config.WORKERS = old_workers
+
+    def test_chanPar_withOneWorker_shouldRunSerialChan(self):
+        old_workers = config.WORKERS
+        config.WORKERS = 1
+        try:
+            hull = ChanPar(read("Dados/disc/disc-1000"))
+        finally:
+            config.WORKERS = old_workers
+        self.assertNotIn('processos', hull.extra_info)
+        self.assertEqual(hull_set(Graham(read("Dados/disc/disc-1000"))), hull_set(hull))
+
+    def test_mergehull_shouldMatchGraham(self):
+        self.assertSameHullAsGraham(Mergehull, as_array=False)
+
+    def test_mergehull_withRepeatedPoints_shouldReturnEachVertexOnce(self):
+        rnd = random.Random(16)
+        points = [Point(rnd.randint(0, 30), rnd.randint(0, 30)) for _ in range(3000)]
+        expected = hull_set(Graham([Point(p.x, p.y) for p in points]))
+        hull = Mergehull(points)
+        self.assertEqual(expected, hull_set(hull))
+        self.assertEqual(len(expected), len(hull.vertices()))
+
+    def test_mergehullIdx_shouldMatchGraham(self):
+        rnd = random.Random(15)
+        for size in (1, 2, 5, 1000):
+            coords = sorted(set((rnd.randint(0, size), rnd.randint(0, size)) for _ in range(300)))
+            x = [c[0] for c in coords]
+            y = [c[1] for c in coords]
+            hull, largest = mergehull_idx(x, y, 0, len(coords))
+            expected = hull_set(Graham([Point(*c) for c in coords]))
+            self.assertEqual(expected, set(coords[i] for i in hull), size)
+            self.assertEqual(len(expected), len(hull), size)
+            self.assertEqual((0, len(coords) - 1), (hull[0], hull[largest]), size)
+
+    def test_mergehullPar_shouldMatchGraham(self):
+        old_workers = config.WORKERS
+        config.WORKERS = 3
+        try:
+            self.assertSameHullAsGraham(MergehullPar, as_array=False)
+            self.assertSameHullAsGraham(MergehullPar, as_array=True)
+            self.assertIn('processos: 3', MergehullPar(read("Dados/disc/disc-1000")).extra_info)
+        finally:
+            config.WORKERS = old_workers
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from geocomp.common            import control
+from geocomp.common.io         import read
+from geocomp.common.point      import Point
+from geocomp.convexhull.graham    import Graham
+from geocomp.convexhull.dynamic   import DynamicHull, Dynamic
+
+from test.geocomp.convexhull.test_convexhull import FILES, hull_set
+
+
+def graham_set(points):
+    if len(points) == 0:
+        return set()
+    return hull_set(Graham([Point(p.x, p.y) for p in points]))
+
+
+class TestDynamicHull(unittest.TestCase):
+
+    def setUp(self):
+        control.set_skip(1)
+
+    def tearDown(self):
+        control.set_skip(0)
+
+    def assertMatchesGraham(self, hull, points, msg=None):
+        actual = set((p.x, p.y) for p in hull.vertices())
+        self.assertEqual(graham_set(points), actual, msg)
+        self.assertEqual(len(actual), len(hull.vertices()), msg)
+
+    def test_dynamic_shouldMatchGraham(self):
+        for filename in FILES:
+            self.assertEqual(hull_set(Graham(read(filename))),
+                             hull_set(Dynamic(read(filename))), filename)
+            self.assertEqual(hull_set(Graham(read(filename))),
+                             hull_set(Dynamic(read(filename, as_array=True))), filename)
+
+    def test_insertAndDelete_shouldMatchGrahamAfterEveryUpdate(self):
+        rnd = random.Random(12)
+        for size in (2, 4, 1000):
+            hull = DynamicHull()
+            points = []
+            for step in range(150):
+                if points and rnd.random() < 0.4:
+                    p = points.pop(rnd.randrange(len(points)))
+                    hull.delete(p)
+                else:
+                    p = Point(rnd.randint(0, size), rnd.randint(0, size))
+                    points.append(p)
+                    hull.insert(p)
+                self.assertEqual(len(points), len(hull))
+                self.assertMatchesGraham(hull, points, (size, step))
+
+    def test_verticesOrder_shouldBeCounterclockwise(self):
+        rnd = random.Random(13)
+        points = [Point(rnd.random(), rnd.random()) for _ in range(300)]
+        v = DynamicHull(points).vertices()
+        for i in range(len(v)):
+            a, b, c = v[i], v[(i + 1) % len(v)], v[(i + 2) % len(v)]
+            self.assertGreater((b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x), 0)
+
+    def test_deleteAll_shouldLeaveEmptyHull(self):
+        points = read("Dados/disc/disc-1000")
+        hull = DynamicHull(points)
+        self.assertMatchesGraham(hull, points)
+        for p in points:
+            hull.delete(p)
+        self.assertIsNone(hull.hull())
+        self.assertEqual(0, len(hull))
+
+    def test_delete_withDuplicates_shouldKeepPointUntilLastCopy(self):
+        a, b, c = Point(0, 0), Point(1, 0), Point(0, 1)
+        copy = Point(1, 0)
+        hull = DynamicHull([a, b, c, copy])
+        hull.delete(b)
+        self.assertEqual({(0, 0), (1, 0), (0, 1)}, hull_set(hull.hull()))
+        self.assertTrue(any(v is copy for v in hull.hull().vertices()))
+        hull.delete(copy)
+        self.assertEqual({(0, 0), (0, 1)}, hull_set(hull.hull()))
+        self.assertRaises(KeyError, hull.delete, Point(5, 5))
+
+    def test_delete_ofNewerCopy_shouldKeepOlderCopy(self):
+        a, b, c = Point(0, 0), Point(1, 0), Point(0, 1)
+        copy = Point(1, 0)
+        hull = DynamicHull([a, b, c])
+        hull.insert(copy)
+        hull.delete(copy)
+        vertices = hull.hull().vertices()
+        self.assertTrue(any(v is b for v in vertices))
+        self.assertFalse(any(v is copy for v in vertices))
+        self.assertEqual(3, len(hull))
+
+
+if __name__ == '__main__':
+    unittest.main()
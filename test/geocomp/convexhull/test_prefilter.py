@@ -0,0 +1,71 @@
+import unittest
+
+from geocomp.common            import control
+from geocomp.common            import guicontrol
+from geocomp.common.io         import read
+from geocomp.common.pointarray import PointArray
+from geocomp.convexhull           import akl_toussaint, so_fecho
+from geocomp.convexhull.graham    import Graham
+from geocomp.convexhull.dynamic   import Dynamic
+from geocomp.farthest.diameter    import Diameter
+from geocomp.farthest.brute       import Brute
+from geocomp.farthest.brute_par   import BrutePar
+from geocomp.farthest.approx      import Approx
+from geocomp.farthest.neighbors   import AllFarthest
+from geocomp.farthest.topk        import TopK
+from geocomp.farthest.kcenter     import KCenter
+from geocomp.point_visibility.point_visibility import point_visibility
+from geocomp.gui                  import dummy
+
+from test.geocomp.convexhull.test_convexhull import FILES, hull_set, on_boundary
+
+
+class TestPrefilter(unittest.TestCase):
+
+    def setUp(self):
+        control.set_skip(1)
+
+    def tearDown(self):
+        control.set_skip(0)
+
+    def test_aklToussaint_shouldKeepEveryBoundaryPoint(self):
+        for filename in FILES:
+            points = read(filename)
+            boundary = on_boundary(Graham(read(filename)), points)
+            kept, eliminated = akl_toussaint(points)
+            self.assertEqual(len(points), len(kept) + eliminated, filename)
+            self.assertLessEqual(boundary, set((p.x, p.y) for p in kept), filename)
+            self.assertEqual(hull_set(Graham(read(filename))), hull_set(Graham(kept)), filename)
+
+    def test_aklToussaint_withPointArray_shouldMatchListVersion(self):
+        for filename in FILES:
+            kept, eliminated = akl_toussaint(read(filename))
+            kept_array, eliminated_array = akl_toussaint(read(filename, as_array=True))
+            self.assertIsInstance(kept_array, PointArray)
+            self.assertEqual(eliminated, eliminated_array, filename)
+            self.assertEqual([(p.x, p.y) for p in kept],
+                             [(p.x, p.y) for p in kept_array.to_points()], filename)
+
+    def test_aklToussaint_onDisc_shouldEliminateMostPoints(self):
+        points = read("Dados/disc/disc-1000")
+        kept, eliminated = akl_toussaint(points)
+        self.assertGreater(eliminated, len(points) // 2)
+
+    def test_runAlgorithm_withPrefilter_shouldReportEliminatedPoints(self):
+        old_gui = guicontrol.gui
+        guicontrol.gui = dummy
+        control.set_gui(dummy)
+        try:
+            points = read("Dados/disc/disc-1000")
+            _, eliminated = akl_toussaint(points)
+            _, extra = guicontrol.run_algorithm(Graham, points, akl_toussaint)
+        finally:
+            guicontrol.gui = old_gui
+            control.set_gui(old_gui)
+        self.assertEqual('vertices: 33, eliminados: %d' % eliminated, extra)
+
+    def test_soFecho_shouldAcceptOnlyHullBasedAlgorithms(self):
+        for alg in (Graham, Dynamic, Diameter, Brute, BrutePar, Approx):
+            self.assertTrue(so_fecho(alg), alg.__name__)
+        for alg in (AllFarthest, TopK, KCenter, point_visibility):
+            self.assertFalse(so_fecho(alg), alg.__name__)
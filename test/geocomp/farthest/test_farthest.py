@@ -0,0 +1,244 @@
+import unittest
+
+import random
+
+from geocomp                  import config
+from geocomp.common           import control, prim
+from geocomp.common.io        import read, iter_read
+from geocomp.common.point     import Point
+from geocomp.convexhull.graham import Graham
+from geocomp.convexhull.quickhull import quickhull_indices
+from geocomp.farthest          import calipers
+from geocomp.farthest          import brute
+from geocomp.farthest.approx   import Approx, approx_chunks, direcoes
+from geocomp.farthest.brute    import Brute
+from geocomp.farthest.brute_par import BrutePar
+from geocomp.farthest.neighbors import AllFarthest
+from geocomp.farthest.topk     import TopK
+from geocomp.farthest.kcenter  import KCenter
+from geocomp.farthest.diameter import Diameter, diameter_chunks
+
+
+FILES = [
+    "Dados/box/box-0128",
+    "Dados/circ/circ-012-10000",
+    "dados/quad",
+    "dados/dois",
+]
+
+
+def endpoints(segment):
+    return frozenset(((segment.init.x, segment.init.y), (segment.to.x, segment.to.y)))
+
+
+def length2(segment):
+    return (segment.init.x - segment.to.x) ** 2 + (segment.init.y - segment.to.y) ** 2
+
+
+class TestFarthest(unittest.TestCase):
+
+    def setUp(self):
+        control.set_skip(1)
+
+    def tearDown(self):
+        control.set_skip(0)
+
+    def test_brute_withPointArray_shouldMatchListVersion(self):
+        for filename in FILES:
+            expected = Brute(read(filename))
+            actual = Brute(read(filename, as_array=True))
+            self.assertEqual(endpoints(expected), endpoints(actual), filename)
+
+    def test_diameter_shouldMatchBrute(self):
+        for filename in FILES:
+            expected = Brute(read(filename))
+            actual = Diameter(read(filename))
+            self.assertEqual(length2(expected), length2(actual), filename)
+
+    def test_diameterChunks_shouldMatchBrute(self):
+        for filename in FILES:
+            expected = Brute(read(filename))
+            actual = diameter_chunks(chunk for _, chunk in iter_read(filename, 50))
+            self.assertEqual(length2(expected), length2(actual), filename)
+
+    def test_diameter_withPointArray_shouldMatchBrute(self):
+        for filename in FILES:
+            expected = Brute(read(filename))
+            actual = Diameter(read(filename, as_array=True))
+            self.assertEqual(length2(expected), length2(actual), filename)
+
+    def test_calipers_shouldMatchEdgeByEdgeSearch(self):
+        for filename in FILES[:3]:
+            hull = Graham(read(filename)).vertices()
+            result = calipers(hull)
+            width, area, perimeter = None, None, None
+            n = len(hull)
+            for i in range(n):
+                a, b = hull[i], hull[(i + 1) % n]
+                length = ((b.x - a.x) ** 2 + (b.y - a.y) ** 2) ** 0.5
+                heights = [((b.x - a.x) * (p.y - a.y) - (b.y - a.y) * (p.x - a.x)) / length for p in hull]
+                along = [((b.x - a.x) * (p.x - a.x) + (b.y - a.y) * (p.y - a.y)) / length for p in hull]
+                h, w = max(heights), max(along) - min(along)
+                width = h if width is None else min(width, h)
+                area = h * w if area is None else min(area, h * w)
+                perimeter = 2 * (h + w) if perimeter is None else min(perimeter, 2 * (h + w))
+            self.assertAlmostEqual(width, result.largura, msg=filename)
+            self.assertAlmostEqual(area, result.area, msg=filename)
+            self.assertAlmostEqual(perimeter, result.perimetro, msg=filename)
+            self.assertEqual(4, len(result.retangulo_area))
+
+    def test_calipers_withParallelEdges_shouldReturnAllAntipodalPairs(self):
+        square = [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)]
+        result = calipers(square)
+        pairs = set(frozenset(((p.x, p.y), (q.x, q.y))) for p, q in result.pares)
+        self.assertEqual(len(pairs), len(result.pares))
+        self.assertEqual(4 + 2, len(pairs))
+        self.assertEqual(8, result.dist2)
+        self.assertEqual(2, result.largura)
+        self.assertEqual(4, result.area)
+        self.assertEqual(8, result.perimetro)
+
+    def test_calipers_withIndexHull_shouldMatchPointHull(self):
+        pts = read(FILES[1], as_array=True)
+        hull = quickhull_indices(pts)
+        expected = calipers(pts.to_points(hull))
+        actual = calipers(hull, pts)
+        self.assertEqual(expected.dist2, actual.dist2)
+        self.assertAlmostEqual(expected.largura, actual.largura)
+        self.assertEqual(len(expected.pares), len(actual.pares))
+        self.assertTrue(all(isinstance(i, int) for pair in actual.pares for i in pair))
+
+    def test_brute_withManyTiles_shouldMatchOneComparisonPerPair(self):
+        rnd = random.Random(21)
+        points = [Point(rnd.randint(0, 40), rnd.randint(0, 40)) for _ in range(300)]
+        old_side = brute.LADO
+        brute.LADO = 32
+        try:
+            prim.reset_count()
+            actual = Brute(points)
+            count = prim.num_dist
+        finally:
+            brute.LADO = old_side
+        expected = max((p.x - q.x) ** 2 + (p.y - q.y) ** 2 for p in points for q in points)
+        self.assertEqual(expected, length2(actual))
+        self.assertTrue(any(actual.init is p for p in points))
+        self.assertEqual(300 * 299 // 2 + 1, count)
+
+    def test_brutePar_shouldMatchBrute(self):
+        old_workers, old_side = config.WORKERS, brute.LADO
+        config.WORKERS, brute.LADO = 2, 64
+        try:
+            for filename in FILES:
+                expected = Brute(read(filename))
+                prim.reset_count()
+                actual = BrutePar(read(filename, as_array=True))
+                n = len(read(filename))
+                self.assertEqual(endpoints(expected), endpoints(actual), filename)
+                self.assertEqual(n * (n - 1) // 2 + 1, prim.num_dist, filename)
+                self.assertIn('processos: 2', actual.extra_info)
+        finally:
+            config.WORKERS, brute.LADO = old_workers, old_side
+
+    def test_direcoes_forOnePercent_shouldBeTwelve(self):
+        self.assertEqual(12, direcoes(0.01))
+
+    def test_approx_shouldBeWithinCertifiedBound(self):
+        for filename in FILES:
+            for eps in (0.5, 0.01):
+                exact = length2(Brute(read(filename))) ** 0.5
+                actual = Approx(read(filename), eps)
+                info = dict(item.split(': ') for item in actual.extra_info.split(', '))
+                bound = float(info['cota'])
+                self.assertLessEqual(length2(actual) ** 0.5, exact + 1e-9, filename)
+                self.assertLessEqual(exact, bound + 0.01, filename)
+                self.assertGreaterEqual(length2(actual) ** 0.5 * (1 + eps), exact, filename)
+
+    def test_approxChunks_shouldMatchApprox(self):
+        for filename in FILES:
+            expected = Approx(read(filename, as_array=True))
+            actual = approx_chunks(chunk for _, chunk in iter_read(filename, 5))
+            self.assertEqual(endpoints(expected), endpoints(actual), filename)
+            self.assertEqual(expected.extra_info, actual.extra_info, filename)
+
+    def test_allFarthest_shouldMatchBruteForce(self):
+        for filename in FILES:
+            points = read(filename)
+            result = AllFarthest(read(filename, as_array=True))
+            self.assertEqual(len(points), len(result))
+            for (i, j), d in zip(result.pares.tolist(), result.dist2.tolist()):
+                expected = max((points[i].x - q.x) ** 2 + (points[i].y - q.y) ** 2 for q in points)
+                self.assertEqual(expected, d, filename)
+                self.assertEqual(expected, (points[i].x - points[j].x) ** 2 + (points[i].y - points[j].y) ** 2)
+
+    def test_topK_shouldMatchSortedPairs(self):
+        rnd = random.Random(23)
+        points = [Point(rnd.randint(0, 50), rnd.randint(0, 50)) for _ in range(200)]
+        pairs = sorted((((p.x - q.x) ** 2 + (p.y - q.y) ** 2, i, j)
+                        for i, p in enumerate(points) for j, q in enumerate(points) if i < j),
+                       key=lambda t: (-t[0], t[1], t[2]))
+        for k in (1, 10, 150, 5000):
+            result = TopK(points, k)
+            actual = [(d, i, j) for d, (i, j) in zip(result.dist2.tolist(), result.pares.tolist())]
+            self.assertEqual(pairs[:k], actual, k)
+
+    def test_allFarthestAndTopK_whenDrawing_shouldDrawOneSegmentPerPair(self):
+        points = read("Dados/box/box-0128")
+        gui = CountingGui()
+        old_gui = control.gui
+        control.set_gui(gui)
+        control.set_skip(0)
+        try:
+            result = AllFarthest(points)
+            self.assertEqual(len(result), gui.segments)
+            gui.segments = 0
+            result = TopK(points, 5)
+            self.assertEqual(5, gui.segments)
+        finally:
+            control.set_gui(old_gui)
+
+    def test_kCenter_shouldPickFarthestPointEachTime(self):
+        points = read("Dados/box/box-0128")
+        result = KCenter(points, 8)
+        chosen = result.indices.tolist()
+        self.assertEqual(0, chosen[0])
+        for t in range(1, len(chosen)):
+            def gap(p):
+                return min((p.x - points[c].x) ** 2 + (p.y - points[c].y) ** 2 for c in chosen[:t])
+            self.assertEqual(max(gap(p) for p in points), gap(points[chosen[t]]))
+        radius2 = max(min((p.x - points[c].x) ** 2 + (p.y - points[c].y) ** 2 for c in chosen) for p in points)
+        self.assertAlmostEqual(radius2 ** 0.5, result.raio)
+
+    def test_kCenter_withChunks_shouldMatchWholeArray(self):
+        pts = read("Dados/box/box-0128", as_array=True)
+        expected = KCenter(pts, 20)
+        actual = KCenter(pts, 20, lote=7)
+        self.assertEqual(expected.indices.tolist(), actual.indices.tolist())
+        self.assertEqual(expected.raio, actual.raio)
+
+    def test_kCenter_withFewDistinctPoints_shouldStopAtZeroRadius(self):
+        points = [Point(0, 0), Point(1, 1), Point(0, 0), Point(1, 1)]
+        prim.reset_count()
+        result = KCenter(points, 3)
+        self.assertEqual([0, 1], result.indices.tolist())
+        self.assertEqual(0, result.raio)
+        self.assertEqual(2 * len(points), prim.num_dist)
+
+
+class CountingGui:
+    "Um toolkit que so' conta os segmentos desenhados"
+
+    def __init__(self):
+        self.segments = 0
+
+    def plot_disc(self, *args):
+        return 0
+
+    def plot_segment(self, *args):
+        self.segments += 1
+        return self.segments
+
+    def plot_delete(self, id):
+        pass
+
+    def update(self):
+        pass
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import random
+import unittest
+
+from geocomp.point_visibility.binary_search_tree import BinarySearchTree
+
+
+class TestBinarySearchTree(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = list(range(0, 200, 2))
+        order = self.keys[:]
+        random.Random(3).shuffle(order)
+        self.tree = BinarySearchTree(check_invariants=True)
+        for key in order:
+            self.tree.insert(key, key)
+
+    def test_floor_shouldReturnGreatestKeyLessOrEqual(self):
+        self.assertEqual(10, self.tree.floor(10).key)
+        self.assertEqual(10, self.tree.floor(11).key)
+        self.assertEqual(198, self.tree.floor(1000).key)
+        self.assertFalse(self.tree.floor(-1))
+
+    def test_ceiling_shouldReturnSmallestKeyGreaterOrEqual(self):
+        self.assertEqual(10, self.tree.ceiling(10).key)
+        self.assertEqual(12, self.tree.ceiling(11).key)
+        self.assertEqual(0, self.tree.ceiling(-5).key)
+        self.assertFalse(self.tree.ceiling(199))
+
+    def test_successorAndPredecessor_shouldWalkInKeyOrder(self):
+        node = self.tree.minimum()
+        forward = []
+        while node:
+            forward.append(node.key)
+            node = self.tree.successor(node)
+        self.assertEqual(self.keys, forward)
+
+        node = self.tree.maximum()
+        backward = []
+        while node:
+            backward.append(node.key)
+            node = self.tree.predecessor(node)
+        self.assertEqual(self.keys[::-1], backward)
+
+    def test_delete_shouldKeepOrderAndInvariants(self):
+        for key in self.keys[::3]:
+            self.tree.delete(key)
+        remaining = [k for k in self.keys if k not in self.keys[::3]]
+        node = self.tree.minimum()
+        keys = []
+        while node:
+            keys.append(node.key)
+            node = self.tree.successor(node)
+        self.assertEqual(remaining, keys)
+        self.assertTrue(self.tree.is_rbt()[0])
+
+    def test_checkEvery_shouldCheckOnlyEveryNthOperation(self):
+        self.assertEqual(len(self.keys), self.tree.checks)
+        tree = BinarySearchTree(check_invariants=True, check_every=7)
+        for key in range(50):
+            tree.insert(key, key)
+        for key in range(0, 50, 2):
+            tree.delete(key)
+        self.assertEqual(75 // 7, tree.checks)
+        self.assertGreater(tree.check_time, 0)
+
+    def test_default_shouldNotCheckInvariants(self):
+        tree = BinarySearchTree()
+        for key in range(50):
+            tree.insert(key, key)
+        self.assertEqual(0, tree.checks)
+        self.assertEqual(0, tree.check_time)
+
+    def test_check_withBrokenParentLink_shouldRaise(self):
+        node = self.tree.minimum()
+        node.parent = node
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(Exception):
+                self.tree.check()
@@ -0,0 +1,29 @@
+import unittest
+
+from geocomp        import config
+from geocomp.common import control
+from geocomp.common.io import read
+from geocomp.point_visibility.point_visibility import point_visibility
+
+
+class TestPointVisibility(unittest.TestCase):
+
+    def setUp(self):
+        control.set_skip(1)
+        self.old_check_every = config.BST_CHECK_EVERY
+
+    def tearDown(self):
+        control.set_skip(0)
+        config.BST_CHECK_EVERY = self.old_check_every
+
+    def test_pointVisibility_withoutChecks_shouldReportNoExtraInfo(self):
+        config.BST_CHECK_EVERY = 0
+        result = point_visibility(read("dados/pointvis1"))
+        self.assertEqual(5, len(result))
+        self.assertIsNone(result.extra_info)
+
+    def test_pointVisibility_withChecks_shouldReportChecksInExtraInfo(self):
+        config.BST_CHECK_EVERY = 1
+        result = point_visibility(read("dados/pointvis1"))
+        self.assertEqual(5, len(result))
+        self.assertTrue(result.extra_info.startswith('invariant checks: '))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Mede o ganho de convexhull.chan_par com o numero de processos
+
+Uso: bench_chan_par.py [n] [processos...]
+
+Roda ChanPar sobre n pontos aleatorios num disco (sem desenho) com
+cada numero de processos dado (por padrao 1, 2, 4, ... ate' o numero
+de processadores) e mostra o tempo e o ganho em relacao a um processo
+so'. A primeira linha e' o chan.Chan serial, para comparacao."""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert (0, os.path.join (os.path.dirname (os.path.abspath (__file__)), '..'))
+
+from geocomp.common import control
+from geocomp.common.pointarray import PointArray
+from geocomp.convexhull.chan import Chan
+from geocomp.convexhull.chan_par import chan_paralelo
+
+def disco (n, rnd):
+	"n pontos aleatorios no disco de raio 1"
+	x = []
+	y = []
+	for i in range (n):
+		r = math.sqrt (rnd.random ())
+		t = rnd.uniform (0, 2 * math.pi)
+		x.append (r * math.cos (t))
+		y.append (r * math.sin (t))
+	return PointArray (x, y)
+
+if __name__ == '__main__':
+	n = int (sys.argv[1]) if len (sys.argv) > 1 else 200000
+	if len (sys.argv) > 2:
+		contagens = [ int (k) for k in sys.argv[2:] ]
+	else:
+		contagens = [ 1 ]
+		while contagens[-1] * 2 <= (os.cpu_count () or 1):
+			contagens.append (contagens[-1] * 2)
+
+	control.set_skip (1)
+	pontos = disco (n, random.Random (1))
+
+	print ('%d pontos, %d processadores' % (n, os.cpu_count () or 1))
+	t = time.perf_counter ()
+	fecho = Chan (pontos)
+	t = time.perf_counter () - t
+	print ('serial:       %8.3f s                 (%s)' % (t, fecho.extra_info))
+	base = None
+	for k in contagens:
+		t = time.perf_counter ()
+		fecho = chan_paralelo (pontos, k)
+		t = time.perf_counter () - t
+		if base is None: base = t
+		print ('%3d processos: %8.3f s   ganho %5.2f   (%s)'
+		       % (k, t, base / t, fecho.extra_info))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Compara o DynamicHull com rodar Graham de novo depois de cada
+insercao ou remocao
+
+Uso: bench_dynamic.py [n] [atualizacoes] [semente]
+
+Comeca com n pontos aleatorios no quadrado unitario e faz o numero
+dado de atualizacoes (metade insercoes, metade remocoes, em ordem
+aleatoria), medindo (depois da construcao do DynamicHull) o tempo medio de cada atualizacao (seguida da
+consulta ao fecho) e o numero de chamadas de area2."""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert (0, os.path.join (os.path.dirname (os.path.abspath (__file__)), '..'))
+
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.common.point import Point
+from geocomp.convexhull.graham import Graham
+from geocomp.convexhull.dynamic import DynamicHull
+
+def atualizacoes (pontos, m, rnd):
+	"Sequencia de m pares ('insere' ou 'remove', ponto)"
+	atuais = pontos[:]
+	ret = []
+	for i in range (m):
+		if i % 2 == 0:
+			p = Point (rnd.random (), rnd.random ())
+			atuais.append (p)
+			ret.append (('insere', p))
+		else:
+			p = atuais.pop (rnd.randrange (len (atuais)))
+			ret.append (('remove', p))
+	return ret
+
+def roda_dinamico (fecho, seq):
+	for op, p in seq:
+		if op == 'insere':
+			fecho.insert (p)
+		else:
+			fecho.delete (p)
+		fecho.vertices ()
+
+def roda_graham (pontos, seq):
+	atuais = pontos[:]
+	for op, p in seq:
+		if op == 'insere':
+			atuais.append (p)
+		else:
+			atuais.remove (p)
+		Graham ([ Point (q.x, q.y) for q in atuais ])
+
+def mede (func, *args):
+	"Retorna o tempo (em segundos) e o numero de area2 de func (*args)"
+	prim.reset_count ()
+	t = time.time ()
+	func (*args)
+	t = time.time () - t
+	return t, prim.get_count ()
+
+if __name__ == '__main__':
+	n = int (sys.argv[1]) if len (sys.argv) > 1 else 10000
+	m = int (sys.argv[2]) if len (sys.argv) > 2 else 100
+	rnd = random.Random (int (sys.argv[3]) if len (sys.argv) > 3 else 1)
+
+	control.set_skip (1)
+	pontos = [ Point (rnd.random (), rnd.random ()) for i in range (n) ]
+	seq = atualizacoes (pontos, m, rnd)
+
+	print ('%d pontos, %d atualizacoes' % (n, m))
+	t, area2 = mede (DynamicHull, pontos)
+	print ('%-12s %10.3f ms (construcao) %12d area2' % ('DynamicHull', 1000 * t, area2))
+	for nome, func, arg in (('DynamicHull', roda_dinamico, DynamicHull (pontos)),
+	                        ('Graham', roda_graham, pontos)):
+		t, area2 = mede (func, arg, seq)
+		print ('%-12s %10.3f ms/atualizacao %12.1f area2/atualizacao'
+		       % (nome, 1000 * t / m, area2 / m))
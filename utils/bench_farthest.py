@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Compara farthest.neighbors e farthest.topk com a forca bruta
+
+Uso: bench_farthest.py [n] [k]
+
+Gera n pontos aleatorios num disco, num quadrado e num circulo (em
+posicao convexa, o pior caso: o fecho tem os n pontos) e calcula (sem
+desenho) o vizinho mais distante de cada ponto e os k pares mais
+distantes de dois jeitos: pelo fecho (farthest_neighbors, top_k_pairs)
+e comparando todos os pares, nos ladrilhos de farthest.brute. Mostra
+os tempos, o numero de distancias calculadas e confere se as respostas
+(as distancias) sao iguais."""
+
+import os
+import sys
+import time
+
+sys.path.insert (0, os.path.join (os.path.dirname (os.path.abspath (__file__)), '..'))
+
+from geocomp.common import control
+from geocomp.common import prim
+from geocomp.common.pointarray import PointArray, np
+from geocomp.farthest.brute import ladrilhos, distancias
+from geocomp.farthest.neighbors import farthest_neighbors
+from geocomp.farthest.topk import top_k_pairs
+
+def forca_bruta (pts, k):
+	"""Vizinho mais distante de cada ponto (so' a distancia) e as k
+	maiores distancias, comparando todos os pares"""
+	n = len (pts)
+	f = np.zeros (n)
+	maiores = np.empty (0)
+	for a0, a1, b0, b1 in ladrilhos (n):
+		d = distancias (pts.x, pts.y, a0, a1, b0, b1)
+		np.maximum (f[a0:a1], d.max (axis=1), out=f[a0:a1])
+		np.maximum (f[b0:b1], d.max (axis=0), out=f[b0:b1])
+		maiores = np.concatenate ((maiores, d[d >= 0]))
+		if len (maiores) > k:
+			maiores = np.partition (maiores, len (maiores) - k)[-k:]
+	return f, np.sort (maiores)[::-1]
+
+def pontos (nome, n, rnd):
+	"n pontos aleatorios no disco, no quadrado de lado 2 ou no circulo"
+	if nome == 'disco':
+		r = np.sqrt (rnd.uniform (0, 1, n))
+		t = rnd.uniform (0, 2 * np.pi, n)
+		return PointArray (r * np.cos (t), r * np.sin (t))
+	if nome == 'circulo':
+		t = rnd.uniform (0, 2 * np.pi, n)
+		return PointArray (np.cos (t), np.sin (t))
+	return PointArray (rnd.uniform (-1, 1, n), rnd.uniform (-1, 1, n))
+
+def mede (func, *args):
+	"Roda func (*args); retorna o resultado, o tempo e as distancias calculadas"
+	prim.reset_count ()
+	t = time.perf_counter ()
+	ret = func (*args)
+	return ret, time.perf_counter () - t, prim.num_dist
+
+if __name__ == '__main__':
+	n = int (sys.argv[1]) if len (sys.argv) > 1 else 20000
+	k = int (sys.argv[2]) if len (sys.argv) > 2 else 100
+
+	control.set_skip (1)
+	rnd = np.random.default_rng (1)
+	print ('%d pontos, k = %d' % (n, k))
+	for nome in ('disco', 'quadrado', 'circulo'):
+		pts = pontos (nome, n, rnd)
+		(f, maiores), tb, db = mede (forca_bruta, pts, k)
+		(viz, dist), tv, dv = mede (farthest_neighbors, pts)
+		(pares, d, cand), tk, dk = mede (top_k_pairs, pts, k)
+		print ('%-9s %-13s %8.3f s  %12d distancias' % (nome, 'forca bruta:', tb, db))
+		print ('%-9s %-13s %8.3f s  %12d distancias  (%s)'
+		       % ('', 'vizinhos:', tv, dv, 'ok' if np.array_equal (f, dist) else 'ERRO'))
+		print ('%-9s %-13s %8.3f s  %12d distancias  (%s, %d candidatos)'
+		       % ('', '%d pares:' % k, tk, dk, 'ok' if np.array_equal (maiores, d) else 'ERRO', cand))
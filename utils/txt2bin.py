@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+"""Converte arquivos de entrada (texto) para o formato binario lido
+por geocomp.common.io.read (veja geocomp/common/binfile.py)"""
+
+import os
+import sys
+
+sys.path.insert (0, os.path.join (os.path.dirname (os.path.abspath (__file__)), '..'))
+
+from geocomp.common import binfile
+
+if __name__ == '__main__':
+	if len (sys.argv) != 3:
+		print(sys.argv[0], '<arquivo texto> <arquivo binario>')
+		sys.exit (1)
+
+	binfile.convert (sys.argv[1], sys.argv[2])